@@ -0,0 +1,66 @@
+# benchmarks/bench_codec.py
+# Compares the legacy json.dumps(default=str) cache encoding with each installed CacheCodec
+# on an aggregated response: encode and decode time, and the bytes sent to Redis.
+#   python -m benchmarks.bench_codec [--races 2000] [--repeat 5]
+import argparse
+import json
+from typing import Any
+from typing import Callable
+from typing import Tuple
+
+from python_service.core import codec as codec_module
+from python_service.core.codec import CacheCodec
+from python_service.models import AggregatedResponse
+
+from .common import generate_races
+from .common import timed
+
+
+def aggregated_response(total_races: int) -> dict:
+    races = generate_races(total_races)
+    return AggregatedResponse(races=races, sourceInfo=[], metadata={"total_races": len(races)}).model_dump()
+
+
+def best_of(repeat: int, call: Callable[[], Any]) -> Tuple[float, Any]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        with timed() as run:
+            result = call()
+        best = min(best, run["seconds"])
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cache payload encodings.")
+    parser.add_argument("--races", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    value = aggregated_response(args.races)
+    candidates = {"legacy json": (lambda v: json.dumps(v, default=str), json.loads)}
+    formats = ["json"] + (["msgpack"] if codec_module.MSGPACK_AVAILABLE else [])
+    compressions = ["none", "zlib"] + [
+        name for name, available in (("zstd", codec_module.ZSTD_AVAILABLE), ("lz4", codec_module.LZ4_AVAILABLE))
+        if available
+    ]
+    for format in formats:
+        for compression in compressions:
+            codec = CacheCodec(format=format, compression=compression)
+            candidates[codec.name] = (codec.encode, codec.decode)
+
+    print(f"races={args.races} (default codec: {CacheCodec().name})")
+    print(f"{'codec':>16} {'encode ms':>10} {'decode ms':>10} {'bytes':>11} {'vs legacy':>10}")
+    legacy_bytes = None
+    for name, (encode, decode) in candidates.items():
+        encode_seconds, payload = best_of(args.repeat, lambda: encode(value))
+        decode_seconds, _ = best_of(args.repeat, lambda: decode(payload))
+        size = len(payload.encode() if isinstance(payload, str) else payload)
+        legacy_bytes = legacy_bytes or size
+        print(
+            f"{name:>16} {encode_seconds * 1000:>10.1f} {decode_seconds * 1000:>10.1f} {size:>11,} "
+            f"{size / legacy_bytes:>9.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
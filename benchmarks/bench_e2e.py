@@ -0,0 +1,220 @@
+# benchmarks/bench_e2e.py
+# End-to-end load test of FortunaEngine and the API against local stub sources.
+#   python -m benchmarks.bench_e2e [--targets engine api_races api_qualified] [--concurrency 1 8 32]
+#       [--requests 64] [--latency-ms 80] [--jitter-ms 40] [--error-rate 0.02] [--output results.json]
+# Results are written as JSON (to --output, or stdout) so runs can be compared across changes.
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import httpx
+import psutil
+import structlog
+
+from python_service import cache_manager as cache_module
+from python_service.adapters.at_the_races_adapter import AtTheRacesAdapter
+from python_service.adapters.gbgb_api_adapter import GbgbApiAdapter
+from python_service.adapters.the_racing_api_adapter import TheRacingApiAdapter
+from python_service.adapters.timeform_adapter import TimeformAdapter
+from python_service.config import get_settings
+from python_service.engine import FortunaEngine
+
+from .stub_sources import StubProfile
+from .stub_sources import StubSources
+
+RACE_DATE = "2025-10-09"
+
+
+def percentile(samples: List[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def build_engine(stubs: StubSources) -> FortunaEngine:
+    """A FortunaEngine whose adapters all talk to the stub sources."""
+    settings = get_settings().model_copy(
+        update={"THE_RACING_API_KEY": "benchmark", "API_KEY": "benchmark", "SNAPSHOT_PATH": None}
+    )
+    engine = FortunaEngine(config=settings, transport=stubs.transport())
+    engine.adapters = [
+        GbgbApiAdapter(config=settings),
+        TheRacingApiAdapter(config=settings),
+        TimeformAdapter(config=settings),
+        AtTheRacesAdapter(config=settings),
+    ]
+    engine.v3_adapters = []
+    return engine
+
+
+def build_api_client(engine: FortunaEngine) -> httpx.AsyncClient:
+    """An in-process client for the FastAPI app, wired to `engine` and with rate limiting off."""
+    from python_service.analyzer import AnalyzerEngine
+    from python_service.api import app
+    from python_service.api import limiter
+
+    limiter.enabled = False
+    app.state.engine = engine
+    app.state.analyzer_engine = AnalyzerEngine()
+    app.dependency_overrides[get_settings] = lambda: engine.config
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://benchmark",
+        headers={"X-API-Key": engine.config.API_KEY},
+        timeout=None,
+    )
+
+
+def make_targets(engine: FortunaEngine, api: httpx.AsyncClient) -> Dict[str, Callable[[], Awaitable[bool]]]:
+    async def _engine() -> bool:
+        result = await engine.get_races(RACE_DATE, set())
+        return bool(result["races"])
+
+    async def _api(path: str) -> bool:
+        response = await api.get(path, params={"race_date": RACE_DATE})
+        return response.status_code == 200
+
+    return {
+        "engine": _engine,
+        "api_races": lambda: _api("/api/races"),
+        "api_qualified": lambda: _api("/api/races/qualified/trifecta"),
+    }
+
+
+async def sample_rss(stop: asyncio.Event, peak: Dict[str, int]):
+    process = psutil.Process()
+    while not stop.is_set():
+        peak["rss"] = max(peak.get("rss", 0), process.memory_info().rss)
+        await asyncio.sleep(0.05)
+
+
+async def run_level(call: Callable[[], Awaitable[bool]], concurrency: int, total: int) -> Dict[str, Any]:
+    latencies, errors = [], 0
+    remaining = iter(range(total))
+
+    async def _worker():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                ok = await call()
+            except Exception:
+                ok = False
+            latencies.append(time.perf_counter() - started)
+            errors += 0 if ok else 1
+
+    stop, peak = asyncio.Event(), {}
+    sampler = asyncio.create_task(sample_rss(stop, peak))
+    started = time.perf_counter()
+    await asyncio.gather(*[_worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await sampler
+    return {
+        "requests": total,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 2),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p95": round(percentile(latencies, 95) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+            "max": round(max(latencies) * 1000, 2),
+            "mean": round(statistics.mean(latencies) * 1000, 2),
+        },
+        "peak_rss_mb": round(peak.get("rss", 0) / 2**20, 1),
+    }
+
+
+def clear_caches():
+    """Empties the in-process response caches so each level starts cold."""
+    cache_module.cache_manager.memory_cache.clear()
+
+
+async def run(args, stubs: StubSources) -> List[Dict[str, Any]]:
+    engine = build_engine(stubs)
+    api = build_api_client(engine)
+    targets = make_targets(engine, api)
+    results = []
+    try:
+        for target in args.targets:
+            for concurrency in args.concurrency:
+                clear_caches()
+                before = stubs.request_counts()
+                result = await run_level(targets[target], concurrency, args.requests)
+                after = stubs.request_counts()
+                result.update(
+                    target=target,
+                    concurrency=concurrency,
+                    upstream_requests={host: after[host] - before.get(host, 0) for host in after},
+                )
+                results.append(result)
+                print(
+                    f"{target:>14} c={concurrency:<4} {result['throughput_rps']:>8.1f} req/s  "
+                    f"p50 {result['latency_ms']['p50']:>8.1f}ms  p99 {result['latency_ms']['p99']:>8.1f}ms  "
+                    f"errors {result['errors']:<4} upstream {sum(result['upstream_requests'].values())}",
+                    file=sys.stderr,
+                )
+    finally:
+        await api.aclose()
+        await engine.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--targets", nargs="+", default=["engine", "api_races", "api_qualified"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=64, help="Requests per concurrency level.")
+    parser.add_argument("--latency-ms", type=float, default=80.0)
+    parser.add_argument("--jitter-ms", type=float, default=40.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--races", type=int, default=24, help="Races per source.")
+    parser.add_argument("--runners", type=int, default=10, help="Runners per race.")
+    parser.add_argument("--padding-kb", type=int, default=40, help="Extra markup per HTML page.")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout.")
+    args = parser.parse_args()
+    # Per-request logging would dominate the measurements.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+    logging.disable(logging.WARNING)
+
+    profile = StubProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        races=args.races,
+        runners=args.runners,
+        padding_kb=args.padding_kb,
+    )
+    with StubSources(profile) as stubs:
+        results = asyncio.run(run(args, stubs))
+
+    report = {
+        "benchmark": "e2e",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "cpu_count": psutil.cpu_count(),
+        "config": {**vars(profile), "requests_per_level": args.requests, "race_date": RACE_DATE},
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# benchmarks/bench_odds.py
+# Compares Decimal odds with the scaled-integer Odds on the hot paths: parsing scraped
+# prices, picking each runner's best price across sources, and the analyzer's scoring.
+#   python -m benchmarks.bench_odds [--runners 100000] [--sources 4]
+import argparse
+import random
+from decimal import Decimal
+from typing import Any
+from typing import Callable
+from typing import List
+
+from python_service.utils.odds import MAX_VALID_ODDS
+from python_service.utils.odds import Odds
+from python_service.utils.odds import parse_odds
+from python_service.utils.odds import parse_odds_to_decimal
+
+from .common import timed
+
+FRACTIONS = ["EVS", "4/6", "8/13", "5/4", "6/4", "15/8", "5/2", "3/1", "7/2", "9/2", "11/2", "8/1", "12/1", "20/1"]
+
+
+def best_price(runner_odds: List[List[Any]], max_valid: Any) -> List[Any]:
+    """_get_best_win_odds over every runner, as the analyzer runs it."""
+    return [min((price for price in prices if 0 < price < max_valid), default=None) for prices in runner_odds]
+
+
+def scores(best: List[Any], threshold: Any) -> float:
+    """The analyzer's threshold check and normalisation of each best price."""
+    total = 0.0
+    for price in best:
+        if price is not None and price >= threshold:
+            total += min(float(price) / 10.0, 1.0)
+    return total
+
+
+def best_of(repeat: int, call: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        with timed() as run:
+            call()
+        best = min(best, run["seconds"])
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decimal versus scaled-integer odds.")
+    parser.add_argument("--runners", type=int, default=100_000)
+    parser.add_argument("--sources", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    quoted = [[rng.choice(FRACTIONS) for _ in range(args.sources)] for _ in range(args.runners)]
+    flat = [price for prices in quoted for price in prices]
+
+    candidates = {
+        "Decimal": (parse_odds_to_decimal, Decimal("999"), Decimal("2.5")),
+        "Odds": (parse_odds, MAX_VALID_ODDS, Odds.from_decimal("2.5")),
+    }
+    print(f"runners={args.runners} sources={args.sources}")
+    print(f"{'type':>8} {'parse ms':>9} {'best ms':>8} {'score ms':>9}")
+    for name, (parse, max_valid, threshold) in candidates.items():
+        parse_seconds = best_of(args.repeat, lambda: [parse(price) for price in flat])
+        runner_odds = [[parse(price) for price in prices] for prices in quoted]
+        best_seconds = best_of(args.repeat, lambda: best_price(runner_odds, max_valid))
+        best = best_price(runner_odds, max_valid)
+        score_seconds = best_of(args.repeat, lambda: scores(best, threshold))
+        print(f"{name:>8} {parse_seconds * 1000:>9.1f} {best_seconds * 1000:>8.1f} {score_seconds * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
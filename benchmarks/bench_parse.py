@@ -0,0 +1,86 @@
+# benchmarks/bench_parse.py
+# Compares parsing racecard pages on the event loop with the adapter parse executor,
+# measuring both throughput and how long other coroutines are kept waiting.
+#   python -m benchmarks.bench_parse [--pages 200] [--runners 14] [--workers 1 2 4]
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict
+from typing import List
+
+from python_service.adapters.base import shutdown_parse_executor
+from python_service.adapters.timeform_adapter import TimeformAdapter
+from python_service.adapters.timeform_adapter import parse_race_page
+
+from .common import timed
+
+FIXTURE = "tests/fixtures/timeform_modern_sample.html"
+# Real racecard pages carry a lot of navigation and markup around the runner table.
+PAGE_CHROME = '<div class="nav"><ul>' + '<li><a href="/x">Link</a><span>text</span></li>' * 400 + "</ul></div>"
+
+
+def build_racecard_page(runners: int) -> str:
+    """Builds a Timeform racecard page from the runner fixture, with `runners` runner rows."""
+    with open(FIXTURE) as f:
+        rows = f.read().split("</div>")
+    rows = [row + "</div>" for row in rows if row.strip()]
+    body = "".join(rows[i % len(rows)].replace(f"({i % len(rows) + 1})", f"({i + 1})") for i in range(runners))
+    header = (
+        '<h1 class="rp-raceTimeCourseName_name">Ascot</h1>'
+        '<span class="rp-raceTimeCourseName_time">14:30</span>'
+        '<a class="rp-racecard-off-link" href="/r1">14:30</a>'
+    )
+    return PAGE_CHROME + header + body + PAGE_CHROME
+
+
+async def measure_lag(stop: asyncio.Event, samples: List[float], interval: float = 0.005):
+    """Records how late a coroutine sleeping `interval` seconds is woken, while parsing runs."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(time.perf_counter() - started - interval)
+
+
+async def run(workers: int, pages: List[str]) -> Dict[str, float]:
+    adapter = TimeformAdapter(config={"PARSE_WORKERS": workers})
+    if workers:
+        # Start the pool outside the measurement, as a long-running service would have.
+        await asyncio.gather(*[adapter.parse_off_loop(parse_race_page, pages[0], "2025-10-09") for _ in range(workers)])
+
+    stop, lag = asyncio.Event(), []
+    ticker = asyncio.create_task(measure_lag(stop, lag))
+    await asyncio.sleep(0.05)
+    with timed() as elapsed:
+        await asyncio.gather(*[adapter.parse_off_loop(parse_race_page, page, "2025-10-09") for page in pages])
+    stop.set()
+    await ticker
+    shutdown_parse_executor()
+    return {
+        "pages_per_second": len(pages) / elapsed["seconds"],
+        "lag_p50_ms": statistics.median(lag) * 1000,
+        "lag_max_ms": max(lag) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--runners", type=int, default=14, help="Runner rows per racecard page.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    pages = [build_racecard_page(args.runners)] * args.pages
+    print(f"{len(pages)} pages of {len(pages[0]) // 1024} KiB, {args.runners} runners each")
+    print(f"{'mode':>12} {'pages/s':>9} {'lag p50 ms':>11} {'lag max ms':>11}")
+    for workers in [0] + args.workers:
+        result = asyncio.run(run(workers, pages))
+        mode = "event loop" if workers == 0 else f"{workers} workers"
+        print(
+            f"{mode:>12} {result['pages_per_second']:>9.1f} "
+            f"{result['lag_p50_ms']:>11.2f} {result['lag_max_ms']:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
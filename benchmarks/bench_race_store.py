@@ -0,0 +1,66 @@
+# benchmarks/bench_race_store.py
+# Builds a RaceStore from a day of merged races and compares a day-wide query (each race's
+# active field size and favourite's best win price) walked runner by runner over records
+# with the same query over the store's columns.
+#   python -m benchmarks.bench_race_store [--sizes 1000 10000 50000]
+import argparse
+from typing import List
+from typing import Tuple
+
+import numpy as np
+
+from python_service.merge import RaceMergeIndex
+from python_service.race_store import RaceStore
+from python_service.records import RaceRecord
+
+from .common import generate_races
+from .common import timed
+
+
+def walk_records(races: List[RaceRecord]) -> List[Tuple[int, float]]:
+    results = []
+    for race in races:
+        active = [runner for runner in race.runners if not runner.scratched]
+        prices = [float(odds.win) for runner in active for odds in runner.odds.values() if odds.win is not None]
+        results.append((len(active), min(prices) if prices else float("nan")))
+    return results
+
+
+def query_store(store: RaceStore) -> Tuple[np.ndarray, np.ndarray]:
+    best = np.fmin.reduce(store.win, axis=1, initial=np.inf)
+    best[store.scratched] = np.inf
+    favourites = np.full(store.race_count, np.inf)
+    np.minimum.at(favourites, store.runner_races, best)
+    favourites[np.isinf(favourites)] = np.nan
+    return store.field_sizes, favourites
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar race store against nested records.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    print(f"{'records':>8} {'races':>6} {'build ms':>9} {'back ms':>8} {'walk ms':>8} {'query ms':>9} {'speedup':>8}")
+    for size in args.sizes:
+        index = RaceMergeIndex()
+        for race in generate_races(size, as_records=True):
+            index.add(race)
+        races = index.races()
+        with timed() as build:
+            store = RaceStore.from_records(races)
+        with timed() as back:
+            store.to_records()
+        with timed() as walk:
+            expected = walk_records(races)
+        with timed() as query:
+            field_sizes, favourites = query_store(store)
+        assert field_sizes.tolist() == [fields for fields, _ in expected]
+        np.testing.assert_allclose(favourites, [price for _, price in expected])
+        print(
+            f"{size:>8} {store.race_count:>6} {build['seconds'] * 1000:>9.1f} {back['seconds'] * 1000:>8.1f} "
+            f"{walk['seconds'] * 1000:>8.1f} {query['seconds'] * 1000:>9.2f} {walk['seconds'] / query['seconds']:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
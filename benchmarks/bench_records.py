@@ -0,0 +1,96 @@
+# benchmarks/bench_records.py
+# Compares validated pydantic models with RaceRecords as the internal race representation:
+# allocations and memory to hold the races, build time, and one aggregation cycle
+# (source cache round trip, merge, response build).
+#   python -m benchmarks.bench_records [--sizes 1000 10000]
+import argparse
+import gc
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from python_service.merge import RaceMergeIndex
+from python_service.models import AggregatedResponse
+from python_service.models import Race
+from python_service.records import RaceRecord
+
+from .common import generate_races
+from .common import timed
+
+
+def measure_build(build: Callable[[], List[Any]]) -> Tuple[List[Any], float, int, int]:
+    """Builds the races under tracemalloc: (races, seconds, live allocations, live bytes)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    with timed() as build_time:
+        races = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    return races, build_time["seconds"], blocks, size
+
+
+def model_cycle(races: List[Race]) -> Dict[str, Any]:
+    """The aggregation cycle as it ran on validated models."""
+    cached = [race.model_dump(mode="json") for race in races]
+    races = [Race.model_validate(race) for race in cached]
+    merged: Dict[str, Race] = {}
+    runners: Dict[str, Dict[int, Any]] = {}
+    for race in races:
+        key = RaceMergeIndex.race_key(race)
+        if key not in merged:
+            merged[key] = race.model_copy(update={"runners": []})
+            runners[key] = {}
+        for runner in race.runners:
+            existing = runners[key].get(runner.number)
+            if existing is not None:
+                existing.odds.update(runner.odds)
+                continue
+            copy = runner.model_copy(update={"odds": dict(runner.odds)})
+            runners[key][runner.number] = copy
+            merged[key].runners.append(copy)
+    return AggregatedResponse(races=list(merged.values()), source_info=[]).model_dump()
+
+
+def record_cycle(races: List[RaceRecord]) -> Dict[str, Any]:
+    """The same cycle on records, as FortunaEngine now runs it."""
+    cached = [race.to_dict() for race in races]
+    races = [RaceRecord.from_dict(race) for race in cached]
+    merge_index = RaceMergeIndex()
+    merge_index.add_batch(races)
+    response = AggregatedResponse(races=[], source_info=[]).model_dump()
+    response["races"] = [race.to_dict() for race in merge_index.races()]
+    return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Internal race representation.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--sources", type=int, default=12)
+    args = parser.parse_args()
+
+    print(f"{'records':>8} {'form':>7} {'build s':>8} {'allocs':>10} {'MB':>7} {'MB/10k':>7} {'cycle s':>8}")
+    for size in args.sizes:
+        for form, as_records, cycle in (("models", False, model_cycle), ("records", True, record_cycle)):
+            races, build_seconds, blocks, size_bytes = measure_build(
+                lambda: generate_races(size, args.sources, as_records=as_records)
+            )
+            with timed() as cycle_time:
+                response = cycle(races)
+            assert len(response["races"]) == size // args.sources
+            megabytes = size_bytes / 2**20
+            print(
+                f"{size:>8} {form:>7} {build_seconds:>8.3f} {blocks:>10,} {megabytes:>7.1f} "
+                f"{megabytes * 10000 / size:>7.1f} {cycle_time['seconds']:>8.3f}"
+            )
+            del races, response
+
+
+if __name__ == "__main__":
+    main()
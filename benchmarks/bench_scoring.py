@@ -0,0 +1,42 @@
+# benchmarks/bench_scoring.py
+# Compares TrifectaAnalyzer scoring race by race (_evaluate_race) with the vectorized
+# score_store over a RaceStore, checking both give identical scores.
+#   python -m benchmarks.bench_scoring [--sizes 1000 10000 100000] [--sources 3]
+import argparse
+
+from python_service.analyzer import TrifectaAnalyzer
+from python_service.merge import RaceMergeIndex
+from python_service.race_store import RaceStore
+
+from .common import generate_races
+from .common import timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Race-by-race against vectorized Trifecta scoring.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="unique races")
+    parser.add_argument("--sources", type=int, default=3)
+    args = parser.parse_args()
+
+    analyzer = TrifectaAnalyzer()
+    print(f"sources={args.sources} runners/race=10")
+    print(f"{'races':>7} {'loop ms':>9} {'build ms':>9} {'batch ms':>9} {'speedup':>8}")
+    for size in args.sizes:
+        index = RaceMergeIndex()
+        index.add_batch(generate_races(size * args.sources, args.sources, as_records=True))
+        races = index.races()
+        with timed() as loop:
+            expected = [analyzer._evaluate_race(race) for race in races]
+        with timed() as build:
+            store = RaceStore.from_records(races)
+        with timed() as batch:
+            scores = analyzer.score_store(store)
+        assert scores == expected
+        print(
+            f"{len(races):>7} {loop['seconds'] * 1000:>9.1f} {build['seconds'] * 1000:>9.1f} "
+            f"{batch['seconds'] * 1000:>9.1f} {loop['seconds'] / batch['seconds']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
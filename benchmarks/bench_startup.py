@@ -0,0 +1,63 @@
+# benchmarks/bench_startup.py
+# Measures service start-up cost in fresh interpreters: importing the API module,
+# running its lifespan startup, answering the first request and building the adapters.
+#   python -m benchmarks.bench_startup [--runs 5]
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict
+from typing import List
+
+# Runs in a fresh interpreter per sample, so nothing is already imported or cached.
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+marks = {}
+import python_service.api as api
+marks["import_api"] = time.perf_counter() - started
+from fastapi.testclient import TestClient
+with TestClient(api.app) as client:
+    marks["startup"] = time.perf_counter() - started
+    client.get("/health")
+    marks["first_request"] = time.perf_counter() - started
+    adapters_started = time.perf_counter()
+    engine = api.app.state.engine
+    count = len(engine.adapters) + len(engine.v3_adapters)
+    marks["build_adapters"] = time.perf_counter() - adapters_started
+print(json.dumps({
+    "marks": marks,
+    "adapters": count,
+    "modules": len(sys.modules),
+    "pandas_loaded": "pandas" in sys.modules,
+}))
+"""
+
+# import_api, startup and first_request are cumulative from the first import; build_adapters stands alone.
+PHASES = ("import_api", "startup", "first_request", "build_adapters")
+
+
+def run_probe() -> Dict:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], capture_output=True, text=True, check=True
+    ).stdout.strip().splitlines()[-1]
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Start-up time of the API service.")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    samples: List[Dict] = [run_probe() for _ in range(args.runs)]
+    print(f"{'phase':>16} {'median ms':>10} {'min ms':>8}")
+    for phase in PHASES:
+        values = [sample["marks"][phase] * 1000 for sample in samples]
+        print(f"{phase:>16} {statistics.median(values):>10.1f} {min(values):>8.1f}")
+    last = samples[-1]
+    print(f"adapters={last['adapters']} modules={last['modules']} pandas_loaded={last['pandas_loaded']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# benchmarks/common.py
+# Shared helpers for the performance benchmarks. Run any benchmark from the repo root, e.g.
+#   python -m benchmarks.bench_merge
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from datetime import timedelta
+from decimal import Decimal
+from typing import Iterator
+from typing import List
+from typing import Union
+
+from python_service.models import OddsData
+from python_service.models import Race
+from python_service.models import Runner
+from python_service.records import OddsRecord
+from python_service.records import RaceRecord
+from python_service.records import RunnerRecord
+from python_service.utils.odds import Odds
+
+SOURCES = [
+    "Betfair", "BetfairGreyhound", "Racing and Sports", "RacingAndSportsGreyhound", "AtTheRaces", "RacingPost",
+    "Harness", "Equibase", "SportingLife", "Timeform", "TheRacingAPI", "GBGB",
+]
+
+
+def generate_races(
+    total_records: int,
+    sources: int = len(SOURCES),
+    runners_per_race: int = 10,
+    seed: int = 7,
+    as_records: bool = False,
+) -> List[Union[Race, RaceRecord]]:
+    """
+    Generates `total_records` race records as the adapters would report them: every
+    unique race is reported once per source, with slightly different odds. With
+    `as_records`, the same races are built as RaceRecords instead of validated models.
+    """
+    race_class, runner_class, odds_class = (RaceRecord, RunnerRecord, OddsRecord) if as_records else (Race, Runner, OddsData)
+    rng = random.Random(seed)
+    unique_races = max(1, total_records // sources)
+    base_time = datetime(2025, 10, 9, 12, 0)
+    fetched_at = datetime.now()
+    records = []
+    source_names = [SOURCES[i] if i < len(SOURCES) else f"Source{i}" for i in range(sources)]
+    for source in source_names:
+        for index in range(unique_races):
+            if len(records) >= total_records:
+                break
+            runners = []
+            for number in range(1, runners_per_race + 1):
+                win = Decimal(str(round(rng.uniform(1.5, 30.0), 2)))
+                if as_records:
+                    win = Odds.from_decimal(win)
+                odds = {source: odds_class(win=win, source=source, last_updated=fetched_at)}
+                runners.append(runner_class(number=number, name=f"Runner {index}-{number}", odds=odds))
+            records.append(
+                race_class(
+                    id=f"{source}_{index}",
+                    venue=f"Venue {index // 10}",
+                    race_number=index % 10 + 1,
+                    start_time=base_time + timedelta(minutes=5 * (index % 100)),
+                    runners=runners,
+                    source=source,
+                )
+            )
+    rng.shuffle(records)
+    return records
+
+
+@contextmanager
+def timed() -> Iterator[dict]:
+    """Measures wall-clock time of the enclosed block into result['seconds']."""
+    result = {}
+    started = time.perf_counter()
+    try:
+        yield result
+    finally:
+        result["seconds"] = time.perf_counter() - started
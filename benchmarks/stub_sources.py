@@ -0,0 +1,265 @@
+# benchmarks/stub_sources.py
+# Local stand-ins for the upstream racing sites, served over real sockets from a
+# separate process so they do not compete with the engine's event loop.
+import asyncio
+import json
+import multiprocessing
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import httpx
+
+GBGB_HOST = "api.gbgb.org.uk"
+RACING_API_HOST = "api.theracingapi.com"
+TIMEFORM_HOST = "www.timeform.com"
+ATR_HOST = "www.attheraces.com"
+
+FRACTIONS = ["EVS", "6/4", "2/1", "5/2", "3/1", "7/2", "9/2", "6/1", "8/1", "10/1", "14/1", "20/1"]
+
+
+@dataclass
+class StubProfile:
+    """How every stub source behaves: response time, failures and payload size."""
+
+    latency_ms: float = 80.0
+    jitter_ms: float = 40.0
+    error_rate: float = 0.0
+    races: int = 24  # races per source
+    runners: int = 10  # runners per race
+    padding_kb: int = 40  # extra markup per HTML page, as on the real sites
+    seed: int = 7
+
+
+def _race_time(index: int) -> str:
+    return f"{12 + index // 12:02d}:{(index % 12) * 5:02d}"
+
+
+class StubPayloads:
+    """Builds deterministic payloads in each source's format."""
+
+    def __init__(self, profile: StubProfile):
+        self.profile = profile
+        self.padding = '<div class="nav">' + "<p>Lorem ipsum dolor sit amet.</p>" * (profile.padding_kb * 30) + "</div>"
+
+    def _odds(self, rng: random.Random) -> str:
+        return rng.choice(FRACTIONS)
+
+    def gbgb(self, date: str) -> bytes:
+        rng = random.Random(self.profile.seed)
+        meetings = []
+        for meeting in range(max(1, self.profile.races // 12)):
+            races = []
+            for number in range(1, 13):
+                traps = [
+                    {"trapNumber": trap, "dogName": f"Dog {meeting}-{number}-{trap}", "sp": self._odds(rng)}
+                    for trap in range(1, min(self.profile.runners, 6) + 1)
+                ]
+                races.append(
+                    {
+                        "raceId": meeting * 100 + number,
+                        "raceNumber": number,
+                        "raceTime": f"{date}T{_race_time(number)}:00Z",
+                        "raceTitle": f"Stake {number}",
+                        "raceDistance": 480,
+                        "traps": traps,
+                    }
+                )
+            meetings.append({"trackName": f"Track {meeting}", "races": races})
+        return json.dumps(meetings).encode()
+
+    def racing_api(self, date: str) -> bytes:
+        rng = random.Random(self.profile.seed + 1)
+        racecards = []
+        for index in range(self.profile.races):
+            runners = [
+                {
+                    "number": number,
+                    "horse": f"Horse {index}-{number}",
+                    "jockey": "J Doe",
+                    "trainer": "T Smith",
+                    "odds": [{"odds_decimal": round(rng.uniform(1.5, 30.0), 2)}],
+                }
+                for number in range(1, self.profile.runners + 1)
+            ]
+            racecards.append(
+                {
+                    "race_id": index,
+                    "course": f"Course {index // 8}",
+                    "race_no": index % 8 + 1,
+                    "off_time": f"{date}T{_race_time(index)}:00Z",
+                    "race_name": f"Handicap {index}",
+                    "distance_f": "8f",
+                    "runners": runners,
+                }
+            )
+        return json.dumps({"racecards": racecards}).encode()
+
+    def timeform_index(self) -> bytes:
+        links = "".join(
+            f'<a class="rp-racecard-off-link" href="/horse-racing/racecards/course{i // 8}/{i}">{_race_time(i)}</a>'
+            for i in range(self.profile.races)
+        )
+        return (self.padding + links + self.padding).encode()
+
+    def timeform_race(self, index: int) -> bytes:
+        rng = random.Random(self.profile.seed + index)
+        course = index // 8
+        offs = "".join(
+            f'<a class="rp-racecard-off-link" href="/r">{_race_time(i)}</a>' for i in range(course * 8, course * 8 + 8)
+        )
+        rows = "".join(
+            '<div class="rp-horseTable_mainRow">'
+            f'<a class="rp-horseTable_horse-name">Horse {index}-{n}</a>'
+            f'<span class="rp-horseTable_horse-number">({n})</span>'
+            f'<button class="rp-bet-placer-btn__odds">{self._odds(rng)}</button></div>'
+            for n in range(1, self.profile.runners + 1)
+        )
+        header = (
+            f'<h1 class="rp-raceTimeCourseName_name">Course {course}</h1>'
+            f'<span class="rp-raceTimeCourseName_time">{_race_time(index)}</span>'
+        )
+        return (self.padding + header + offs + rows + self.padding).encode()
+
+    def atr_index(self) -> bytes:
+        links = "".join(
+            f'<a class="race-time-link" href="/racecard/venue{i // 8}/{i}">{_race_time(i)}</a>'
+            for i in range(self.profile.races)
+        )
+        return (self.padding + links + self.padding).encode()
+
+    def atr_race(self, index: int) -> bytes:
+        rng = random.Random(self.profile.seed + 1000 + index)
+        venue = index // 8
+        nav = "".join(
+            f'<a class="race-time-link{" active" if i == index else ""}" href="/r">{_race_time(i)}</a>'
+            for i in range(venue * 8, venue * 8 + 8)
+        )
+        rows = "".join(
+            '<div class="card-horse">'
+            f'<h3 class="horse-name"><a>Horse {index}-{n}</a></h3>'
+            f'<span class="horse-number">{n}</span>'
+            f'<button class="best-odds">{self._odds(rng)}</button></div>'
+            for n in range(1, self.profile.runners + 1)
+        )
+        header = f'<h1 class="heading-racecard-title">Venue {venue} | {_race_time(index)}</h1>'
+        return (self.padding + header + f'<div class="races">{nav}</div>' + rows + self.padding).encode()
+
+
+class StubServer:
+    """A minimal HTTP/1.1 server routing /<original host>/<path> to the matching stub payload."""
+
+    def __init__(self, profile: StubProfile):
+        self.profile = profile
+        self.payloads = StubPayloads(profile)
+        self.requests: Counter = Counter()
+        self.rng = random.Random(profile.seed)
+
+    def route(self, path: str) -> Tuple[int, str, bytes]:
+        host, _, rest = path.lstrip("/").partition("/")
+        rest = "/" + rest.split("?")[0]
+        parts = rest.strip("/").split("/")
+        if host == GBGB_HOST and rest.startswith("/api/results/meeting/"):
+            return 200, "application/json", self.payloads.gbgb(parts[-1])
+        if host == RACING_API_HOST and rest.startswith("/v1/racecards"):
+            return 200, "application/json", self.payloads.racing_api(path.split("date=")[1][:10])
+        if host == TIMEFORM_HOST and rest == "/horse-racing/racecards":
+            return 200, "text/html", self.payloads.timeform_index()
+        if host == TIMEFORM_HOST and rest.startswith("/horse-racing/racecards/"):
+            return 200, "text/html", self.payloads.timeform_race(int(parts[-1]))
+        if host == ATR_HOST and rest == "/racecards":
+            return 200, "text/html", self.payloads.atr_index()
+        if host == ATR_HOST and rest.startswith("/racecard/"):
+            return 200, "text/html", self.payloads.atr_race(int(parts[-1]))
+        return 404, "text/plain", b"not found"
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                _, path, _ = request_line.decode().split(" ", 2)
+
+                if path == "/__stats":
+                    status, content_type, body = 200, "application/json", json.dumps(self.requests).encode()
+                else:
+                    self.requests[path.lstrip("/").split("/", 1)[0]] += 1
+                    delay = self.profile.latency_ms + self.rng.uniform(-1, 1) * self.profile.jitter_ms
+                    await asyncio.sleep(max(0.0, delay) / 1000)
+                    if self.rng.random() < self.profile.error_rate:
+                        status, content_type, body = 503, "text/plain", b"unavailable"
+                    else:
+                        status, content_type, body = self.route(path)
+
+                writer.write(
+                    f"HTTP/1.1 {status} X\r\nContent-Type: {content_type}\r\n"
+                    f"Content-Length: {len(body)}\r\nConnection: keep-alive\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, port_queue: multiprocessing.Queue):
+        server = await asyncio.start_server(self.handle, "127.0.0.1", 0, backlog=1024)
+        port_queue.put(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+
+def _serve(profile: StubProfile, port_queue: multiprocessing.Queue):
+    asyncio.run(StubServer(profile).serve(port_queue))
+
+
+class StubSources:
+    """Runs the stub server in a child process for the duration of a `with` block."""
+
+    def __init__(self, profile: StubProfile):
+        self.profile = profile
+        self.port: Optional[int] = None
+        self._process: Optional[multiprocessing.Process] = None
+
+    def __enter__(self) -> "StubSources":
+        port_queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(target=_serve, args=(self.profile, port_queue), daemon=True)
+        self._process.start()
+        self.port = port_queue.get(timeout=10)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._process.terminate()
+        self._process.join(timeout=5)
+
+    def request_counts(self) -> Dict[str, int]:
+        return httpx.get(f"http://127.0.0.1:{self.port}/__stats").json()
+
+    def transport(self) -> "StubRoutingTransport":
+        return StubRoutingTransport(self.port)
+
+
+class StubRoutingTransport(httpx.AsyncBaseTransport):
+    """Sends every request to the stub server, keeping the original host as the first path segment."""
+
+    def __init__(self, port: int):
+        self.port = port
+        self._transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=200))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        original = request.url
+        request.url = httpx.URL(
+            scheme="http", host="127.0.0.1", port=self.port, path=f"/{original.host}{original.path}",
+            query=original.query,
+        )
+        request.headers["Host"] = f"127.0.0.1:{self.port}"
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self):
+        await self._transport.aclose()
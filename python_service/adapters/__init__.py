@@ -1,18 +1,32 @@
 # python_service/adapters/__init__.py
 
-from .at_the_races_adapter import AtTheRacesAdapter
-from .betfair_adapter import BetfairAdapter
-from .betfair_greyhound_adapter import BetfairGreyhoundAdapter
-from .gbgb_api_adapter import GbgbApiAdapter
-from .greyhound_adapter import GreyhoundAdapter
-from .harness_adapter import HarnessAdapter
-from .pointsbet_greyhound_adapter import PointsBetGreyhoundAdapter
-from .racing_and_sports_adapter import RacingAndSportsAdapter
-from .racing_and_sports_greyhound_adapter import RacingAndSportsGreyhoundAdapter
-from .sporting_life_adapter import SportingLifeAdapter
-from .the_racing_api_adapter import TheRacingApiAdapter
-from .timeform_adapter import TimeformAdapter
-from .tvg_adapter import TVGAdapter
+import importlib
+
+# Adapter classes are imported on first access (PEP 562), so importing a single
+# adapter module, or python_service.adapters.base, does not import them all.
+_ADAPTER_MODULES = {
+    "AtTheRacesAdapter": "at_the_races_adapter",
+    "BetfairAdapter": "betfair_adapter",
+    "BetfairGreyhoundAdapter": "betfair_greyhound_adapter",
+    "GbgbApiAdapter": "gbgb_api_adapter",
+    "GreyhoundAdapter": "greyhound_adapter",
+    "HarnessAdapter": "harness_adapter",
+    "PointsBetGreyhoundAdapter": "pointsbet_greyhound_adapter",
+    "RacingAndSportsAdapter": "racing_and_sports_adapter",
+    "RacingAndSportsGreyhoundAdapter": "racing_and_sports_greyhound_adapter",
+    "SportingLifeAdapter": "sporting_life_adapter",
+    "TheRacingApiAdapter": "the_racing_api_adapter",
+    "TimeformAdapter": "timeform_adapter",
+    "TVGAdapter": "tvg_adapter",
+}
+
+
+def __getattr__(name):
+    module = _ADAPTER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
+
 
 # Define the public API for the adapters package, making it easy for the
 # orchestrator to discover and use them.
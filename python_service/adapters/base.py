@@ -1,20 +1,112 @@
 # python_service/adapters/base.py
+import asyncio
+import inspect
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
 import httpx
 import structlog
-from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential
+from tenacity import AsyncRetrying, RetryError, retry_if_exception, stop_after_attempt, wait_exponential
+from tenacity.stop import stop_base
+
+from ..core.errors import ErrorCategory
+from ..core.errors import classify_http_error
+from ..core.errors import is_retryable
+from ..core.fetch_context import current_fetch_context
+from ..core.http_cache import ConditionalCache
+from ..core.http_cache import is_not_modified
+from ..core.pipeline import StagedPipeline
+from ..core.request_scheduler import RequestScheduler
+from ..core.request_scheduler import get_request_scheduler
+from ..models import OddsData
+from ..models import Race
+from ..models import Runner
+from ..records import OddsRecord
+from ..records import RaceRecord
+from ..records import RunnerRecord
+
+_parse_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_parse_executor(workers: int) -> ProcessPoolExecutor:
+    """The process pool shared by every adapter's HTML parsing, created on first use."""
+    global _parse_executor
+    if _parse_executor is None:
+        _parse_executor = ProcessPoolExecutor(max_workers=workers)
+    return _parse_executor
+
+
+def shutdown_parse_executor():
+    global _parse_executor
+    if _parse_executor is not None:
+        _parse_executor.shutdown(wait=False, cancel_futures=True)
+        _parse_executor = None
+
+
+class stop_at_fetch_deadline(stop_base):
+    """Stops retrying once the current adapter fetch has exhausted its budget."""
+
+    def __call__(self, retry_state) -> bool:
+        context = current_fetch_context()
+        return context is not None and context.expired
+
+
+class LatencyTracker:
+    """A rolling window of request latencies, used to pick the hedging delay."""
+
+    def __init__(self, maxlen: int = 200):
+        self.samples = deque(maxlen=maxlen)
+
+    def record(self, duration: float):
+        self.samples.append(duration)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
 
 class BaseAdapter:
     """The base class for all data adapters, now with enhanced error handling."""
 
+    # Idempotent JSON sources may opt in to hedged requests (see _send_hedged).
+    HEDGE_ELIGIBLE = False
+    # Per-adapter override of Settings.ADAPTER_TIMEOUT.
+    TIMEOUT_SECONDS: Optional[float] = None
+    # Per-adapter override of Settings.SOURCE_CACHE_TTL_SECONDS.
+    CACHE_TTL_SECONDS: Optional[int] = None
+
     def __init__(self, source_name: str, base_url: str = "", config: dict = None):
         self.source_name = source_name
         self.base_url = base_url
         self.config = config or {}
         self.logger = structlog.get_logger(self.__class__.__name__)
         self.retryer = AsyncRetrying(
-            stop=stop_after_attempt(3),
-            wait=wait_exponential(multiplier=1, min=2, max=10)
+            stop=stop_after_attempt(3) | stop_at_fetch_deadline(),
+            wait=wait_exponential(multiplier=1, min=2, max=10),
+            # A rejected request (bad credentials, missing page) is not retried.
+            retry=retry_if_exception(is_retryable),
+        )
+        self.latency_tracker = LatencyTracker()
+        self.conditional_cache = ConditionalCache(
+            max_entries=int(self._setting("HTTP_CACHE_MAX_ENTRIES", 256)),
+            max_bytes=int(self._setting("HTTP_CACHE_MAX_BYTES", 16 * 2**20)),
         )
+        # Defaults to the process-wide scheduler; tests and tools may install their own.
+        self.request_scheduler: Optional[RequestScheduler] = None
         # Circuit Breaker State
         self.circuit_breaker_tripped = False
         self.circuit_breaker_failure_count = 0
@@ -22,22 +114,119 @@ class BaseAdapter:
         self.FAILURE_THRESHOLD = 3
         self.COOLDOWN_PERIOD_SECONDS = 300  # 5 minutes
 
+    def _setting(self, name: str, default: Any) -> Any:
+        """Reads a numeric or boolean setting from the adapter's config, tolerating dict or missing configs."""
+        if isinstance(self.config, dict):
+            value = self.config.get(name, default)
+        else:
+            value = getattr(self.config, name, default)
+        return value if isinstance(value, (bool, int, float)) else default
+
+    def _request_timeout(self) -> Optional[float]:
+        """The per-request timeout: DEFAULT_TIMEOUT, capped by what is left of the fetch budget."""
+        timeout = float(self._setting("DEFAULT_TIMEOUT", 30))
+        context = current_fetch_context()
+        remaining = context.remaining() if context else None
+        return min(timeout, remaining) if remaining is not None else timeout
+
+    def _hedge_delay(self) -> float:
+        """The latency after which a hedged duplicate request is sent."""
+        default_delay = float(self._setting("HEDGE_DEFAULT_DELAY_SECONDS", 2.0))
+        if len(self.latency_tracker.samples) < self._setting("HEDGE_MIN_SAMPLES", 20):
+            return default_delay
+        return self.latency_tracker.percentile(self._setting("HEDGE_LATENCY_PERCENTILE", 95.0))
+
+    async def _send_hedged(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """
+        Sends a request and, if it has not completed within the hedge delay, a
+        duplicate. The first successful response wins and the other is cancelled.
+        """
+        primary = asyncio.create_task(send())
+        pending = {primary}
+        last_error = None
+        # Whatever stops the wait (a winner, the caller's cancellation or budget), no request is left running.
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self._hedge_delay())
+            if done:
+                return primary.result()
+
+            self.logger.info("hedged_request_sent", adapter=self.source_name)
+            pending.add(asyncio.create_task(send()))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    last_error = task.exception()
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _retry_after(response: httpx.Response, default: float = 5.0) -> float:
+        try:
+            return max(0.0, float(response.headers.get("Retry-After", default)))
+        except ValueError:
+            # Retry-After may also be an HTTP date; fall back to the default pause.
+            return default
+
     async def make_request(self, http_client: httpx.AsyncClient, method: str, url: str, **kwargs):
         full_url = url if url.startswith('http') else f"{self.base_url}{url}"
 
-        async def _make_request():
-            response = await http_client.request(method, full_url, **kwargs)
+        context = current_fetch_context()
+        if context is not None and context.expired:
+            context.truncated = True
+            self.logger.warning("fetch_budget_exhausted", adapter=self.source_name, url=full_url)
+            return None
+        kwargs.setdefault("timeout", self._request_timeout())
+        scheduler = self.request_scheduler or get_request_scheduler()
+        cache_key = str(httpx.URL(full_url, params=kwargs.get("params"))) if method.upper() == "GET" else None
+        unconditional_kwargs = dict(kwargs)
+        if cache_key is not None:
+            validators = self.conditional_cache.conditional_headers(cache_key)
+            if validators:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **validators}
+
+        async def _send():
+            async with scheduler.slot(full_url):
+                started = time.monotonic()
+                response = await http_client.request(method, full_url, **kwargs)
+            if cache_key is not None:
+                if response.status_code == 304:
+                    replayed = self.conditional_cache.replay(cache_key, response)
+                    if replayed is not None:
+                        # Not a latency sample: revalidations are much faster than the full fetches hedging times.
+                        return replayed
+                    # The body was evicted after the validators were sent: fetch it in full, once.
+                    self.logger.info("conditional_replay_missed", adapter=self.source_name, url=full_url)
+                    async with scheduler.slot(full_url):
+                        started = time.monotonic()
+                        response = await http_client.request(method, full_url, **unconditional_kwargs)
+                if response.is_success:
+                    self.conditional_cache.store(cache_key, response)
+            if response.status_code == 429:
+                retry_after = self._retry_after(response)
+                self.logger.warning("rate_limited", adapter=self.source_name, url=full_url, retry_after=retry_after)
+                scheduler.pause_host(scheduler.host_of(full_url), retry_after)
             response.raise_for_status()
+            self.latency_tracker.record(time.monotonic() - started)
+            return response
+
+        async def _make_request():
+            if self.HEDGE_ELIGIBLE and method.upper() == "GET" and self._setting("HEDGED_REQUESTS_ENABLED", False):
+                return await self._send_hedged(_send)
             # Note: Previously, this returned response.json(), but that prevents
             # the Timeform adapter from reading .text for HTML parsing.
             # Returning the full response object is more flexible.
-            return response
+            return await _send()
 
         try:
-            async for attempt in self.retryer:
+            async for attempt in self.retryer.copy():
                 with attempt:
                     return await _make_request()
         except httpx.HTTPStatusError as e:
+            self._record_failure(e)
             self.logger.error(
                 "http_error",
                 adapter=self.source_name,
@@ -49,14 +238,173 @@ class BaseAdapter:
             )
             return None
         except httpx.RequestError as e:
+            self._record_failure(e)
             self.logger.error("request_error", adapter=self.source_name, error=str(e), url=full_url)
             self._show_windows_toast("Adapter Network Error", f"{self.source_name}: Could not connect to {full_url}")
             return None
         except Exception as e:
+            self._record_failure(e)
             self.logger.error("unexpected_adapter_error", adapter=self.source_name, error=str(e), exc_info=True)
             self._show_windows_toast("Adapter Unexpected Error", f"{self.source_name}: An unknown error occurred.")
             return None
 
+    @staticmethod
+    def _record_failure(e: Exception):
+        """Notes on the current fetch why a request gave up, for the engine's failure memo."""
+        if isinstance(e, RetryError) and e.last_attempt.failed:
+            e = e.last_attempt.exception()
+        context = current_fetch_context()
+        if context is not None:
+            context.failure = classify_http_error(e)
+
+    async def parse_off_loop(self, parser: Callable[..., Any], *args: Any) -> Any:
+        """
+        Runs a CPU-bound page parser in the shared process pool so building the
+        soup tree does not stall the event loop. `parser` must be a module-level
+        function taking and returning plain, picklable data. With PARSE_WORKERS
+        set to 0 (the default for adapters without a Settings config), it runs inline.
+        """
+        workers = int(self._setting("PARSE_WORKERS", 0))
+        if workers <= 0:
+            return parser(*args)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(get_parse_executor(workers), parser, *args)
+        except BrokenProcessPool:
+            self.logger.warning("parse_executor_broken", adapter=self.source_name)
+            shutdown_parse_executor()
+            return parser(*args)
+
+    @staticmethod
+    def is_unchanged(response: Optional[httpx.Response]) -> bool:
+        """True if the server confirmed (304) that `response`'s body is what we already had."""
+        return is_not_modified(response)
+
+    async def parse_unless_unchanged(self, response: httpx.Response, parse: Callable[[httpx.Response], Any]) -> Any:
+        """
+        Parses `response` with `parse` (sync or async), unless the server reported
+        the body unchanged and it was already parsed, in which case the earlier
+        result is returned. Results must be treated as read-only.
+        """
+        entry = self.conditional_cache.get(str(response.url))
+        if entry is not None and entry.parsed is not None and self.is_unchanged(response):
+            return entry.parsed
+        parsed = parse(response)
+        if inspect.isawaitable(parsed):
+            parsed = await parsed
+        if entry is not None:
+            entry.parsed = parsed
+        return parsed
+
+    async def fetch_page(self, http_client: httpx.AsyncClient, url: str) -> Optional[httpx.Response]:
+        """
+        Fetches a page for a parse stage, or None if the request failed. Parse
+        stages go through parse_unless_unchanged, so a page the server reports
+        unchanged is not parsed again.
+        """
+        return await self.make_request(http_client, "GET", url)
+
+    async def fetch_then_parse(
+        self,
+        items: Iterable[Any],
+        fetch: Callable[[Any], Awaitable[Any]],
+        parse: Callable[[Any], Any],
+    ) -> List[Any]:
+        """
+        Fetches every item and parses the payloads as a StagedPipeline: up to
+        PIPELINE_FETCH_WORKERS fetches run while PARSE_WORKERS parsers drain a
+        queue of at most PIPELINE_QUEUE_SIZE pages, so fetching pauses rather
+        than piling up bodies when parsing falls behind. Stops at the fetch
+        budget, like gather_within_budget.
+        """
+        pipeline = StagedPipeline(
+            fetch,
+            parse,
+            fetch_workers=int(self._setting("PIPELINE_FETCH_WORKERS", 6)),
+            parse_workers=int(self._setting("PARSE_WORKERS", 0)),
+            queue_size=int(self._setting("PIPELINE_QUEUE_SIZE", 4)),
+            name=self.source_name,
+        )
+        context = current_fetch_context()
+        results = await pipeline.run(items, timeout=context.remaining() if context else None)
+        if pipeline.truncated and context is not None:
+            context.truncated = True
+        return results
+
+    def _format_response(
+        self,
+        races: List[Race],
+        start_time: datetime,
+        is_success: bool = True,
+        error_message: str = None,
+        error_category: Optional[ErrorCategory] = None,
+    ) -> Dict[str, Any]:
+        source_info = {
+            "name": self.source_name,
+            "status": "SUCCESS" if is_success else "FAILED",
+            "races_fetched": len(races),
+            "error_message": error_message,
+            "fetch_duration": (datetime.now() - start_time).total_seconds(),
+        }
+        if error_category is not None:
+            source_info["error_category"] = error_category.name
+        return {"races": races, "source_info": source_info}
+
+    def _race_from_parsed(self, parsed: Dict[str, Any]) -> RaceRecord:
+        """
+        Builds a race record from the compact dict returned by a page parser.
+        The parser already produced typed values, so nothing is validated again.
+        """
+        last_updated = datetime.now()
+        source = sys.intern(self.source_name)
+        return RaceRecord(
+            id=parsed["id"],
+            venue=parsed["venue"],
+            race_number=parsed["race_number"],
+            start_time=parsed["start_time"],
+            runners=[self._runner_from_parsed(runner, source, last_updated) for runner in parsed["runners"]],
+            source=source,
+        )
+
+    @staticmethod
+    def _runner_from_parsed(parsed: Dict[str, Any], source: str, last_updated: datetime) -> RunnerRecord:
+        win = parsed.get("win")
+        odds = {source: OddsRecord(source=source, last_updated=last_updated, win=win)} if win else {}
+        return RunnerRecord(number=parsed["number"], name=parsed["name"], odds=odds)
+
+    async def gather_within_budget(self, coros: Iterable[Awaitable[Any]]) -> List[Any]:
+        """
+        Like asyncio.gather, but stops waiting when the current fetch budget runs
+        out. Results that finished in time are returned in order; the rest are
+        cancelled and the fetch is marked as truncated.
+        """
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        if not tasks:
+            return []
+
+        context = current_fetch_context()
+        timeout = context.remaining() if context else None
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if context is not None:
+                context.truncated = True
+            self.logger.warning(
+                "fetch_budget_truncated", adapter=self.source_name, completed=len(done), cancelled=len(pending)
+            )
+
+        results = []
+        for task in tasks:
+            if task not in done:
+                continue
+            if task.exception() is not None:
+                self.logger.error("concurrent_fetch_failed", adapter=self.source_name, error=str(task.exception()))
+                continue
+            results.append(task.result())
+        return results
+
     def _show_windows_toast(self, title: str, message: str):
         try:
             from windows_toasts import Toast, WindowsToaster
@@ -66,4 +414,4 @@ class BaseAdapter:
             toaster.show_toast(new_toast)
         except (ImportError, RuntimeError):
             # Fail silently if not on Windows or if notifier fails
-            pass
\ No newline at end of file
+            pass
@@ -1,8 +1,9 @@
 # python_service/adapters/base_v3.py
 import time
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Any, List
+from typing import AsyncGenerator, Any, List, Optional
 
+import httpx
 import structlog
 
 from ..models import Race
@@ -21,6 +22,8 @@ class BaseAdapterV3(ABC):
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
+        # The engine's shared client, injected by FortunaEngine.
+        self.http_client: Optional[httpx.AsyncClient] = None
         self.logger = structlog.get_logger(adapter_name=source_name)
         # Circuit Breaker State
         self.circuit_breaker_tripped = False
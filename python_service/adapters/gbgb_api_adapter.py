@@ -20,6 +20,8 @@ log = structlog.get_logger(__name__)
 class GbgbApiAdapter(BaseAdapter):
     """Adapter for the undocumented JSON API for the Greyhound Board of Great Britain."""
 
+    HEDGE_ELIGIBLE = True
+
     def __init__(self, config):
         super().__init__(source_name="GBGB", base_url="https://api.gbgb.org.uk/api/", config=config)
 
@@ -35,7 +37,8 @@ class GbgbApiAdapter(BaseAdapter):
                     [], start_time, is_success=True, error_message="No meetings found in API response."
                 )
 
-            all_races = self._parse_meetings(response.json())
+            # Meeting JSON rarely changes between polls; reuse the last parse on a 304.
+            all_races = await self.parse_unless_unchanged(response, lambda r: self._parse_meetings(r.json()))
             return self._format_response(all_races, start_time, is_success=True)
         except httpx.HTTPError as e:
             log.error(f"{self.source_name}: HTTP request failed after retries", error=str(e), exc_info=True)
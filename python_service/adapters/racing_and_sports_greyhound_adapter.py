@@ -8,6 +8,7 @@ from typing import List
 import httpx
 import structlog
 
+from ..core.errors import ErrorCategory
 from ..models import Race
 from ..models import Runner
 from .base import BaseAdapter
@@ -27,7 +28,11 @@ class RacingAndSportsGreyhoundAdapter(BaseAdapter):
 
         if not self.api_token:
             return self._format_response(
-                [], start_time, is_success=False, error_message="ConfigurationError: Token not set"
+                [],
+                start_time,
+                is_success=False,
+                error_message="ConfigurationError: Token not set",
+                error_category=ErrorCategory.CONFIGURATION_ERROR,
             )
 
         try:
@@ -66,21 +71,6 @@ class RacingAndSportsGreyhoundAdapter(BaseAdapter):
                 [], start_time, is_success=False, error_message=f"An unexpected error occurred: {e}"
             )
 
-    def _format_response(
-        self, races: List[Race], start_time: datetime, is_success: bool = True, error_message: str = None
-    ) -> Dict[str, Any]:
-        fetch_duration = (datetime.now() - start_time).total_seconds()
-        return {
-            "races": races,
-            "source_info": {
-                "name": self.source_name,
-                "status": "SUCCESS" if is_success else "FAILED",
-                "races_fetched": len(races),
-                "error_message": error_message,
-                "fetch_duration": fetch_duration,
-            },
-        }
-
     def _parse_ras_race(self, meeting: Dict[str, Any], race: Dict[str, Any]) -> Race:
         runners = [
             Runner(
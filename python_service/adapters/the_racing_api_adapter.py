@@ -5,10 +5,12 @@ from decimal import Decimal
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 
 import httpx
 import structlog
 
+from ..core.errors import ErrorCategory
 from ..models import OddsData
 from ..models import Race
 from ..models import Runner
@@ -20,6 +22,8 @@ log = structlog.get_logger(__name__)
 class TheRacingApiAdapter(BaseAdapter):
     """Adapter for the high-value JSON-based The Racing API."""
 
+    HEDGE_ELIGIBLE = True
+
     def __init__(self, config):
         super().__init__(source_name="TheRacingAPI", base_url="https://api.theracingapi.com/v1/", config=config)
         self.api_key = config.THE_RACING_API_KEY
@@ -28,7 +32,11 @@ class TheRacingApiAdapter(BaseAdapter):
         start_time = datetime.now()
         if not self.api_key:
             return self._format_response(
-                [], start_time, is_success=False, error_message="ConfigurationError: THE_RACING_API_KEY not set"
+                [],
+                start_time,
+                is_success=False,
+                error_message="ConfigurationError: THE_RACING_API_KEY not set",
+                error_category=ErrorCategory.CONFIGURATION_ERROR,
             )
 
         try:
@@ -41,13 +49,13 @@ class TheRacingApiAdapter(BaseAdapter):
                     [], start_time, is_success=True, error_message="No response from API."
                 )
 
-            response_json = response.json()
-            if not response_json or not response_json.get("racecards"):
+            # Racecards rarely change between polls; reuse the last parse on a 304.
+            all_races = await self.parse_unless_unchanged(response, self._parse_response)
+            if all_races is None:
                 return self._format_response(
                     [], start_time, is_success=True, error_message="No racecards found in API response."
                 )
 
-            all_races = self._parse_races(response_json["racecards"])
             return self._format_response(all_races, start_time, is_success=True)
         except httpx.HTTPError as e:
             log.error(f"{self.source_name}: HTTP request failed after retries", error=str(e), exc_info=True)
@@ -60,6 +68,12 @@ class TheRacingApiAdapter(BaseAdapter):
                 [], start_time, is_success=False, error_message=f"An unexpected error occurred: {e}"
             )
 
+    def _parse_response(self, response: httpx.Response) -> Optional[List[Race]]:
+        response_json = response.json()
+        if not response_json or not response_json.get("racecards"):
+            return None
+        return self._parse_races(response_json["racecards"])
+
     def _parse_races(self, racecards: List[Dict[str, Any]]) -> List[Race]:
         races = []
         for race_data in racecards:
@@ -106,17 +120,3 @@ class TheRacingApiAdapter(BaseAdapter):
                     f"{self.source_name}: Error parsing runner", runner_name=runner_data.get("horse"), error=str(e)
                 )
         return runners
-
-    def _format_response(
-        self, races: List[Race], start_time: datetime, is_success: bool = True, error_message: str = None
-    ) -> Dict[str, Any]:
-        return {
-            "races": races,
-            "source_info": {
-                "name": self.source_name,
-                "status": "SUCCESS" if is_success else "FAILED",
-                "races_fetched": len(races),
-                "error_message": error_message,
-                "fetch_duration": (datetime.now() - start_time).total_seconds(),
-            },
-        }
@@ -1,17 +1,29 @@
+import hashlib
+import sys
 from abc import ABC
 from abc import abstractmethod
-from decimal import Decimal
 from pathlib import Path
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Hashable
 from typing import List
+from typing import TYPE_CHECKING
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Type
 
 import structlog
 
-from python_service.models import Race
-from python_service.models import Runner
+from python_service.core.ttl_cache import BoundedTTLCache
+from python_service.records import RaceRecord
+from python_service.records import RunnerRecord
+from python_service.registry import ANALYZER
+from python_service.registry import LazyPluginMap
+from python_service.registry import get_registry
+from python_service.utils.odds import MAX_VALID_ODDS
+from python_service.utils.odds import Odds
 
 try:
     # winsound is a built-in Windows library
@@ -24,16 +36,21 @@ except (ImportError, RuntimeError):
     # Fails gracefully on non-Windows systems
     ToastNotifier = None
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from python_service.race_store import RaceStore
+
 log = structlog.get_logger(__name__)
 
 
-def _get_best_win_odds(runner: Runner) -> Optional[Decimal]:
+def _get_best_win_odds(runner: RunnerRecord) -> Optional[Odds]:
     """Gets the best win odds for a runner, filtering out invalid or placeholder values."""
     if not runner.odds:
         return None
 
     # Filter out invalid or placeholder odds (e.g., > 999)
-    valid_odds = [o.win for o in runner.odds.values() if o.win is not None and o.win > 0 and o.win < 999]
+    valid_odds = [o.win for o in runner.odds.values() if o.win is not None and 0 < o.win < MAX_VALID_ODDS]
 
     if not valid_odds:
         return None
@@ -41,17 +58,89 @@ def _get_best_win_odds(runner: Runner) -> Optional[Decimal]:
     return min(valid_odds)
 
 
+class ScoreCache:
+    """
+    Remembers scores between refresh cycles, keyed by an analyzer's settings and
+    a fingerprint of a race's content (see TrifectaAnalyzer.fingerprint), so a
+    race whose runners, scratchings and best odds have not moved is not scored
+    again. It also keeps recent sets of scores under a revision token, so a
+    client that sends back the revision it last saw learns which scores
+    changed since then. One cache is shared by every analyzer the
+    AnalyzerEngine hands out.
+    """
+
+    def __init__(self, max_entries: int = 100_000, ttl_seconds: float = 24 * 3600, max_revisions: int = 256):
+        self.ttl_seconds = ttl_seconds
+        # Values are floats and flat dicts of them: their shallow size is close enough.
+        self.scores = BoundedTTLCache(max_entries=max_entries, sizer=sys.getsizeof)
+        # revision -> (settings, scope, {race id: score})
+        self._revisions = BoundedTTLCache(max_entries=max_revisions, sizer=sys.getsizeof)
+
+    def score(
+        self,
+        settings: Hashable,
+        races: Sequence[RaceRecord],
+        fingerprint: Callable[[RaceRecord], Hashable],
+        evaluate: Callable[[RaceRecord], float],
+    ) -> Tuple[List[float], int]:
+        """Each race's score, from the cache or from `evaluate`, and how many races needed evaluating."""
+        scores = []
+        rescored = 0
+        for race in races:
+            key = (settings, fingerprint(race))
+            score = self.scores.get(key)
+            if score is None:
+                score = evaluate(race)
+                self.scores.set(key, score, self.ttl_seconds)
+                rescored += 1
+            scores.append(score)
+        return scores, rescored
+
+    def changed(
+        self,
+        settings: Hashable,
+        scope: Hashable,
+        races: Sequence[RaceRecord],
+        scores: Sequence[float],
+        since: Optional[str] = None,
+    ) -> Tuple[List[str], str]:
+        """
+        The ids of the races whose score differs from the scores identified by
+        `since` (every race, if it is unknown, expired or for other settings or
+        scope), and the revision identifying these scores. Identical scores
+        share a revision, so clients polling an unchanged card add nothing.
+        """
+        current = {race.id: score for race, score in zip(races, scores)}
+        digest = hashlib.blake2b(repr((settings, scope, sorted(current.items()))).encode(), digest_size=12)
+        revision = digest.hexdigest()
+        self._revisions.set(revision, (settings, scope, current), self.ttl_seconds)
+
+        previous: Dict[str, float] = {}
+        if since is not None:
+            settings_then, scope_then, scores_then = self._revisions.get(since, (None, None, {}))
+            if (settings_then, scope_then) == (settings, scope):
+                previous = scores_then
+        return [race_id for race_id, score in current.items() if previous.get(race_id) != score], revision
+
+
 class BaseAnalyzer(ABC):
     """The abstract interface for all future analyzer plugins."""
 
+    # Set by the AnalyzerEngine; analyzers that can fingerprint races use it to skip unchanged ones.
+    score_cache: Optional[ScoreCache] = None
+
     def __init__(self, **kwargs):
         pass
 
     @abstractmethod
-    def qualify_races(self, races: List[Race]) -> Dict[str, Any]:
+    def qualify_races(self, races: List[RaceRecord]) -> Dict[str, Any]:
         """The core method every analyzer must implement."""
         pass
 
+    def qualify_store(self, store: "RaceStore") -> Dict[str, Any]:
+        """qualify_races for a day held as a RaceStore. Analyzers that can work on its columns override this."""
+        return self.qualify_races(store.to_records())
+
 
 class TrifectaAnalyzer(BaseAnalyzer):
     """Analyzes races and assigns a qualification score based on the 'Trifecta of Factors'."""
@@ -62,11 +151,11 @@ class TrifectaAnalyzer(BaseAnalyzer):
 
     def __init__(self, max_field_size: int = 10, min_favorite_odds: float = 2.5, min_second_favorite_odds: float = 4.0):
         self.max_field_size = max_field_size
-        self.min_favorite_odds = Decimal(str(min_favorite_odds))
-        self.min_second_favorite_odds = Decimal(str(min_second_favorite_odds))
+        self.min_favorite_odds = Odds.from_decimal(min_favorite_odds)
+        self.min_second_favorite_odds = Odds.from_decimal(min_second_favorite_odds)
         self.notifier = RaceNotifier()
 
-    def is_race_qualified(self, race: Race) -> bool:
+    def is_race_qualified(self, race: RaceRecord) -> bool:
         """A race is qualified for a trifecta if it has at least 3 non-scratched runners."""
         if not race or not race.runners:
             return False
@@ -74,14 +163,60 @@ class TrifectaAnalyzer(BaseAnalyzer):
         active_runners = sum(1 for r in race.runners if not r.scratched)
         return active_runners >= 3
 
-    def qualify_races(self, races: List[Race]) -> Dict[str, Any]:
-        """Scores all races and returns a dictionary with criteria and a sorted list."""
-        scored_races = []
-        for race in races:
+    @property
+    def settings(self) -> Hashable:
+        """Everything besides the race that a score depends on."""
+        return (self.name, self.max_field_size, self.min_favorite_odds, self.min_second_favorite_odds)
+
+    def fingerprint(self, race: RaceRecord) -> Hashable:
+        """What a race's score depends on: each runner's number, scratching and, if still running, best win odds."""
+        return tuple(
+            (runner.number, True, None) if runner.scratched else (runner.number, False, _get_best_win_odds(runner))
+            for runner in race.runners
+        )
+
+    def qualify_races(
+        self, races: List[RaceRecord], since: Optional[str] = None, scope: Hashable = None
+    ) -> Dict[str, Any]:
+        """
+        Scores all races and returns a dictionary with criteria and a sorted
+        list, plus how many races were actually scored, a revision identifying
+        the scores, and the ids of races whose score changed since the revision
+        `since` (from an earlier call with the same `scope`, e.g. race date).
+        With a score cache, races whose fingerprint was scored before reuse that score.
+        """
+        if self.score_cache is None:
             # The _evaluate_race method now always returns a float score.
-            race.qualification_score = self._evaluate_race(race)
-            scored_races.append(race)
+            scores = [self._evaluate_race(race) for race in races]
+            rescored = len(races)
+        else:
+            scores, rescored = self.score_cache.score(self.settings, races, self.fingerprint, self._evaluate_race)
 
+        scored_races = []
+        for race, score in zip(races, scores):
+            race.qualification_score = score
+            scored_races.append(race)
+        return self._rank(scored_races, scores, rescored, since, scope)
+
+    def qualify_store(self, store: "RaceStore", since: Optional[str] = None, scope: Hashable = None) -> Dict[str, Any]:
+        """qualify_races, scoring every race of the store in one vectorized pass."""
+        scores = self.score_store(store)
+        store.qualification_scores[:] = scores
+        races = store.to_records()
+        return self._rank(races, scores, len(races), since, scope)
+
+    def _rank(
+        self,
+        scored_races: List[RaceRecord],
+        scores: List[float],
+        rescored: int,
+        since: Optional[str],
+        scope: Hashable,
+    ) -> Dict[str, Any]:
+        if self.score_cache is None:
+            changed, revision = [race.id for race in scored_races], None
+        else:
+            changed, revision = self.score_cache.changed(self.settings, scope, scored_races, scores, since)
         scored_races.sort(key=lambda r: r.qualification_score, reverse=True)
 
         criteria = {
@@ -90,15 +225,27 @@ class TrifectaAnalyzer(BaseAnalyzer):
             "min_second_favorite_odds": float(self.min_second_favorite_odds),
         }
 
-        log.info("Universal scoring complete", total_races_scored=len(scored_races), criteria=criteria)
+        log.info(
+            "Universal scoring complete",
+            total_races_scored=len(scored_races),
+            rescored=rescored,
+            changed=len(changed),
+            criteria=criteria,
+        )
 
         for race in scored_races:
             if race.qualification_score and race.qualification_score >= 85:
                 self.notifier.notify_qualified_race(race)
 
-        return {"criteria": criteria, "races": scored_races}
+        return {
+            "criteria": criteria,
+            "races": scored_races,
+            "changed": changed,
+            "rescored": rescored,
+            "revision": revision,
+        }
 
-    def _evaluate_race(self, race: Race) -> float:
+    def _evaluate_race(self, race: RaceRecord) -> float:
         """Evaluates a single race and returns a qualification score."""
         # --- Constants for Scoring Logic ---
         FAV_ODDS_NORMALIZATION = 10.0
@@ -145,18 +292,82 @@ class TrifectaAnalyzer(BaseAnalyzer):
 
         return round(final_score * 100, 2)
 
+    def score_store(self, store: "RaceStore") -> List[float]:
+        """
+        _evaluate_race for every race in the store at once, with identical
+        results: the same float operations run element-wise over the store's
+        columns instead of runner by runner.
+        """
+        import numpy as np
+
+        FAV_ODDS_NORMALIZATION = 10.0
+        SEC_FAV_ODDS_NORMALIZATION = 15.0
+        FAV_ODDS_WEIGHT = 0.6
+        SEC_FAV_ODDS_WEIGHT = 0.4
+        FIELD_SIZE_SCORE_WEIGHT = 0.3
+        ODDS_SCORE_WEIGHT = 0.7
+
+        # Each runner's best valid win price across sources (_get_best_win_odds); inf when it has none.
+        # Prices are exact Odds units / ODDS_SCALE, so they compare as the Odds themselves do.
+        win = store.win
+        valid = (win > 0) & (win < float(MAX_VALID_ODDS))
+        best = np.min(np.where(valid, win, np.inf), axis=1, initial=np.inf)
+        best[store.scratched] = np.inf
+
+        # The favourite and second favourite of each race: its smallest price, then the smallest
+        # once the first runner at that price is set aside.
+        offsets = store.runner_offsets
+        runner_races = store.runner_races
+        favorite_odds = _segment_min(best, offsets)
+        positions = np.where(best == favorite_odds[runner_races], np.arange(len(best)), len(best))
+        first_favorites = _segment_min(positions, offsets, empty=len(best))
+        without_favorite = best.copy()
+        without_favorite[first_favorites[first_favorites < len(best)]] = np.inf
+        second_favorite_odds = _segment_min(without_favorite, offsets)
+
+        active_runners = store.field_sizes
+        field_score = (self.max_field_size - active_runners) / self.max_field_size
+        fav_odds_score = np.minimum(favorite_odds / FAV_ODDS_NORMALIZATION, 1.0)
+        sec_fav_odds_score = np.minimum(second_favorite_odds / SEC_FAV_ODDS_NORMALIZATION, 1.0)
+        odds_score = (fav_odds_score * FAV_ODDS_WEIGHT) + (sec_fav_odds_score * SEC_FAV_ODDS_WEIGHT)
+        final_score = (field_score * FIELD_SIZE_SCORE_WEIGHT) + (odds_score * ODDS_SCORE_WEIGHT)
+
+        rejected = (
+            np.isinf(second_favorite_odds)  # fewer than two runners with odds
+            | (active_runners > self.max_field_size)
+            | (favorite_odds < float(self.min_favorite_odds))
+            | (second_favorite_odds < float(self.min_second_favorite_odds))
+        )
+        # Python's round, as _evaluate_race uses: numpy rounds halves differently.
+        scores = (final_score * 100).tolist()
+        return [0.0 if reject else round(score, 2) for reject, score in zip(rejected.tolist(), scores)]
+
+
+def _segment_min(values: "np.ndarray", offsets: "np.ndarray", empty: float = float("inf")) -> "np.ndarray":
+    """The minimum of values[offsets[i]:offsets[i + 1]] for each i; `empty` for empty segments."""
+    import numpy as np
+
+    starts, ends = offsets[:-1], offsets[1:]
+    result = np.full(len(starts), empty, dtype=values.dtype)
+    filled = ends > starts
+    if filled.any():
+        # reduceat runs each start to the next one, so only non-empty segments can be passed.
+        result[filled] = np.minimum.reduceat(values, starts[filled])
+    return result
+
 
 class AnalyzerEngine:
     """Discovers and manages all available analyzer plugins."""
 
     def __init__(self):
-        self.analyzers: Dict[str, Type[BaseAnalyzer]] = {}
+        self.analyzers: LazyPluginMap = LazyPluginMap()
+        self.score_cache = ScoreCache()
         self._discover_analyzers()
 
     def _discover_analyzers(self):
-        # In a real plugin system, this would inspect a folder.
-        # For now, we register them manually.
-        self.register_analyzer("trifecta", TrifectaAnalyzer)
+        # Analyzers are listed in the plugin registry and imported on first lookup.
+        for spec in get_registry().specs(ANALYZER):
+            self.analyzers[spec.name] = spec
         log.info("AnalyzerEngine discovered plugins", available_analyzers=list(self.analyzers.keys()))
 
     def register_analyzer(self, name: str, analyzer_class: Type[BaseAnalyzer]):
@@ -167,7 +378,9 @@ class AnalyzerEngine:
         if not analyzer_class:
             log.error("Requested analyzer not found", requested_analyzer=name)
             raise ValueError(f"Analyzer '{name}' not found.")
-        return analyzer_class(**kwargs)
+        analyzer = analyzer_class(**kwargs)
+        analyzer.score_cache = self.score_cache
+        return analyzer
 
 
 class AudioAlertSystem:
@@ -1,5 +1,6 @@
 # python_service/api.py
 
+import json
 from contextlib import asynccontextmanager
 from .logging_config import configure_logging
 from datetime import date
@@ -16,6 +17,7 @@ from fastapi import HTTPException
 from fastapi import Query
 from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from slowapi import Limiter
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
@@ -25,14 +27,19 @@ from slowapi.util import get_remote_address
 
 
 from .analyzer import AnalyzerEngine
+from .cache_manager import cache_manager
 from .config import get_settings
 from .engine import FortunaEngine
 from .health import router as health_router
 from .logging_config import configure_logging
+from .merge import RaceMergeIndex
 from .models import AggregatedResponse
 from .models import QualifiedRacesResponse
 from .models import TipsheetRace
+from .records import RaceRecord
+from .scheduler import RefreshScheduler
 from .security import verify_api_key
+from .utils.dates import race_day
 
 log = structlog.get_logger()
 
@@ -48,9 +55,18 @@ async def lifespan(app: FastAPI):
     """
     settings = get_settings()
     app.state.engine = FortunaEngine(config=settings)
+    cache_manager.start_invalidation_listener()
+    await app.state.engine.warm_start()
     app.state.analyzer_engine = AnalyzerEngine()
+    app.state.refresh_scheduler = None
+    if settings.REFRESH_SCHEDULER_ENABLED:
+        app.state.refresh_scheduler = RefreshScheduler(app.state.engine)
+        app.state.refresh_scheduler.start()
     log.info("Server startup: Configuration validated and FortunaEngine initialized.")
     yield
+    if app.state.refresh_scheduler is not None:
+        await app.state.refresh_scheduler.stop()
+    await cache_manager.stop_invalidation_listener()
     # Clean up the engine resources
     await app.state.engine.close()
     log.info("Server shutdown: HTTP client resources closed.")
@@ -129,6 +145,8 @@ async def get_all_adapter_statuses(
                                 "qualification_score": 95.5,
                             }
                         ],
+                        "revision": "5d41402abc4b2a76b9719d91",
+                        "changedRaceIds": ["12345_2025-10-14_1"],
                         "analyzer": "trifecta_analyzer",
                     }
                 }
@@ -148,6 +166,7 @@ async def get_qualified_races(
     max_field_size: Optional[int] = Query(None, description="Override the max field size for the analyzer."),
     min_favorite_odds: Optional[float] = Query(None, description="Override the min favorite odds."),
     min_second_favorite_odds: Optional[float] = Query(None, description="Override the min second favorite odds."),
+    since: Optional[str] = Query(None, description="The revision of an earlier response, to list what changed since."),
 ):
     """
     Gets all races for a given date, filters them for qualified betting
@@ -155,12 +174,13 @@ async def get_qualified_races(
     """
     try:
         if race_date is None:
-            race_date = datetime.now().date()
+            race_date = race_day()
         date_str = race_date.strftime("%Y-%m-%d")
         background_tasks = set()  # Dummy background tasks
         aggregated_data = await engine.get_races(date_str, background_tasks)
 
-        races = aggregated_data.get("races", [])
+        # Analyzers score race records, not the response dicts the engine caches.
+        races = [RaceRecord.from_dict(race) for race in aggregated_data.get("races", [])]
 
         analyzer_engine = request.app.state.analyzer_engine
         analyzer_params = {
@@ -171,8 +191,13 @@ async def get_qualified_races(
         custom_params = {k: v for k, v in analyzer_params.items() if v is not None}
 
         analyzer = analyzer_engine.get_analyzer(analyzer_name, **custom_params)
-        result = analyzer.qualify_races(races)
-        return QualifiedRacesResponse(**result)
+        result = analyzer.qualify_races(races, since=since, scope=date_str)
+        return QualifiedRacesResponse(
+            criteria=result["criteria"],
+            races=[race.to_model() for race in result["races"]],
+            revision=result.get("revision"),
+            changed_race_ids=result.get("changed", []),
+        )
     except ValueError as e:
         log.warning("Requested analyzer not found", analyzer_name=analyzer_name)
         raise HTTPException(status_code=404, detail=str(e))
@@ -192,7 +217,7 @@ async def get_races(
 ):
     try:
         if race_date is None:
-            race_date = datetime.now().date()
+            race_date = race_day()
         date_str = race_date.strftime("%Y-%m-%d")
         background_tasks = set()  # Dummy background tasks
         aggregated_data = await engine.get_races(date_str, background_tasks, source)
@@ -202,11 +227,49 @@ async def get_races(
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
+@app.get("/api/races/stream")
+@limiter.limit("30/minute")
+async def stream_races(
+    request: Request,
+    race_date: Optional[date] = None,
+    source: Optional[str] = None,
+    engine: FortunaEngine = Depends(get_engine),
+    _=Depends(verify_api_key),
+):
+    """
+    Streams races as newline-delimited JSON, one line per adapter as soon as it
+    completes, so clients can render fast sources without waiting for the slowest.
+    Each line carries the merged state of every race that adapter touched, so
+    clients can simply replace races by id.
+    """
+    if race_date is None:
+        race_date = race_day()
+    date_str = race_date.strftime("%Y-%m-%d")
+
+    async def _ndjson_lines():
+        try:
+            merge_index = RaceMergeIndex()
+            async for partial in engine.stream_races(date_str, source_filter=source, merge_index=merge_index):
+                line = {
+                    "sourceInfo": partial["source_info"],
+                    "races": [
+                        race.to_model().model_dump(mode="json", by_alias=True) for race in partial["merged_races"]
+                    ],
+                    "completed": partial["completed"],
+                    "total": partial["total"],
+                }
+                yield json.dumps(line, default=str) + "\n"
+        except Exception:
+            log.error("Error in /api/races/stream", exc_info=True)
+
+    return StreamingResponse(_ndjson_lines(), media_type="application/x-ndjson")
+
+
 DB_PATH = "fortuna.db"
 
 
 def get_current_date() -> date:
-    return datetime.now().date()
+    return race_day()
 
 
 @app.get("/api/tipsheet", response_model=List[TipsheetRace])
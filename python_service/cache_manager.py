@@ -1,17 +1,30 @@
 # python_service/cache_manager.py
+import asyncio
 import hashlib
 import json
+import math
 import os
-from datetime import datetime
-from datetime import timedelta
+import random
+import time
+import uuid
 from functools import wraps
 from typing import Any
+from typing import Awaitable
 from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
 
 import structlog
 
+from .core.codec import CacheCodec
+from .core.codec import CodecError
+from .core.ttl_cache import BoundedTTLCache
+
 try:
     import redis
+    import redis.asyncio as redis_asyncio
 
     REDIS_AVAILABLE = True
 except ImportError:
@@ -19,14 +32,61 @@ except ImportError:
 
 log = structlog.get_logger(__name__)
 
+# Workers announce the keys they rewrite in Redis here, so the others drop their L1 copies.
+INVALIDATION_CHANNEL = "fortuna:cache:invalidate"
 
 class CacheManager:
-    def __init__(self, redis_url: str = None):
+    """
+    A two-tier cache: a bounded in-process L1 of decoded objects in front of
+    Redis (L2), which holds the values encoded by `codec`. Reads try L1 first
+    and fill it from L2. Writes go to both tiers and announce the rewritten keys
+    on INVALIDATION_CHANNEL, so other workers running the invalidation listener
+    drop their outdated L1 copies. With Redis configured, L1 keeps an entry for
+    at most `l1_ttl_seconds`, which bounds staleness if an announcement is
+    missed; without Redis, L1 is the whole cache. Values served from L1 are
+    shared between callers and must not be mutated.
+
+    Every operation has a synchronous form (for threaded callers such as
+    checkmate_service) and an `a`-prefixed asyncio form for use on the event
+    loop. The asyncio forms share a connection pool, give Redis at most
+    `redis_timeout` seconds, and fall back to L1 alone on timeouts or errors;
+    after a failure Redis is skipped for `redis_retry_seconds`, so an outage
+    does not cost a timeout on every call.
+    """
+
+    def __init__(
+        self,
+        redis_url: str = None,
+        memory_max_entries: int = 1024,
+        memory_max_bytes: int = 64 * 2**20,
+        redis_timeout: float = 0.25,
+        redis_max_connections: int = 20,
+        redis_retry_seconds: float = 5.0,
+        codec: Optional[CacheCodec] = None,
+        l1_ttl_seconds: float = 60.0,
+    ):
+        self.codec = codec or CacheCodec()
+        self.l1_ttl_seconds = l1_ttl_seconds
+        self.instance_id = uuid.uuid4().hex
+        # Bumped on every invalidation, so an L2 read that raced one does not refill L1 with the old value.
+        self._invalidation_epoch = 0
+        self._listener: Optional[asyncio.Task] = None
         self.redis_client = None
-        self.memory_cache = {}
+        self.async_redis_client = None
+        self.redis_timeout = redis_timeout
+        self.redis_retry_seconds = redis_retry_seconds
+        self._async_redis_down_until = 0.0
+        # L1, bounded so long-running services keep a fixed ceiling.
+        self.memory_cache = BoundedTTLCache(max_entries=memory_max_entries, max_bytes=memory_max_bytes)
         if REDIS_AVAILABLE and redis_url:
             try:
-                self.redis_client = redis.from_url(redis_url, decode_responses=True)
+                self.redis_client = redis.from_url(redis_url)
+                self.async_redis_client = redis_asyncio.from_url(
+                    redis_url,
+                    max_connections=redis_max_connections,
+                    socket_timeout=redis_timeout,
+                    socket_connect_timeout=redis_timeout,
+                )
                 log.info("Redis cache connected successfully.")
             except Exception as e:
                 log.warning(f"Failed to connect to Redis: {e}. Falling back to in-memory cache.")
@@ -35,52 +95,473 @@ class CacheManager:
         key_data = f"{prefix}:{args}:{sorted(kwargs.items())}"
         return hashlib.md5(key_data.encode()).hexdigest()
 
+    @staticmethod
+    def _envelope(value: Any, ttl_seconds: float, stale_ttl_seconds: float, delta: float) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            "_envelope": 1,
+            "value": value,
+            "fresh_until": now + ttl_seconds,
+            "retain_until": now + ttl_seconds + stale_ttl_seconds,
+            "delta": delta,
+        }
+
+    def _decode_entry(self, raw: Optional[bytes]) -> Dict[str, Any] | None:
+        if not raw:
+            return None
+        try:
+            stored = self.codec.decode(raw)
+        except CodecError as e:
+            log.warning(f"Unreadable cache entry: {e}")
+            return None
+        if isinstance(stored, dict) and stored.get("_envelope"):
+            return stored
+        # A plain value written before entries carried metadata; treat it as fresh.
+        return {"value": stored, "fresh_until": float("inf"), "delta": 0.0}
+
+    def _remember(self, key: str, envelope: Dict[str, Any]):
+        """Keeps an entry in L1 until it would leave L2, or for at most l1_ttl_seconds when L2 exists."""
+        retention = envelope.get("retain_until", float("inf")) - time.time()
+        if self.redis_client or self.async_redis_client:
+            retention = min(retention, self.l1_ttl_seconds)
+        entry = {"value": envelope["value"], "fresh_until": envelope["fresh_until"], "delta": envelope["delta"]}
+        self.memory_cache.set(key, entry, retention)
+
+    def _announcement(self, keys: List[str]) -> str:
+        return json.dumps([self.instance_id, keys])
+
+    def apply_invalidation(self, announcement: Any):
+        """Drops the L1 entries another worker announced it has rewritten."""
+        try:
+            origin, keys = json.loads(announcement)
+        except (TypeError, ValueError):
+            log.warning("Malformed cache invalidation", announcement=announcement)
+            return
+        if origin == self.instance_id:
+            return
+        self._invalidation_epoch += 1
+        for key in keys:
+            self.memory_cache.pop(key)
+
+    # --- Synchronous interface ---
+
     def get(self, key: str) -> Any | None:
+        """Returns the cached value if it is still fresh."""
+        entry = self.get_entry(key)
+        if entry and entry["fresh_until"] > time.time():
+            return entry["value"]
+        return None
+
+    def set(self, key: str, value: Any, ttl_seconds: int = 300):
+        self.set_entry(key, value, ttl_seconds)
+
+    def get_entry(self, key: str) -> Dict[str, Any] | None:
+        """
+        Returns the stored entry, fresh or stale, as a dict with the cached `value`,
+        the epoch time it stays fresh until (`fresh_until`) and how long it took to
+        compute (`delta`).
+        """
+        entry = self.memory_cache.get(key)
+        if entry is not None or not self.redis_client:
+            return entry
+        epoch = self._invalidation_epoch
+        try:
+            entry = self._decode_entry(self.redis_client.get(key))
+        except Exception as e:
+            log.warning(f"Redis GET failed: {e}")
+            return None
+        if entry is not None and epoch == self._invalidation_epoch:
+            self._remember(key, entry)
+        return entry
+
+    def set_entry(self, key: str, value: Any, ttl_seconds: float, stale_ttl_seconds: float = 0, delta: float = 0.0):
+        """
+        Stores a value that is fresh for `ttl_seconds` and may then be served stale
+        for a further `stale_ttl_seconds` while it is being refreshed.
+        """
+        envelope = self._envelope(value, ttl_seconds, stale_ttl_seconds, delta)
+        self._remember(key, envelope)
         if self.redis_client:
             try:
-                value = self.redis_client.get(key)
-                return json.loads(value) if value else None
+                with self.redis_client.pipeline(transaction=False) as pipe:
+                    pipe.setex(key, max(1, math.ceil(ttl_seconds + stale_ttl_seconds)), self.codec.encode(envelope))
+                    pipe.publish(INVALIDATION_CHANNEL, self._announcement([key]))
+                    pipe.execute()
             except Exception as e:
-                log.warning(f"Redis GET failed: {e}")
+                log.warning(f"Redis SET failed: {e}")
 
-        entry = self.memory_cache.get(key)
-        if entry and entry["expires_at"] > datetime.now():
+    def acquire_lock(self, key: str, ttl_seconds: int) -> Optional[str]:
+        """
+        Tries to take the distributed computation lock for a cache key. Returns an
+        ownership token, or None if another worker currently holds the lock. Without
+        Redis (or if Redis fails) there is nobody to coordinate with, so the lock is
+        always granted.
+        """
+        token = uuid.uuid4().hex
+        if not self.redis_client:
+            return token
+        try:
+            if self.redis_client.set(f"lock:{key}", token, nx=True, ex=ttl_seconds):
+                return token
+            return None
+        except Exception as e:
+            log.warning(f"Redis lock acquisition failed: {e}")
+            return token
+
+    def release_lock(self, key: str, token: str):
+        if not self.redis_client:
+            return
+        lock_key = f"lock:{key}"
+        try:
+            # Compare-and-delete in a WATCH transaction, so a worker whose lock already
+            # expired never releases a lock another worker has since acquired.
+            with self.redis_client.pipeline() as pipe:
+                pipe.watch(lock_key)
+                if pipe.get(lock_key) == token.encode():
+                    pipe.multi()
+                    pipe.delete(lock_key)
+                    pipe.execute()
+                else:
+                    pipe.unwatch()
+        except redis.WatchError:
+            pass
+        except Exception as e:
+            log.warning(f"Redis lock release failed: {e}")
+
+    def is_locked(self, key: str) -> bool:
+        if not self.redis_client:
+            return False
+        try:
+            return bool(self.redis_client.exists(f"lock:{key}"))
+        except Exception as e:
+            log.warning(f"Redis lock check failed: {e}")
+            return False
+
+    # --- Asyncio interface ---
+
+    async def _redis_call(self, operation: str, call: Callable[[Any], Awaitable[Any]]) -> Any:
+        """
+        Runs `call(client)` against the async Redis client within the timeout.
+        Raises LookupError when Redis is not configured, is in its retry pause, or
+        the call fails, so callers can fall back to the local tier.
+        """
+        if self.async_redis_client is None or time.monotonic() < self._async_redis_down_until:
+            raise LookupError(operation)
+        try:
+            return await asyncio.wait_for(call(self.async_redis_client), self.redis_timeout)
+        except Exception as e:
+            self._async_redis_down_until = time.monotonic() + self.redis_retry_seconds
+            log.warning(f"Redis {operation} failed: {e!r}. Using the in-memory cache.")
+            raise LookupError(operation) from e
+
+    async def aget(self, key: str) -> Any | None:
+        """Returns the cached value if it is still fresh."""
+        entry = await self.aget_entry(key)
+        if entry and entry["fresh_until"] > time.time():
             return entry["value"]
         return None
 
-    def set(self, key: str, value: Any, ttl_seconds: int = 300):
-        serialized = json.dumps(value, default=str)
-        if self.redis_client:
+    async def aset(self, key: str, value: Any, ttl_seconds: int = 300):
+        await self.aset_entry(key, value, ttl_seconds)
+
+    async def aget_entry(self, key: str) -> Dict[str, Any] | None:
+        return (await self.aget_entries([key]))[key]
+
+    async def aget_entries(self, keys: List[str]) -> Dict[str, Dict[str, Any] | None]:
+        """Fetches several entries as get_entry would for each, with the L1 misses in one round trip (MGET)."""
+        entries = {key: self.memory_cache.get(key) for key in keys}
+        missing = [key for key, entry in entries.items() if entry is None]
+        if not missing:
+            return entries
+        epoch = self._invalidation_epoch
+        try:
+            raws = await self._redis_call("MGET", lambda client: client.mget(missing))
+        except LookupError:
+            return entries
+        for key, raw in zip(missing, raws):
+            entry = entries[key] = self._decode_entry(raw)
+            if entry is not None and epoch == self._invalidation_epoch:
+                self._remember(key, entry)
+        return entries
+
+    async def aget_many(self, keys: List[str]) -> Dict[str, Any]:
+        """The fresh values among `keys`, fetched in one round trip."""
+        now = time.time()
+        entries = await self.aget_entries(keys)
+        return {key: entry["value"] for key, entry in entries.items() if entry and entry["fresh_until"] > now}
+
+    async def aset_entry(
+        self, key: str, value: Any, ttl_seconds: float, stale_ttl_seconds: float = 0, delta: float = 0.0
+    ):
+        await self.aset_entries([(key, value, ttl_seconds, stale_ttl_seconds, delta)])
+
+    async def aset_entries(self, entries: List[Tuple[str, Any, float, float, float]]):
+        """
+        Stores several (key, value, ttl_seconds, stale_ttl_seconds, delta) entries,
+        pipelined into one round trip.
+        """
+        prepared = [
+            (key, self._envelope(value, ttl, stale_ttl, delta), ttl + stale_ttl)
+            for key, value, ttl, stale_ttl, delta in entries
+        ]
+        for key, envelope, _ in prepared:
+            self._remember(key, envelope)
+
+        async def _write(client):
+            async with client.pipeline(transaction=False) as pipe:
+                for key, envelope, retention in prepared:
+                    pipe.setex(key, max(1, math.ceil(retention)), self.codec.encode(envelope))
+                pipe.publish(INVALIDATION_CHANNEL, self._announcement([key for key, _, _ in prepared]))
+                return await pipe.execute()
+
+        try:
+            await self._redis_call("SET", _write)
+        except LookupError:
+            pass
+
+    async def adelete(self, keys: List[str]):
+        """Drops entries from both tiers and tells the other workers to drop their L1 copies."""
+        # As for an announced invalidation, so an L2 read racing this one does not refill L1.
+        self._invalidation_epoch += 1
+        for key in keys:
+            self.memory_cache.pop(key)
+
+        async def _delete(client):
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.delete(*keys)
+                pipe.publish(INVALIDATION_CHANNEL, self._announcement(keys))
+                return await pipe.execute()
+
+        try:
+            await self._redis_call("DELETE", _delete)
+        except LookupError:
+            pass
+
+    async def aacquire_lock(self, key: str, ttl_seconds: int) -> Optional[str]:
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self._redis_call(
+                "lock acquisition", lambda client: client.set(f"lock:{key}", token, nx=True, ex=ttl_seconds)
+            )
+        except LookupError:
+            return token
+        return token if acquired else None
+
+    async def arelease_lock(self, key: str, token: str):
+        lock_key = f"lock:{key}"
+
+        async def _release(client):
+            # Compare-and-delete, as in release_lock.
+            try:
+                async with client.pipeline() as pipe:
+                    await pipe.watch(lock_key)
+                    if await pipe.get(lock_key) == token.encode():
+                        pipe.multi()
+                        pipe.delete(lock_key)
+                        await pipe.execute()
+                    else:
+                        await pipe.unwatch()
+            except redis.WatchError:
+                pass
+
+        try:
+            await self._redis_call("lock release", _release)
+        except LookupError:
+            pass
+
+    async def ais_locked(self, key: str) -> bool:
+        try:
+            return bool(await self._redis_call("lock check", lambda client: client.exists(f"lock:{key}")))
+        except LookupError:
+            return False
+
+    async def run_invalidation_listener(self):
+        """
+        Applies other workers' invalidation announcements until cancelled,
+        resubscribing after connection failures. Announcements sent while
+        disconnected are lost, so L1 is emptied on every resubscription.
+        """
+        subscribed_before = False
+        while self.async_redis_client is not None:
+            pubsub = self.async_redis_client.pubsub(ignore_subscribe_messages=True)
             try:
-                self.redis_client.setex(key, ttl_seconds, serialized)
-                return
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                if subscribed_before:
+                    self._invalidation_epoch += 1
+                    self.memory_cache.clear()
+                subscribed_before = True
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                log.warning(f"Redis SET failed: {e}")
+                log.warning(f"Cache invalidation listener failed: {e!r}. Resubscribing.")
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(self.redis_retry_seconds)
+
+    def start_invalidation_listener(self):
+        if self._listener is None and self.async_redis_client is not None:
+            self._listener = asyncio.create_task(self.run_invalidation_listener())
+
+    async def stop_invalidation_listener(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+    async def wait_for_value(self, key: str, timeout_seconds: float, poll_interval: float = 0.1) -> Any | None:
+        """Polls for a value another worker is computing, until it lands or the worker gives up its lock."""
+        deadline = time.monotonic() + timeout_seconds
+        while time.monotonic() < deadline:
+            value = await self.aget(key)
+            if value is not None:
+                return value
+            if not await self.ais_locked(key):
+                return await self.aget(key)
+            await asyncio.sleep(poll_interval)
+        return None
 
-        self.memory_cache[key] = {"value": value, "expires_at": datetime.now() + timedelta(seconds=ttl_seconds)}
+
+class SingleFlight:
+    """
+    Coalesces concurrent computations of the same key within this process: the
+    first caller starts the computation as a task and every caller, including the
+    first, awaits that task. Running it as a separate task means a cancelled caller
+    (e.g. a disconnected client) does not cancel the computation for the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = self._start(key, compute)
+        return await asyncio.shield(task)
+
+    def run_in_background(self, key: str, compute: Callable[[], Awaitable[Any]]):
+        """Starts the computation for `key` without waiting for it, unless one is already in flight."""
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            self._start(key, compute)
+
+    def _start(self, key: str, compute: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = asyncio.ensure_future(compute())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        return task
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved; every waiter has already re-raised it.
+            task.exception()
 
 
 # --- Singleton Instance & Decorator ---
-cache_manager = CacheManager(redis_url=os.getenv("REDIS_URL"))
+cache_manager = CacheManager(
+    redis_url=os.getenv("REDIS_URL"),
+    memory_max_entries=int(os.getenv("MEMORY_CACHE_MAX_ENTRIES", 1024)),
+    memory_max_bytes=int(os.getenv("MEMORY_CACHE_MAX_BYTES", 64 * 2**20)),
+    codec=CacheCodec(format=os.getenv("CACHE_FORMAT"), compression=os.getenv("CACHE_COMPRESSION")),
+)
+single_flight = SingleFlight()
+
 
+def _should_refresh_early(entry: Dict[str, Any], now: float, beta: float) -> bool:
+    """
+    Probabilistic early expiration (XFetch): refresh with a probability that rises
+    as expiry approaches, scaled by how long the value took to compute.
+    """
+    delta = entry.get("delta") or 0.0
+    return now - delta * beta * math.log(1.0 - random.random()) >= entry["fresh_until"]
+
+
+def cache_async_result(
+    ttl_seconds: int = 300,
+    key_prefix: str = "cache",
+    lock_timeout_seconds: int = 120,
+    stale_ttl_seconds: int = 0,
+    early_refresh_beta: float = 0.0,
+):
+    """
+    Caches an async function's result. Concurrent misses for the same key are
+    coalesced: within a process through SingleFlight, and across workers through a
+    Redis lock, so only one caller per key runs the wrapped function while the
+    others wait for its result.
+
+    With `stale_ttl_seconds`, an expired value keeps being served for that long
+    while a single background refresh replaces it. With `early_refresh_beta` > 0,
+    fresh values are also refreshed in the background shortly before they expire,
+    so hot keys rarely go stale at all.
+    """
 
-def cache_async_result(ttl_seconds: int = 300, key_prefix: str = "cache"):
     def decorator(func: Callable):
+        def cache_key_for(*args, **kwargs) -> str:
+            instance_args = args[1:] if args and hasattr(args[0], func.__name__) else args
+            return cache_manager._generate_key(f"{key_prefix}:{func.__name__}", *instance_args, **kwargs)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            instance_args = args[1:] if args and hasattr(args[0], func.__name__) else args
-            cache_key = cache_manager._generate_key(f"{key_prefix}:{func.__name__}", *instance_args, **kwargs)
+            cache_key = cache_key_for(*args, **kwargs)
+            # Background refreshes resolve to None when they fail or another worker has the lock, so
+            # they are coalesced apart from foreground misses, which must get a value or an error.
+            refresh_key = f"{cache_key}:refresh"
+
+            async def _compute(in_background: bool = False):
+                token = await cache_manager.aacquire_lock(cache_key, lock_timeout_seconds)
+                if token is None:
+                    if in_background:
+                        # Another worker is already refreshing this key.
+                        return None
+                    log.debug("Waiting for another worker to fill cache", function=func.__name__)
+                    shared_result = await cache_manager.wait_for_value(cache_key, lock_timeout_seconds)
+                    if shared_result is not None:
+                        return shared_result
+                try:
+                    started = time.monotonic()
+                    result = await func(*args, **kwargs)
+                    await cache_manager.aset_entry(
+                        cache_key, result, ttl_seconds, stale_ttl_seconds, delta=time.monotonic() - started
+                    )
+                    return result
+                except Exception:
+                    if in_background:
+                        log.warning("Background cache refresh failed", function=func.__name__, exc_info=True)
+                        return None
+                    raise
+                finally:
+                    if token is not None:
+                        await cache_manager.arelease_lock(cache_key, token)
 
-            cached_result = cache_manager.get(cache_key)
-            if cached_result is not None:
-                log.debug("Cache hit", function=func.__name__)
-                return cached_result
+            entry = await cache_manager.aget_entry(cache_key)
+            if entry is not None:
+                now = time.time()
+                if now < entry["fresh_until"]:
+                    if early_refresh_beta > 0 and _should_refresh_early(entry, now, early_refresh_beta):
+                        log.debug("Refreshing cache entry early", function=func.__name__)
+                        single_flight.run_in_background(refresh_key, lambda: _compute(in_background=True))
+                    log.debug("Cache hit", function=func.__name__)
+                    return entry["value"]
+                if stale_ttl_seconds > 0:
+                    log.debug("Serving stale cache entry while revalidating", function=func.__name__)
+                    single_flight.run_in_background(refresh_key, lambda: _compute(in_background=True))
+                    return entry["value"]
 
             log.debug("Cache miss", function=func.__name__)
-            result = await func(*args, **kwargs)
-            cache_manager.set(cache_key, result, ttl_seconds)
-            return result
+            return await single_flight.run(cache_key, _compute)
 
+        # The key a call with these arguments is cached under, e.g. for seeding the cache.
+        wrapper.cache_key_for = cache_key_for
         return wrapper
 
     return decorator
@@ -1,7 +1,7 @@
 # python_service/config.py
 import os
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 import structlog
@@ -50,11 +50,43 @@ class Settings(BaseSettings):
     REDIS_URL: str = "redis://localhost:6379"
     CACHE_TTL_SECONDS: int = 1800  # 30 minutes
     MAX_CONCURRENT_REQUESTS: int = 10
+    MAX_REQUESTS_PER_HOST: int = 4
+    HOST_REQUESTS_PER_SECOND: float = 5.0
     HTTP_POOL_CONNECTIONS: int = 100
     HTTP_POOL_MAXSIZE: int = 100
     HTTP_MAX_KEEPALIVE: int = 50
+    HTTP_CACHE_MAX_ENTRIES: int = 256  # URLs per adapter kept for ETag/Last-Modified revalidation
+    HTTP_CACHE_MAX_BYTES: int = 16 * 2**20  # Response bytes per adapter kept for revalidation
+    HTTP_RECORD_PATH: Optional[str] = None  # Record all adapter traffic to this archive
+    HTTP_REPLAY_PATH: Optional[str] = None  # Serve adapter traffic from this archive instead of the network
+    HTTP_REPLAY_LATENCY_SCALE: float = 1.0
+    PARSE_WORKERS: int = 2  # Processes for HTML parsing; 0 parses on the event loop
+    PIPELINE_FETCH_WORKERS: int = 6  # Concurrent page fetches per adapter
+    PIPELINE_QUEUE_SIZE: int = 4  # Fetched pages allowed to wait for a parser
     DEFAULT_TIMEOUT: int = 30
     ADAPTER_TIMEOUT: int = 20
+    ADAPTER_TIMEOUT_GRACE_SECONDS: float = 2.0
+    SOURCE_CACHE_TTL_SECONDS: int = 300
+    PARTIAL_CACHE_TTL_SECONDS: int = 30  # Results truncated by their budget; never replace a complete one
+    REFRESH_SCHEDULER_ENABLED: bool = False
+    # Where to keep the last good race set, served on warm start. Off unless set, e.g. under a data directory.
+    SNAPSHOT_PATH: Optional[str] = None
+    SNAPSHOT_MAX_AGE_SECONDS: int = 43200  # Older snapshots are not served
+    # A failed source is not fetched again for this long, by ErrorCategory name; 0 disables it.
+    FAILURE_TTL_SECONDS: Dict[str, int] = {
+        "CONFIGURATION_ERROR": 3600,
+        "CLIENT_ERROR": 900,
+        "SERVER_ERROR": 120,
+        "TIMEOUT_ERROR": 60,
+        "NETWORK_ERROR": 60,
+        "PARSING_ERROR": 300,
+        "UNEXPECTED_ERROR": 120,
+    }
+    REFRESH_BUDGET_PER_MINUTE: int = 30
+    HEDGED_REQUESTS_ENABLED: bool = False
+    HEDGE_LATENCY_PERCENTILE: float = 95.0
+    HEDGE_MIN_SAMPLES: int = 20
+    HEDGE_DEFAULT_DELAY_SECONDS: float = 2.0
 
     # --- Logging ---
     LOG_LEVEL: str = "INFO"
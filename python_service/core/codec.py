@@ -0,0 +1,225 @@
+# python_service/core/codec.py
+# Serialization and compression of cached values, tagged with a one-byte header.
+import json
+import zlib
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from typing import Optional
+from typing import Union
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+# The header byte is FORMAT | COMPRESSION << 2. Every combination is below 0x20, so
+# untagged JSON written before this codec existed is recognised by its first byte,
+# except that 0x09, 0x0a and 0x0d (json+zstd, msgpack+zstd, json+lz4) are also JSON
+# whitespace. Those compressors always open with a frame magic number, which JSON
+# never does, so a whitespace byte not followed by one is legacy JSON.
+FORMAT_JSON = 1
+FORMAT_MSGPACK = 2
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+COMPRESSION_LZ4 = 3
+
+FORMATS = {"json": FORMAT_JSON, "msgpack": FORMAT_MSGPACK}
+COMPRESSIONS = {"none": COMPRESSION_NONE, "zlib": COMPRESSION_ZLIB, "zstd": COMPRESSION_ZSTD, "lz4": COMPRESSION_LZ4}
+
+# msgpack extension type codes; JSON uses single-key objects with the same names.
+_EXT_DATETIME = 1
+_EXT_DATE = 2
+_EXT_DECIMAL = 3
+_JSON_TAGS = {"$datetime": datetime.fromisoformat, "$date": date.fromisoformat, "$decimal": Decimal}
+
+_JSON_WHITESPACE = b" \t\n\r"
+_FRAME_MAGIC = {COMPRESSION_ZSTD: b"\x28\xb5\x2f\xfd", COMPRESSION_LZ4: b"\x04\x22\x4d\x18"}
+
+
+class CodecError(ValueError):
+    """A cached payload is corrupt or was written with a codec this process lacks."""
+
+
+def _simplify(value: Any) -> Any:
+    """Reduces values neither format knows to something it does, as json's default=str used to."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$decimal": str(value)}
+    return _simplify(value)
+
+
+def _json_object_hook(obj: dict) -> Any:
+    if len(obj) == 1:
+        tag, text = next(iter(obj.items()))
+        restore = _JSON_TAGS.get(tag)
+        if restore is not None:
+            return restore(text)
+    return obj
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode())
+    if isinstance(value, date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+    if isinstance(value, Decimal):
+        return msgpack.ExtType(_EXT_DECIMAL, str(value).encode())
+    return _simplify(value)
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return date.fromisoformat(data.decode())
+    if code == _EXT_DECIMAL:
+        return Decimal(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def _available(format_id: int, compression_id: int) -> bool:
+    if format_id == FORMAT_MSGPACK and not MSGPACK_AVAILABLE:
+        return False
+    if compression_id == COMPRESSION_ZSTD and not ZSTD_AVAILABLE:
+        return False
+    if compression_id == COMPRESSION_LZ4 and not LZ4_AVAILABLE:
+        return False
+    return format_id in FORMATS.values() and compression_id in COMPRESSIONS.values()
+
+
+def _is_legacy_json(payload: bytes) -> bool:
+    header = payload[0]
+    if header >= 0x20:
+        return True
+    if header not in _JSON_WHITESPACE:
+        return False
+    return not payload[1:].startswith(_FRAME_MAGIC[header >> 2])
+
+
+class CacheCodec:
+    """
+    Turns cached values into bytes and back. Datetimes, dates and Decimals
+    round-trip with their types; other unknown values are stored as their
+    model_dump() or str(), as before. Payloads of at least `compress_threshold`
+    bytes are compressed. The first byte records the format and compression a
+    payload was written with, so a reader decodes whatever a writer with a
+    different configuration stored.
+
+    By default the fastest installed options are used: msgpack over JSON, and
+    zstd, then LZ4, then zlib for compression.
+    """
+
+    def __init__(
+        self,
+        format: Optional[str] = None,
+        compression: Optional[str] = None,
+        compress_threshold: int = 1024,
+        level: Optional[int] = None,
+    ):
+        self.format = FORMATS[format] if format else (FORMAT_MSGPACK if MSGPACK_AVAILABLE else FORMAT_JSON)
+        if compression:
+            self.compression = COMPRESSIONS[compression]
+        elif ZSTD_AVAILABLE:
+            self.compression = COMPRESSION_ZSTD
+        elif LZ4_AVAILABLE:
+            self.compression = COMPRESSION_LZ4
+        else:
+            self.compression = COMPRESSION_ZLIB
+        if not _available(self.format, self.compression):
+            raise ValueError(f"Cache codec {format or 'default'}+{compression or 'default'} is not installed.")
+        self.compress_threshold = compress_threshold
+        self.level = level
+        if self.compression == COMPRESSION_ZSTD:
+            self._zstd_compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        if ZSTD_AVAILABLE:
+            self._zstd_decompressor = zstandard.ZstdDecompressor()
+
+    @property
+    def name(self) -> str:
+        format_name = next(name for name, value in FORMATS.items() if value == self.format)
+        compression_name = next(name for name, value in COMPRESSIONS.items() if value == self.compression)
+        return f"{format_name}+{compression_name}"
+
+    def encode(self, value: Any) -> bytes:
+        if self.format == FORMAT_MSGPACK:
+            body = msgpack.packb(value, default=_msgpack_default, use_bin_type=True, datetime=False)
+        else:
+            body = json.dumps(value, default=_json_default, separators=(",", ":")).encode()
+        compression = self.compression if len(body) >= self.compress_threshold else COMPRESSION_NONE
+        return bytes((self.format | compression << 2,)) + self._compress(compression, body)
+
+    def decode(self, payload: Union[bytes, str]) -> Any:
+        if isinstance(payload, str):
+            payload = payload.encode()
+        if not payload:
+            raise CodecError("empty payload")
+        header = payload[0]
+        if _is_legacy_json(payload):
+            # Untagged JSON, as stored before the codec existed.
+            return self._loads(FORMAT_JSON, payload)
+        format_id, compression_id = header & 0b11, header >> 2
+        if not _available(format_id, compression_id):
+            raise CodecError(f"unsupported cache payload header {header:#04x}")
+        try:
+            return self._loads(format_id, self._decompress(compression_id, payload[1:]))
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(str(e)) from e
+
+    def _compress(self, compression: int, body: bytes) -> bytes:
+        if compression == COMPRESSION_ZSTD:
+            return self._zstd_compressor.compress(body)
+        if compression == COMPRESSION_LZ4:
+            return lz4.frame.compress(body, compression_level=self.level or 0)
+        if compression == COMPRESSION_ZLIB:
+            return zlib.compress(body, 6 if self.level is None else self.level)
+        return body
+
+    def _decompress(self, compression: int, body: bytes) -> bytes:
+        if compression == COMPRESSION_ZSTD:
+            return self._zstd_decompressor.decompress(body)
+        if compression == COMPRESSION_LZ4:
+            return lz4.frame.decompress(body)
+        if compression == COMPRESSION_ZLIB:
+            return zlib.decompress(body)
+        return body
+
+    @staticmethod
+    def _loads(format_id: int, body: bytes) -> Any:
+        try:
+            if format_id == FORMAT_MSGPACK:
+                return msgpack.unpackb(body, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False)
+            return json.loads(body, object_hook=_json_object_hook)
+        except Exception as e:
+            raise CodecError(str(e)) from e
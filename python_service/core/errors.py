@@ -1,8 +1,33 @@
 # python_service/core/errors.py
 from enum import Enum
 
+import httpx
+
 class ErrorCategory(Enum):
     CONFIGURATION_ERROR = "Configuration missing or invalid"
     NETWORK_ERROR = "HTTP/Network request failed"
+    CLIENT_ERROR = "HTTP request rejected (4xx)"
+    SERVER_ERROR = "Upstream server error (5xx)"
+    TIMEOUT_ERROR = "Request or fetch timed out"
     PARSING_ERROR = "Data parsing or validation unsuccessful"
-    UNEXPECTED_ERROR = "An unhandled exception occurred"
\ No newline at end of file
+    UNEXPECTED_ERROR = "An unhandled exception occurred"
+
+
+def classify_http_error(exc: Exception) -> ErrorCategory:
+    """Maps an exception raised while talking to a source to an ErrorCategory."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        if status in (408, 429) or status >= 500:
+            # Throttling and request timeouts pass like server trouble does.
+            return ErrorCategory.SERVER_ERROR
+        return ErrorCategory.CLIENT_ERROR
+    if isinstance(exc, (httpx.TimeoutException, TimeoutError)):
+        return ErrorCategory.TIMEOUT_ERROR
+    if isinstance(exc, httpx.RequestError):
+        return ErrorCategory.NETWORK_ERROR
+    return ErrorCategory.UNEXPECTED_ERROR
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Whether a failed request may succeed if sent again; 4xx rejections other than 408/429 will not."""
+    return not (isinstance(exc, Exception) and classify_http_error(exc) is ErrorCategory.CLIENT_ERROR)
@@ -0,0 +1,58 @@
+# python_service/core/fetch_context.py
+# Per-fetch state shared between FortunaEngine and the adapters it drives.
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator
+from typing import Optional
+
+from .errors import ErrorCategory
+
+
+@dataclass
+class FetchContext:
+    """
+    Describes a single adapter fetch. The engine creates one per adapter call and
+    installs it in a context variable, so BaseAdapter.make_request can read the
+    remaining wall-clock budget without threading it through every signature.
+    `failure` records the category of the last request that failed for good,
+    which adapters otherwise only report as a missing response.
+    """
+
+    source_name: str
+    deadline: Optional[float] = None  # time.monotonic() value
+    truncated: bool = False
+    failure: Optional[ErrorCategory] = None
+
+    @classmethod
+    def with_budget(cls, source_name: str, budget_seconds: Optional[float]) -> "FetchContext":
+        deadline = time.monotonic() + budget_seconds if budget_seconds else None
+        return cls(source_name=source_name, deadline=deadline)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the budget, or None if the fetch is unbounded."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+
+_current_fetch: ContextVar[Optional[FetchContext]] = ContextVar("current_fetch", default=None)
+
+
+def current_fetch_context() -> Optional[FetchContext]:
+    return _current_fetch.get()
+
+
+@contextmanager
+def fetch_context(context: FetchContext) -> Iterator[FetchContext]:
+    token = _current_fetch.set(context)
+    try:
+        yield context
+    finally:
+        _current_fetch.reset(token)
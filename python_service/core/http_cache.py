@@ -0,0 +1,118 @@
+# python_service/core/http_cache.py
+# Validator-based (ETag / Last-Modified) caching of GET responses for the adapters.
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+import httpx
+
+# Marks a response rebuilt from the cache after the server answered 304 Not Modified.
+NOT_MODIFIED_EXTENSION = "fortuna_not_modified"
+_BODY_FRAMING_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+class CachedResponse:
+    """A stored response body with the validators needed to revalidate it."""
+
+    __slots__ = ("etag", "last_modified", "content", "headers", "parsed")
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], content: bytes, headers: httpx.Headers):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content = content
+        self.headers = headers
+        # What the adapter built from this body, reused while the body is unchanged.
+        self.parsed: Any = None
+
+
+def response_size(entry: CachedResponse) -> int:
+    """Approximate bytes held by a cached response: its body plus its headers."""
+    return len(entry.content) + sum(len(key) + len(value) for key, value in entry.headers.raw)
+
+
+class ConditionalCache:
+    """
+    Remembers, per URL, the last body a server sent along with its ETag and
+    Last-Modified validators, holding at most `max_entries` URLs and roughly
+    `max_bytes` of them (as measured by `sizer`), least recently used first
+    out. Responses without validators, or larger than the whole budget, are
+    not stored.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 16 * 2**20,
+        sizer: Callable[[CachedResponse], int] = response_size,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizer = sizer
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+        return entry
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """The If-None-Match / If-Modified-Since headers for revalidating `url`, if it is cached."""
+        entry = self.get(url)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, url: str, response: httpx.Response):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        self._remove(url)
+        if not etag and not last_modified:
+            return
+        # The body is stored decoded, so the headers must not claim otherwise on replay.
+        headers = httpx.Headers(
+            [(k, v) for k, v in response.headers.items() if k.lower() not in _BODY_FRAMING_HEADERS]
+        )
+        entry = CachedResponse(etag, last_modified, response.content, headers)
+        size = self.sizer(entry)
+        if size > self.max_bytes:
+            return
+        self._entries[url] = entry
+        self._sizes[url] = size
+        self.current_bytes += size
+        while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, url: str):
+        if self._entries.pop(url, None) is not None:
+            self.current_bytes -= self._sizes.pop(url)
+
+    def replay(self, url: str, not_modified: httpx.Response) -> Optional[httpx.Response]:
+        """Rebuilds the cached 200 response for a 304, marked as not modified."""
+        entry = self.get(url)
+        if entry is None:
+            return None
+        return httpx.Response(
+            200,
+            headers=entry.headers,
+            content=entry.content,
+            request=not_modified.request,
+            extensions={NOT_MODIFIED_EXTENSION: True},
+        )
+
+
+def is_not_modified(response: Optional[httpx.Response]) -> bool:
+    """True if `response` was served from the conditional cache after a 304."""
+    return response is not None and bool(response.extensions.get(NOT_MODIFIED_EXTENSION))
@@ -0,0 +1,124 @@
+# python_service/core/pipeline.py
+# A two-stage fetch -> parse pipeline joined by a bounded queue.
+import asyncio
+import inspect
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import structlog
+
+log = structlog.get_logger(__name__)
+
+_DONE = object()
+
+
+class StagedPipeline:
+    """
+    Runs `fetch` over a set of items with `fetch_workers` concurrent fetchers, and
+    `parse` over every payload they produce with `parse_workers` parsers. The
+    stages are joined by a queue holding at most `queue_size` payloads: when
+    parsing falls behind, fetchers wait to hand over what they have before
+    fetching more, so no more than `queue_size + fetch_workers` raw payloads are
+    ever held at once.
+
+    `fetch` returns a payload, or None to skip the item; `parse` (sync or async)
+    returns a result, or None to drop it. Failures in either stage are logged
+    and the item is skipped. Results keep the order of the items.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[Any], Awaitable[Any]],
+        parse: Callable[[Any], Union[Any, Awaitable[Any]]],
+        fetch_workers: int = 4,
+        parse_workers: int = 1,
+        queue_size: int = 4,
+        name: str = "pipeline",
+    ):
+        self.fetch = fetch
+        self.parse = parse
+        self.fetch_workers = max(1, fetch_workers)
+        self.parse_workers = max(1, parse_workers)
+        self.queue_size = max(1, queue_size)
+        self.name = name
+        self.truncated = False
+        self.fetched = 0
+        self.parsed = 0
+        self.peak_queue_depth = 0
+
+    async def run(self, items: Iterable[Any], timeout: Optional[float] = None) -> List[Any]:
+        """
+        Pushes every item through both stages and returns the results. If
+        `timeout` elapses first, the workers are cancelled, the results finished
+        so far are returned and `truncated` is set.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        pending = iter(enumerate(items))
+        results: List[Tuple[int, Any]] = []
+
+        async def _fetch_worker():
+            for index, item in pending:
+                try:
+                    payload = await self.fetch(item)
+                except Exception as e:
+                    log.error("pipeline_fetch_failed", pipeline=self.name, item=str(item), error=str(e))
+                    continue
+                if payload is None:
+                    continue
+                self.fetched += 1
+                await queue.put((index, item, payload))
+                self.peak_queue_depth = max(self.peak_queue_depth, queue.qsize())
+
+        async def _fetch_stage():
+            try:
+                await asyncio.gather(*[_fetch_worker() for _ in range(self.fetch_workers)])
+            except asyncio.CancelledError:
+                # run() cancels the parsers too, so a sentinel put on a full queue would never be taken.
+                raise
+            except Exception as e:
+                log.error("pipeline_fetch_stage_failed", pipeline=self.name, error=str(e))
+            for _ in range(self.parse_workers):
+                await queue.put(_DONE)
+
+        async def _parse_worker():
+            while True:
+                entry = await queue.get()
+                if entry is _DONE:
+                    return
+                index, item, payload = entry
+                # Drop references as soon as possible, so parsed bodies can be freed while we wait.
+                del entry
+                try:
+                    result = self.parse(payload)
+                    if inspect.isawaitable(result):
+                        result = await result
+                except Exception as e:
+                    log.error("pipeline_parse_failed", pipeline=self.name, item=str(item), error=str(e))
+                    continue
+                finally:
+                    del payload
+                if result is not None:
+                    self.parsed += 1
+                    results.append((index, result))
+
+        tasks = [asyncio.create_task(_fetch_stage())]
+        tasks += [asyncio.create_task(_parse_worker()) for _ in range(self.parse_workers)]
+        try:
+            await asyncio.wait(tasks, timeout=timeout)
+        finally:
+            unfinished = [task for task in tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+        if unfinished:
+            self.truncated = True
+            log.warning("pipeline_truncated", pipeline=self.name, fetched=self.fetched, parsed=self.parsed)
+
+        results.sort(key=lambda pair: pair[0])
+        return [result for _, result in results]
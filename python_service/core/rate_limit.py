@@ -0,0 +1,45 @@
+# python_service/core/rate_limit.py
+# Rate limiting primitives shared by the refresh scheduler and the HTTP layer.
+import asyncio
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """
+    A token bucket refilled at `rate` tokens per second, holding at most
+    `capacity` tokens. The clock is injectable so callers can be tested
+    without sleeping.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("TokenBucket rate must be positive.")
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Takes `tokens` if they are available right now."""
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """Seconds until `tokens` will be available."""
+        self._refill()
+        return max(0.0, (tokens - self._tokens) / self.rate)
+
+    async def acquire(self, tokens: float = 1.0):
+        """Waits until `tokens` are available and takes them."""
+        while not self.try_acquire(tokens):
+            await asyncio.sleep(self.wait_time(tokens))
@@ -0,0 +1,153 @@
+# python_service/core/request_scheduler.py
+# The shared gate every adapter HTTP request passes through.
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from urllib.parse import urlsplit
+
+from .rate_limit import TokenBucket
+
+# Request priorities; lower values are served first.
+INTERACTIVE = 0
+BACKGROUND = 1
+
+_current_priority: ContextVar[int] = ContextVar("request_priority", default=INTERACTIVE)
+
+
+def current_priority() -> int:
+    return _current_priority.get()
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[int]:
+    """Runs the enclosed requests (and tasks created inside) at `priority`."""
+    token = _current_priority.set(priority)
+    try:
+        yield priority
+    finally:
+        _current_priority.reset(token)
+
+
+class PrioritySemaphore:
+    """A semaphore whose waiters are woken in priority order, then first come first served."""
+
+    def __init__(self, value: int):
+        self._value = max(1, value)
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    def _discard_abandoned(self):
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+
+    async def acquire(self, priority: int = INTERACTIVE):
+        self._discard_abandoned()
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as we were cancelled; pass it on.
+                self.release()
+            raise
+
+    def release(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+
+class RequestScheduler:
+    """
+    Bounds outbound adapter traffic: at most `max_concurrent` requests in flight
+    overall and `per_host_limit` per host, each host paced by its own token bucket
+    (`host_rate` requests per second). Slots are granted by priority, so
+    interactive API work overtakes queued background refreshes. A host that
+    answers 429 is paused for its Retry-After, rather than having every retry
+    hit it again.
+    """
+
+    def __init__(self, max_concurrent: int = 10, per_host_limit: int = 4, host_rate: float = 5.0):
+        self.per_host_limit = per_host_limit
+        self.host_rate = host_rate
+        self._global = PrioritySemaphore(max_concurrent)
+        self._hosts: Dict[str, PrioritySemaphore] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._paused_until: Dict[str, float] = {}
+
+    @classmethod
+    def from_settings(cls, settings) -> "RequestScheduler":
+        return cls(
+            max_concurrent=settings.MAX_CONCURRENT_REQUESTS,
+            per_host_limit=settings.MAX_REQUESTS_PER_HOST,
+            host_rate=settings.HOST_REQUESTS_PER_SECOND,
+        )
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def _host_state(self, host: str) -> Tuple[PrioritySemaphore, TokenBucket]:
+        if host not in self._hosts:
+            self._hosts[host] = PrioritySemaphore(self.per_host_limit)
+            self._buckets[host] = TokenBucket(rate=self.host_rate, capacity=self.per_host_limit)
+        return self._hosts[host], self._buckets[host]
+
+    def pause_host(self, host: str, seconds: float):
+        """Holds back new requests to `host` for `seconds`, e.g. after a 429."""
+        self._paused_until[host] = max(self._paused_until.get(host, 0.0), time.monotonic() + seconds)
+
+    @asynccontextmanager
+    async def slot(self, url: str, priority: Optional[int] = None) -> AsyncIterator[None]:
+        """Waits for permission to send one request to `url`, and holds it while the request runs."""
+        priority = current_priority() if priority is None else priority
+        host = self.host_of(url)
+        host_semaphore, bucket = self._host_state(host)
+        await host_semaphore.acquire(priority)
+        try:
+            paused_for = self._paused_until.get(host, 0.0) - time.monotonic()
+            if paused_for > 0:
+                await asyncio.sleep(paused_for)
+            await bucket.acquire()
+            # Only requests actually ready to go compete for the global slots.
+            await self._global.acquire(priority)
+            try:
+                yield
+            finally:
+                self._global.release()
+        finally:
+            host_semaphore.release()
+
+
+_request_scheduler: Optional[RequestScheduler] = None
+
+
+def get_request_scheduler() -> RequestScheduler:
+    """The process-wide scheduler, built from Settings on first use."""
+    global _request_scheduler
+    if _request_scheduler is None:
+        from ..config import get_settings
+
+        _request_scheduler = RequestScheduler.from_settings(get_settings())
+    return _request_scheduler
@@ -0,0 +1,137 @@
+# python_service/core/ttl_cache.py
+# A size-bounded LRU cache with per-entry TTLs, for the in-process cache fallback.
+import sys
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate memory held by `value` in bytes: sys.getsizeof summed over the
+    containers, strings and numbers it references, counting shared objects once.
+    """
+    seen = set()
+    total = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return total
+
+
+class BoundedTTLCache:
+    """
+    Holds at most `max_entries` values and roughly `max_bytes` of them (as
+    measured by `sizer`), evicting the least recently used first. Each value
+    expires after its own TTL: expired entries are dropped when looked up, and
+    every `sweep_interval` seconds a write also sweeps all expired entries out,
+    so keys that are never read again do not linger. A single value larger
+    than the whole budget is not stored.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 2**20,
+        sweep_interval: float = 60.0,
+        sizer: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self.sizer = sizer
+        self.clock = clock
+        # key -> (value, expires_at, size)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, int]]" = OrderedDict()
+        self._last_sweep = clock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[1] > self.clock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if entry[1] <= self.clock():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float):
+        now = self.clock()
+        if now - self._last_sweep >= self.sweep_interval:
+            self.sweep(now)
+        self.pop(key)
+        size = self.sizer(value)
+        if ttl_seconds <= 0 or size > self.max_bytes:
+            return
+        self._entries[key] = (value, now + ttl_seconds, size)
+        self.current_bytes += size
+        while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        if key not in self._entries:
+            return default
+        return self._remove(key)
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Drops every expired entry and returns how many there were."""
+        now = self.clock() if now is None else now
+        expired = [key for key, (_, expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+        self._last_sweep = now
+        return len(expired)
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _remove(self, key: Hashable) -> Any:
+        value, _, size = self._entries.pop(key)
+        self.current_bytes -= size
+        return value
@@ -2,114 +2,239 @@
 
 import asyncio
 import inspect
+import sys
+import time
 from datetime import datetime
 from datetime import timezone
 from decimal import Decimal
 from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Tuple
 
-import asyncio
 import httpx
 import structlog
 
-from .adapters.at_the_races_adapter import AtTheRacesAdapter
 from .adapters.base import BaseAdapter
-from .adapters.betfair_adapter import BetfairAdapter
-from .adapters.betfair_datascientist_adapter import BetfairDataScientistAdapter
-from .adapters.betfair_greyhound_adapter import BetfairGreyhoundAdapter
-from .adapters.equibase_adapter import EquibaseAdapter
-from .adapters.gbgb_api_adapter import GbgbApiAdapter
-from .adapters.harness_adapter import HarnessAdapter
-from .adapters.racing_and_sports_adapter import RacingAndSportsAdapter
-from .adapters.racing_and_sports_greyhound_adapter import RacingAndSportsGreyhoundAdapter
-from .adapters.racingpost_adapter import RacingPostAdapter
-from .adapters.sporting_life_adapter import SportingLifeAdapter
-from .adapters.the_racing_api_adapter import TheRacingApiAdapter
-from .adapters.timeform_adapter import TimeformAdapter
-from .adapters.tvg_adapter import TVGAdapter
+from .adapters.base import shutdown_parse_executor
+from .adapters.base_v3 import BaseAdapterV3
 from .cache_manager import cache_async_result
+from .cache_manager import cache_manager
+from .core.errors import ErrorCategory
+from .core.errors import classify_http_error
+from .core.fetch_context import FetchContext
+from .core.fetch_context import fetch_context
 from .health import health_monitor
+from .merge import RaceMergeIndex
 from .models import AggregatedResponse
 from .models import OddsData
 from .models import Race
 from .models import Runner
 from .models_v3 import NormalizedRace
+from .recording import transport_from_settings
+from .records import OddsRecord
+from .records import RaceRecord
+from .records import RunnerRecord
+from .records import as_record
+from .registry import ADAPTER
+from .registry import PluginSpec
+from .registry import get_registry
+from .snapshot import Snapshot
+from .snapshot import SnapshotStore
+from .utils.odds import Odds
 
 log = structlog.get_logger(__name__)
 
+# Adapter statuses whose races are merged into the aggregated response.
+USABLE_STATUSES = ("SUCCESS", "PARTIAL")
+
+# How long a source is left alone after failing, per ErrorCategory name; see Settings.FAILURE_TTL_SECONDS.
+DEFAULT_FAILURE_TTL_SECONDS = 60
+# How long a result truncated by its budget (PARTIAL) is cached; see Settings.PARTIAL_CACHE_TTL_SECONDS.
+DEFAULT_PARTIAL_CACHE_TTL_SECONDS = 30
+
 
 class FortunaEngine:
-    def __init__(self, config=None):
+    def __init__(self, config=None, transport: Optional[httpx.AsyncBaseTransport] = None):
         from .config import get_settings
 
         self.config = config or get_settings()
         self.logger = structlog.get_logger(__name__)
-        self.adapters: List[BaseAdapter] = [
-            BetfairAdapter(source_name=BetfairAdapter.SOURCE_NAME, base_url=BetfairAdapter.BASE_URL),
-            BetfairGreyhoundAdapter(source_name=BetfairGreyhoundAdapter.SOURCE_NAME, base_url=BetfairGreyhoundAdapter.BASE_URL),
-            RacingAndSportsAdapter(config=self.config),
-            RacingAndSportsGreyhoundAdapter(config=self.config),
-            AtTheRacesAdapter(config=self.config),
-            RacingPostAdapter(config=self.config),
-            HarnessAdapter(config=self.config),
-            EquibaseAdapter(config=self.config),
-            SportingLifeAdapter(config=self.config),
-            TimeformAdapter(config=self.config),
-            TheRacingApiAdapter(config=self.config),
-            GbgbApiAdapter(config=self.config),
-        ]
-        # V3 ADAPTERS
-        self.v3_adapters = [
-            BetfairDataScientistAdapter(
-                model_name="ThoroughbredModel",
-                url="https://betfair-data-supplier-prod.herokuapp.com/api/widgets/kvs-ratings/datasets?id=thoroughbred-model&date=",
-            ),
-            TVGAdapter(config=self.config),
-        ]
+        # Adapters are listed in the plugin registry and only imported and built on first use.
+        self._adapters: Optional[List[BaseAdapter]] = None
+        self._v3_adapters: Optional[List[BaseAdapterV3]] = None
+        # Adapters built so far, by plugin name; None for those that failed to build.
+        self._built: Dict[str, Optional[Any]] = {}
+        snapshot_path = getattr(self.config, "SNAPSHOT_PATH", None)
+        self.snapshot_store: Optional[SnapshotStore] = SnapshotStore(snapshot_path) if snapshot_path else None
         self.http_limits = httpx.Limits(
-            max_connections=config.HTTP_POOL_CONNECTIONS, max_keepalive_connections=config.HTTP_MAX_KEEPALIVE
+            max_connections=self.config.HTTP_POOL_CONNECTIONS,
+            max_keepalive_connections=self.config.HTTP_MAX_KEEPALIVE,
         )
-        self.http_client = httpx.AsyncClient(limits=self.http_limits, http2=True)
+        # A record/replay transport (see recording.py) may stand in for the network.
+        transport = transport or transport_from_settings(self.config)
+        self.http_client = httpx.AsyncClient(limits=self.http_limits, http2=True, transport=transport)
+
+    def _create_adapters(self):
+        """Builds every registered adapter, splitting them by generation."""
+        adapters, v3_adapters = [], []
+        for spec in get_registry().specs(ADAPTER):
+            adapter = self._create_adapter(spec)
+            if adapter is None:
+                continue
+            if isinstance(adapter, BaseAdapterV3):
+                v3_adapters.append(adapter)
+            else:
+                adapters.append(adapter)
+        if self._adapters is None:
+            self._adapters = adapters
+        if self._v3_adapters is None:
+            self._v3_adapters = v3_adapters
+
+    def _create_adapter(self, spec: PluginSpec) -> Optional[Any]:
+        """Builds one registered adapter, once; None if it cannot be built."""
+        if spec.name not in self._built:
+            try:
+                adapter = spec.create(self.config)
+            except Exception as e:
+                self.logger.error("adapter_initialization_failed", adapter=spec.name, error=str(e), exc_info=True)
+                adapter = None
+            if isinstance(adapter, BaseAdapterV3):
+                adapter.http_client = self.http_client
+            self._built[spec.name] = adapter
+        return self._built[spec.name]
+
+    def adapter_names(self) -> List[str]:
+        """The names get_adapter() accepts, one per target adapter, without building any adapter."""
+        if self._adapters is not None and self._v3_adapters is not None:
+            return [adapter.source_name for adapter in self._target_adapters()]
+        return [spec.name for spec in get_registry().specs(ADAPTER)]
+
+    def get_adapter(self, name: str) -> Optional[Any]:
+        """The adapter adapter_names() lists as `name`, building only that one if it is not built yet."""
+        if self._adapters is not None and self._v3_adapters is not None:
+            return next((adapter for adapter in self._target_adapters() if adapter.source_name == name), None)
+        spec = get_registry().get(ADAPTER, name)
+        return self._create_adapter(spec) if spec else None
+
+    @property
+    def adapters(self) -> List[BaseAdapter]:
+        if self._adapters is None:
+            self._create_adapters()
+        return self._adapters
+
+    @adapters.setter
+    def adapters(self, adapters: List[BaseAdapter]):
+        self._adapters = adapters
+
+    @property
+    def v3_adapters(self) -> List[BaseAdapterV3]:
+        if self._v3_adapters is None:
+            self._create_adapters()
+        return self._v3_adapters
+
+    @v3_adapters.setter
+    def v3_adapters(self, adapters: List[BaseAdapterV3]):
+        self._v3_adapters = adapters
 
     async def close(self):
         await self.http_client.aclose()
+        shutdown_parse_executor()
 
     def get_all_adapter_statuses(self) -> List[Dict[str, Any]]:
         return [adapter.get_status() for adapter in self.adapters]
 
+    def _adapter_budget(self, adapter: Any) -> float:
+        """The wall-clock budget for one adapter fetch, in seconds."""
+        if isinstance(adapter, BaseAdapterV3):
+            return adapter.timeout or self.config.ADAPTER_TIMEOUT
+        return getattr(adapter, "TIMEOUT_SECONDS", None) or self.config.ADAPTER_TIMEOUT
+
+    def _source_cache_ttl(self, adapter: Any) -> int:
+        return getattr(adapter, "CACHE_TTL_SECONDS", None) or self.config.SOURCE_CACHE_TTL_SECONDS
+
+    def _fetch_status(self, is_success: bool, timed_out: bool, context: FetchContext, races: List[Any]) -> str:
+        if timed_out:
+            return "PARTIAL" if races else "TIMEOUT"
+        if is_success:
+            return "PARTIAL" if context.truncated else "SUCCESS"
+        return "FAILED"
+
+    def _error_category(
+        self, status: str, context: FetchContext, reported: Optional[str] = None, error: Optional[Exception] = None
+    ) -> Optional[str]:
+        """The ErrorCategory name of a fetch that yielded nothing usable, or None if it did."""
+        if status in USABLE_STATUSES:
+            return None
+        if status == "TIMEOUT":
+            return ErrorCategory.TIMEOUT_ERROR.name
+        if reported:
+            return reported
+        if context.failure is not None:
+            return context.failure.name
+        if error is not None:
+            return classify_http_error(error).name
+        return ErrorCategory.PARSING_ERROR.name
+
     async def _time_adapter_fetch(self, adapter: BaseAdapter, date: str) -> Tuple[str, Dict[str, Any], float]:
         """
         Wraps an adapter's fetch call for safe, non-blocking execution,
         and returns a consistent payload with timing information.
         Handles both modern async adapters and legacy sync adapters.
+
+        The fetch runs under a FetchContext carrying the adapter's budget. Adapters
+        may stop early and return what they have (reported as PARTIAL); an adapter
+        still running once the budget and grace period elapse is cancelled and
+        reported as TIMEOUT.
         """
         start_time = datetime.now()
         races = []
         error_message = None
+        error = None
+        reported_category = None
         is_success = False
+        timed_out = False
+        budget = self._adapter_budget(adapter)
+        context = FetchContext.with_budget(adapter.source_name, budget)
 
         try:
-            # Check if the adapter's fetch_races method is a modern async function
-            if inspect.iscoroutinefunction(adapter.fetch_races):
-                result = await adapter.fetch_races(date, self.http_client)
-            else:
-                # This is a legacy, synchronous adapter. Run it in a separate thread.
-                self.logger.warning(
-                    "legacy_sync_adapter_detected",
-                    adapter=adapter.source_name,
-                    recommendation="This adapter should be refactored to be fully asynchronous."
-                )
-                result = await asyncio.to_thread(adapter.fetch_races, date, self.http_client)
+            with fetch_context(context):
+                # Check if the adapter's fetch_races method is a modern async function
+                if inspect.iscoroutinefunction(adapter.fetch_races):
+                    fetch = adapter.fetch_races(date, self.http_client)
+                else:
+                    # This is a legacy, synchronous adapter. Run it in a separate thread.
+                    self.logger.warning(
+                        "legacy_sync_adapter_detected",
+                        adapter=adapter.source_name,
+                        recommendation="This adapter should be refactored to be fully asynchronous."
+                    )
+                    fetch = asyncio.to_thread(adapter.fetch_races, date, self.http_client)
+                result = await asyncio.wait_for(fetch, timeout=budget + self.config.ADAPTER_TIMEOUT_GRACE_SECONDS)
 
             # Assuming the result is a dictionary with a 'races' key
             if result and 'races' in result:
                 races = result.get('races', [])
-                is_success = True
+                reported = result.get("source_info") or {}
+                if reported.get("status") == "FAILED":
+                    error_message = reported.get("error_message") or "Adapter reported a failure"
+                    reported_category = reported.get("error_category")
+                elif not races and context.failure is not None:
+                    # The adapter's requests failed, but it reported an empty success.
+                    error_message = f"Requests failed: {context.failure.value}"
+                else:
+                    is_success = True
             else:
                 error_message = "Adapter returned no data or malformed response"
 
+        except asyncio.TimeoutError:
+            timed_out = True
+            error_message = f"Adapter exceeded its {budget}s budget and was cancelled."
+            self.logger.warning("adapter_timeout", adapter=adapter.source_name, budget=budget)
         except Exception as e:
             self.logger.error(
                 "Critical failure during fetch from adapter.",
@@ -117,19 +242,22 @@ class FortunaEngine:
                 error=str(e),
                 exc_info=True
             )
+            error = e
             error_message = str(e)
 
         duration = (datetime.now() - start_time).total_seconds()
         health_monitor.record_adapter_response(adapter.source_name, success=is_success, duration=duration)
 
         # Construct a consistent source_info payload regardless of success or failure
+        status = self._fetch_status(is_success, timed_out, context, races)
         payload = {
             "races": races,
             "source_info": {
                 "name": adapter.source_name,
-                "status": "SUCCESS" if is_success else "FAILED",
+                "status": status,
                 "races_fetched": len(races),
                 "error_message": error_message,
+                "error_category": self._error_category(status, context, reported_category, error),
                 "fetch_duration": duration,
             },
         }
@@ -138,48 +266,87 @@ class FortunaEngine:
     def _race_key(self, race: Race) -> str:
         return f"{race.venue.lower().strip()}|{race.race_number}|{race.start_time.strftime('%H:%M')}"
 
-    def _dedupe_races(self, races: List[Race]) -> List[Race]:
+    def _dedupe_races(self, races: List[Race]) -> List[RaceRecord]:
         """Deduplicates races from multiple sources and reconciles odds."""
-        race_map: Dict[str, Race] = {}
-        for race in races:
-            # Use a robust key: venue, date, and race number
-            key = f"{race.venue.upper()}-{race.start_time.strftime('%Y-%m-%d')}-{race.race_number}"
-
-            if key not in race_map:
-                race_map[key] = race
-            else:
-                # Merge runners and odds into the existing race object
-                existing_race = race_map[key]
-                runner_map = {r.number: r for r in existing_race.runners}
-
-                for new_runner in race.runners:
-                    if new_runner.number in runner_map:
-                        # Runner exists, reconcile odds
-                        existing_runner = runner_map[new_runner.number]
-                        updated_odds = existing_runner.odds.copy()
-                        updated_odds.update(new_runner.odds)
-                        existing_runner.odds = updated_odds
-                    else:
-                        # New runner, add to the existing race
-                        existing_race.runners.append(new_runner)
-
-                # Update source count
-                existing_race.source += f", {race.source}"
-
-        return list(race_map.values())
+        merge_index = RaceMergeIndex()
+        merge_index.add_batch(races)
+        return merge_index.races()
 
     async def get_races(self, date: str, background_tasks: set, source_filter: str = None) -> Dict[str, Any]:
         if source_filter:
-            self.log.info("Bypassing cache for source-specific request", source=source_filter)
+            # Served from the per-source cache, so only the requested source is fetched on a miss.
             return await self._fetch_races_from_sources(date, source_filter=source_filter)
 
         return await self._get_all_races_cached(date, background_tasks=background_tasks)
 
-    @cache_async_result(ttl_seconds=300, key_prefix="fortuna_engine_races")
+    @cache_async_result(
+        ttl_seconds=300, key_prefix="fortuna_engine_races", stale_ttl_seconds=1800, early_refresh_beta=1.0
+    )
     async def _get_all_races_cached(self, date: str, background_tasks: set) -> Dict[str, Any]:
         """This method fetches races for all sources and its result is cached."""
-        self.log.info("CACHE MISS: Fetching all races from sources.", date=date)
-        return await self._fetch_races_from_sources(date)
+        self.logger.info("CACHE MISS: Fetching all races from sources.", date=date)
+        result = await self._fetch_races_from_sources(date)
+        await self._save_snapshot(date, result)
+        return result
+
+    async def invalidate_races(self, date: str):
+        """Drops the cached all-sources response for `date`, so the next request re-merges the per-source cache."""
+        await cache_manager.adelete([self._get_all_races_cached.cache_key_for(self, date, background_tasks=set())])
+
+    async def _save_snapshot(self, date: str, response: Dict[str, Any]):
+        """Persists a usable aggregated response, with the per-source results behind it, for warm starts."""
+        if self.snapshot_store is None or not response.get("metadata", {}).get("sources_successful"):
+            return
+        names = [adapter.source_name for adapter in self._target_adapters()]
+        entries = await cache_manager.aget_entries([self._source_cache_key(name, date) for name in names])
+        sources = {
+            name: {"value": entry["value"], "fresh_until": entry["fresh_until"]}
+            for name, entry in zip(names, entries.values())
+            if entry is not None
+        }
+        snapshot = Snapshot(date=date, saved_at=time.time(), response=response, sources=sources)
+        try:
+            await asyncio.to_thread(self.snapshot_store.save, snapshot)
+        except Exception as e:
+            self.logger.warning("snapshot_save_failed", path=self.snapshot_store.path, error=str(e))
+
+    async def warm_start(self) -> bool:
+        """
+        Seeds the caches from the last snapshot, so the first request after a
+        restart is answered at once. The aggregated response is served stale,
+        flagged in its metadata, while the usual background refresh replaces it;
+        per-source results that are still within their TTL are reused by that
+        refresh instead of being fetched again.
+        """
+        if self.snapshot_store is None:
+            return False
+        snapshot = self.snapshot_store.load()
+        max_age = self.config.SNAPSHOT_MAX_AGE_SECONDS
+        if snapshot is None or snapshot.age >= max_age:
+            return False
+
+        response = dict(snapshot.response)
+        response["metadata"] = {
+            **response.get("metadata", {}),
+            "stale": True,
+            "snapshot_saved_at": datetime.fromtimestamp(snapshot.saved_at).isoformat(),
+        }
+        cache_key = self._get_all_races_cached.cache_key_for(self, snapshot.date, background_tasks=set())
+        now = time.time()
+        entries = [(cache_key, response, 0, max_age - snapshot.age, 0.0)]
+        entries += [
+            (self._source_cache_key(source_name, snapshot.date), entry["value"], entry["fresh_until"] - now, 0, 0.0)
+            for source_name, entry in snapshot.sources.items()
+            if entry["fresh_until"] > now
+        ]
+        await cache_manager.aset_entries(entries)
+        self.logger.info(
+            "warm_start_from_snapshot",
+            date=snapshot.date,
+            age_seconds=round(snapshot.age),
+            sources=len(snapshot.sources),
+        )
+        return True
 
     def _convert_v3_race_to_v2(self, v3_race: NormalizedRace) -> Race:
         """Converts a V3 NormalizedRace object to a V2 Race object."""
@@ -217,79 +384,266 @@ class FortunaEngine:
             race_name=v3_race.race_name,
         )
 
-    @cache_async_result(ttl_seconds=300, key_prefix="odds_engine_fetch")
-    async def _fetch_races_from_sources(self, date: str, source_filter: str = None) -> Dict[str, Any]:
-        """Helper method to contain the logic for fetching and aggregating races."""
-        target_adapters = self.adapters
-        if source_filter:
-            target_adapters = [a for a in self.adapters if a.source_name.lower() == source_filter.lower()]
+    async def _time_v3_adapter_fetch(self, adapter: BaseAdapterV3, date: str) -> Tuple[str, Dict[str, Any], float]:
+        """
+        Drains a V3 adapter's race generator and returns the same payload shape
+        as _time_adapter_fetch, so both generations can be aggregated uniformly.
+        Races yielded before the budget runs out are kept as a PARTIAL result.
+        """
+        start_time = datetime.now()
+        races = []
+        error_message = None
+        error = None
+        is_success = False
+        timed_out = False
+        budget = self._adapter_budget(adapter)
+        context = FetchContext.with_budget(adapter.source_name, budget)
 
-        tasks = [self._time_adapter_fetch(adapter, date) for adapter in target_adapters]
+        async def _drain():
+            async for race in adapter.get_races(date):
+                if isinstance(race, NormalizedRace):
+                    race = self._translate_v3_race_to_v2(race)
+                races.append(race)
 
-        # Run V3 adapters
-        for adapter in self.v3_adapters:
-            if hasattr(adapter, 'fetch_and_normalize'):
-                # Handle synchronous V3 adapters
-                v3_task = asyncio.to_thread(adapter.fetch_and_normalize)
-                tasks.append(v3_task)
-            elif hasattr(adapter, 'get_races'):
-                # Handle asynchronous V3 adapters
-                v3_task = adapter.get_races(date)
-                tasks.append(v3_task)
+        try:
+            with fetch_context(context):
+                await asyncio.wait_for(_drain(), timeout=budget + self.config.ADAPTER_TIMEOUT_GRACE_SECONDS)
+            is_success = True
+        except asyncio.TimeoutError:
+            timed_out = True
+            error_message = f"Adapter exceeded its {budget}s budget and was cancelled."
+            self.logger.warning("adapter_timeout", adapter=adapter.source_name, budget=budget)
+        except Exception as e:
+            self.logger.error(
+                "Critical failure during fetch from V3 adapter.",
+                adapter=adapter.source_name,
+                error=str(e),
+                exc_info=True
+            )
+            error = e
+            error_message = str(e)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        duration = (datetime.now() - start_time).total_seconds()
+        health_monitor.record_adapter_response(adapter.source_name, success=is_success, duration=duration)
 
-        source_infos = []
-        all_races = []
+        status = self._fetch_status(is_success, timed_out, context, races)
+        payload = {
+            "races": races,
+            "source_info": {
+                "name": adapter.source_name,
+                "status": status,
+                "races_fetched": len(races),
+                "error_message": error_message,
+                "error_category": self._error_category(status, context, error=error),
+                "fetch_duration": duration,
+            },
+        }
+        return (adapter.source_name, payload, duration)
 
-        v3_start_time = datetime.now()  # Approximate start time for all V3 adapters
+    async def _run_adapter_fetch(self, adapter: Any, date: str) -> Tuple[str, Dict[str, Any], float]:
+        """Runs one adapter's fetch and returns its races as RaceRecords, whatever form the adapter used."""
+        if isinstance(adapter, BaseAdapterV3):
+            result = await self._time_v3_adapter_fetch(adapter, date)
+        else:
+            result = await self._time_adapter_fetch(adapter, date)
+        payload = result[1]
+        payload["races"] = [as_record(race) for race in payload["races"]]
+        return result
 
-        for result in results:
-            try:
-                if isinstance(result, Exception):
-                    self.log.error("Adapter fetch failed", error=result, exc_info=False)
+    def _source_cache_key(self, source_name: str, date: str) -> str:
+        return cache_manager._generate_key("fortuna_source", source_name, date)
+
+    async def _from_source_cache(self, adapter: Any, cached: Dict[str, Any]) -> Tuple[str, Dict[str, Any], float]:
+        """
+        Serves one adapter's result from the per-source cache, keyed by (source, date).
+        Only usable results are cached, so a source that failed or timed out is
+        fetched again on the next request while the others are not.
+        """
+        return (adapter.source_name, self._rehydrate_source_payload(cached), 0.0)
+
+    def _failure_cache_key(self, source_name: str) -> str:
+        # Per source, not per date: credentials or an outage do not depend on the day asked for.
+        return cache_manager._generate_key("fortuna_source_failure", source_name)
+
+    def _failure_ttl(self, category: str) -> int:
+        ttls = getattr(self.config, "FAILURE_TTL_SECONDS", None) or {}
+        return ttls.get(category, DEFAULT_FAILURE_TTL_SECONDS)
+
+    async def _from_failure_memo(self, adapter: Any, memo: Dict[str, Any]) -> Tuple[str, Dict[str, Any], float]:
+        """
+        Reports a source's recent failure again instead of fetching it, with how
+        long until it will be tried again.
+        """
+        retry_in = max(0.0, memo["failed_at"] + memo["ttl"] - time.time())
+        source_info = {**memo["source_info"], "fetch_duration": 0.0, "retry_in_seconds": round(retry_in, 1)}
+        return (adapter.source_name, {"races": [], "source_info": source_info}, 0.0)
+
+    async def refresh_source(
+        self, adapter: Any, date: str, ttl_seconds: Optional[int] = None
+    ) -> Tuple[str, Dict[str, Any], float]:
+        """
+        Fetches one adapter's races, bypassing the cache, and stores the result if
+        it is usable. `ttl_seconds` overrides the adapter's cache TTL. A source
+        whose last failure is still memoized is not fetched; that failure is
+        reported instead.
+        """
+        memo = await cache_manager.aget(self._failure_cache_key(adapter.source_name))
+        if memo is not None:
+            return await self._from_failure_memo(adapter, memo)
+        return await self._fetch_source(adapter, date, ttl_seconds)
+
+    async def _fetch_source(
+        self, adapter: Any, date: str, ttl_seconds: Optional[int] = None
+    ) -> Tuple[str, Dict[str, Any], float]:
+        adapter_name, payload, duration = await self._run_adapter_fetch(adapter, date)
+        source_info = payload["source_info"]
+        status = source_info.get("status")
+        if status in USABLE_STATUSES:
+            key = self._source_cache_key(adapter_name, date)
+            ttl = ttl_seconds or self._source_cache_ttl(adapter)
+            if status == "PARTIAL":
+                # A truncated card is a stopgap: kept briefly, and never in place of a complete one.
+                ttl = min(ttl, getattr(self.config, "PARTIAL_CACHE_TTL_SECONDS", DEFAULT_PARTIAL_CACHE_TTL_SECONDS))
+                current = await cache_manager.aget(key)
+                if current is not None and current["source_info"].get("status") == "SUCCESS":
+                    ttl = 0
+            if ttl > 0:
+                await cache_manager.aset(
+                    key,
+                    {
+                        "races": [race.to_dict() for race in payload["races"]],
+                        "source_info": dict(source_info),
+                    },
+                    ttl,
+                )
+        else:
+            # Remember the failure, so the source costs nothing until it is worth trying again.
+            failure_ttl = self._failure_ttl(source_info.get("error_category"))
+            if failure_ttl > 0:
+                await cache_manager.aset(
+                    self._failure_cache_key(adapter_name),
+                    {"source_info": dict(source_info), "failed_at": time.time(), "ttl": failure_ttl},
+                    failure_ttl,
+                )
+        return (adapter_name, payload, duration)
+
+    def _rehydrate_source_payload(self, cached: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "races": [RaceRecord.from_dict(race) for race in cached["races"]],
+            "source_info": {**cached["source_info"], "cached": True},
+        }
+
+    def _target_adapters(self, source_filter: Optional[str] = None) -> List[Any]:
+        adapters = self.adapters + self.v3_adapters
+        if source_filter:
+            adapters = [a for a in adapters if a.source_name.lower() == source_filter.lower()]
+        return adapters
+
+    async def stream_races(
+        self, date: str, source_filter: Optional[str] = None, merge_index: Optional[RaceMergeIndex] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields each adapter's result as soon as that adapter finishes, so consumers
+        can act on the fast sources without waiting for the slowest one.
+
+        Results are served from the per-source cache where possible, and sources
+        with a memoized failure are not fetched (see refresh_source). Each item
+        contains the adapter's `source_info`, the `races` it returned and
+        `completed`/`total` progress counters. When a `merge_index` is supplied,
+        each batch is merged into it as it lands and `merged_races` holds the
+        up-to-date merged view of every race the batch touched. Adapters still
+        running when the consumer stops iterating are cancelled.
+        """
+        adapters = self._target_adapters(source_filter)
+        # One round trip for every source's cached result and failure memo; only the rest are fetched.
+        cache_keys = [self._source_cache_key(adapter.source_name, date) for adapter in adapters]
+        failure_keys = [self._failure_cache_key(adapter.source_name) for adapter in adapters]
+        cached = await cache_manager.aget_many(cache_keys + failure_keys)
+
+        def _source_result(adapter: Any, key: str, failure_key: str) -> Awaitable[Tuple[str, Dict[str, Any], float]]:
+            if key in cached:
+                return self._from_source_cache(adapter, cached[key])
+            if failure_key in cached:
+                return self._from_failure_memo(adapter, cached[failure_key])
+            return self._fetch_source(adapter, date)
+
+        tasks = [
+            asyncio.create_task(_source_result(adapter, key, failure_key))
+            for adapter, key, failure_key in zip(adapters, cache_keys, failure_keys)
+        ]
+
+        try:
+            for completed, next_result in enumerate(asyncio.as_completed(tasks), start=1):
+                try:
+                    adapter_name, adapter_result, duration = await next_result
+                except Exception:
+                    self.logger.error("Failed to process result from an adapter.", exc_info=True)
                     continue
 
-                # Correctly differentiate between V2 and V3 results
-                if isinstance(result, tuple) and len(result) == 3:  # V2 Adapter Result
-                    adapter_name, adapter_result, duration = result
-                    source_info = adapter_result.get("source_info", {})
-                    source_info["fetch_duration"] = round(duration, 2)
-                    source_infos.append(source_info)
-                    if source_info.get("status") == "SUCCESS":
-                        all_races.extend(adapter_result.get("races", []))
-                elif isinstance(result, list) and all(
-                    isinstance(r, NormalizedRace) for r in result
-                ):  # V3 Adapter Result
-                    if result:
-                        v3_races = result
-                        adapter_name = v3_races[0].source_ids[0]
-                        translated_races = [self._translate_v3_race_to_v2(nr) for nr in result]
-                        all_races.extend(translated_races)
-
-                        v3_duration = (datetime.now() - v3_start_time).total_seconds()
-                        source_infos.append(
-                            {
-                                "name": adapter_name,
-                                "status": "SUCCESS",
-                                "races_fetched": len(translated_races),
-                                "error_message": None,
-                                "fetch_duration": round(v3_duration, 2),
-                            }
-                        )
-            except Exception:
-                self.log.error("Failed to process result from an adapter.", exc_info=True)
-
-        deduped_races = self._dedupe_races(all_races)
+                source_info = adapter_result.get("source_info", {})
+                source_info["fetch_duration"] = round(duration, 2)
+                races = adapter_result.get("races", []) if source_info.get("status") in USABLE_STATUSES else []
+                partial = {
+                    "source_info": source_info,
+                    "races": races,
+                    "completed": completed,
+                    "total": len(tasks),
+                }
+                if merge_index is not None:
+                    partial["merged_races"] = [merge_index.get(key) for key in merge_index.add_batch(races)]
+                yield partial
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def aggregate_races(
+        self,
+        date: str,
+        source_filter: Optional[str] = None,
+        on_partial: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Aggregates races from all target adapters, merging each batch as it
+        completes. If `on_partial` is given (sync or async), it is called with
+        every item from stream_races.
+        """
+        source_infos = []
+        merge_index = RaceMergeIndex()
+
+        async for partial in self.stream_races(date, source_filter=source_filter, merge_index=merge_index):
+            source_infos.append(partial["source_info"])
+            if on_partial is not None:
+                try:
+                    outcome = on_partial(partial)
+                    if inspect.isawaitable(outcome):
+                        await outcome
+                except Exception:
+                    self.logger.error("Partial result callback failed.", exc_info=True)
+
+        return self._build_response(date, merge_index.races(), source_infos, self._target_adapters(source_filter))
 
+    async def _fetch_races_from_sources(self, date: str, source_filter: str = None) -> Dict[str, Any]:
+        """Helper method to contain the logic for fetching and aggregating races."""
+        return await self.aggregate_races(date, source_filter=source_filter)
+
+    def _build_response(
+        self,
+        date: str,
+        deduped_races: List[RaceRecord],
+        source_infos: List[Dict[str, Any]],
+        target_adapters: List[Any],
+    ) -> Dict[str, Any]:
+        # The races are already trusted records; only the source reports and metadata go through validation.
         response_obj = AggregatedResponse(
             date=datetime.strptime(date, "%Y-%m-%d").date(),
-            races=deduped_races,
-            sources=source_infos,
+            races=[],
+            source_info=source_infos,
             metadata={
                 "fetch_time": datetime.now(),
                 "sources_queried": [a.source_name for a in target_adapters],
-                "sources_successful": len([s for s in source_infos if s["status"] == "SUCCESS"]),
+                "sources_successful": len([s for s in source_infos if s["status"] in USABLE_STATUSES]),
                 "total_races": len(deduped_races),
             },
         )
@@ -304,10 +658,12 @@ class FortunaEngine:
         except (ImportError, RuntimeError):
             pass
 
-        return response_obj.model_dump()
+        response = response_obj.model_dump()
+        response["races"] = [race.to_dict() for race in deduped_races]
+        return response
 
-    def _translate_v3_race_to_v2(self, norm_race: NormalizedRace) -> Race:
-        """Translates a V3 NormalizedRace into a V2 Race object."""
+    def _translate_v3_race_to_v2(self, norm_race: NormalizedRace) -> RaceRecord:
+        """Translates a V3 NormalizedRace into a V2 race record."""
         import re
 
         race_number = 0
@@ -315,11 +671,12 @@ class FortunaEngine:
         if match:
             race_number = int(match.group(1))
 
+        adapter_name = sys.intern(norm_race.source_ids[0] if norm_race.source_ids else "UnknownV3")
+        last_updated = datetime.now(timezone.utc)
         runners = []
         for norm_runner in norm_race.runners:
-            adapter_name = norm_race.source_ids[0] if norm_race.source_ids else "UnknownV3"
-            odds_data = OddsData(
-                win=Decimal(str(norm_runner.odds_decimal)), source=adapter_name, last_updated=datetime.now(timezone.utc)
+            odds_data = OddsRecord(
+                source=adapter_name, last_updated=last_updated, win=Odds.from_decimal(norm_runner.odds_decimal)
             )
 
             try:
@@ -327,18 +684,17 @@ class FortunaEngine:
             except (ValueError, TypeError):
                 runner_number = None
 
-            runner = Runner(
+            runner = RunnerRecord(
                 id=norm_runner.runner_id, name=norm_runner.name, number=runner_number, odds={adapter_name: odds_data}
             )
             runners.append(runner)
 
-        return Race(
+        return RaceRecord(
             id=norm_race.race_key,
             venue=norm_race.track_key,
             start_time=datetime.fromisoformat(norm_race.start_time_iso),
             race_number=race_number,
             runners=runners,
-            source=norm_race.source_ids[0] if norm_race.source_ids else "UnknownV3",
-            # Store extra V3 data in metadata for future use
-            metadata={"v3_race_name": norm_race.race_name},
+            source=adapter_name,
+            race_name=norm_race.race_name,
         )
@@ -7,6 +7,8 @@ import psutil
 import structlog
 from fastapi import APIRouter
 
+from .cache_manager import cache_manager
+
 router = APIRouter()
 log = structlog.get_logger(__name__)
 
@@ -69,6 +71,7 @@ class HealthMonitor:
             "timestamp": datetime.now().isoformat(),
             "system": system_metrics,
             "adapters": self.adapter_health,
+            "memory_cache": cache_manager.memory_cache.stats(),
             "metrics_history": self.system_metrics[-10:],
         }
 
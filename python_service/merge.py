@@ -0,0 +1,104 @@
+# python_service/merge.py
+# Incremental, hash-indexed merging of races reported by multiple sources.
+
+from dataclasses import replace
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Union
+
+from .models import Race
+from .records import RaceRecord
+from .records import RunnerRecord
+from .records import as_record
+
+
+class _MergedRace:
+    """The merged view of one race: the race itself, its runners by number and its provenance."""
+
+    __slots__ = ("race", "runners", "sources")
+
+    def __init__(self, race: RaceRecord):
+        self.race = race
+        self.runners: Dict[int, RunnerRecord] = {}
+        self.sources: List[str] = []
+
+
+class RaceMergeIndex:
+    """
+    Merges races from many sources as each adapter's batch lands.
+
+    Races are indexed by a canonical key (venue, date, race number) and each merged
+    race keeps a sub-index of its runners by saddle-cloth number, so adding a batch
+    costs O(runners in the batch) no matter how many sources already reported the
+    race. Provenance is kept as a list and only joined into `source` when a
+    race is read back. Races are added as RaceRecords (pydantic Races are
+    converted) and read back as RaceRecords. Input races are never mutated.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _MergedRace] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @staticmethod
+    def race_key(race: Union[Race, RaceRecord]) -> str:
+        # Use a robust key: venue, date, and race number
+        return f"{race.venue.upper()}-{race.start_time.date().isoformat()}-{race.race_number}"
+
+    def add(self, race: Union[Race, RaceRecord]) -> str:
+        """Merges a single race into the index and returns its canonical key."""
+        race = as_record(race)
+        key = self.race_key(race)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _MergedRace(replace(race, runners=[]))
+            self._entries[key] = entry
+
+        if race.source not in entry.sources:
+            entry.sources.append(race.source)
+
+        # This loop is the hot path of every aggregation, so it is kept inline.
+        runner_index = entry.runners
+        merged_runners = entry.race.runners
+        for runner in race.runners:
+            number = runner.number
+            existing = runner_index.get(number) if number is not None else None
+            if existing is not None:
+                # Runner exists, reconcile odds in place
+                existing.odds.update(runner.odds)
+                continue
+
+            merged_runner = runner.copy()
+            if number is not None:
+                runner_index[number] = merged_runner
+            merged_runners.append(merged_runner)
+        return key
+
+    def add_batch(self, races: Iterable[Union[Race, RaceRecord]]) -> List[str]:
+        """Merges one adapter's batch and returns the keys it touched, in first-seen order."""
+        touched = {}
+        for race in races:
+            touched[self.add(race)] = None
+        return list(touched)
+
+    def get(self, key: str) -> Optional[RaceRecord]:
+        entry = self._entries.get(key)
+        return self._materialize(entry) if entry else None
+
+    def sources(self, key: str) -> List[str]:
+        entry = self._entries.get(key)
+        return list(entry.sources) if entry else []
+
+    def races(self) -> List[RaceRecord]:
+        return [self._materialize(entry) for entry in self._entries.values()]
+
+    @staticmethod
+    def _materialize(entry: _MergedRace) -> RaceRecord:
+        entry.race.source = ", ".join(entry.sources)
+        return entry.race
@@ -56,16 +56,23 @@ class SourceInfo(FortunaBaseModel):
     races_fetched: int = Field(..., alias="racesFetched")
     fetch_duration: float = Field(..., alias="fetchDuration")
     error_message: Optional[str] = Field(None, alias="errorMessage")
+    error_category: Optional[str] = Field(None, alias="errorCategory")
+    retry_in_seconds: Optional[float] = Field(None, alias="retryInSeconds")
 
 
 class AggregatedResponse(FortunaBaseModel):
     races: List[Race]
     source_info: List[SourceInfo] = Field(..., alias="sourceInfo")
+    metadata: Dict[str, Any] = {}
 
 
 class QualifiedRacesResponse(FortunaBaseModel):
     criteria: Dict[str, Any]
     races: List[Race]
+    # Identifies these scores; send it back as `since` to learn which races were rescored differently.
+    revision: Optional[str] = None
+    # Races whose score differs from the response identified by `since`; every race without one.
+    changed_race_ids: List[str] = Field([], alias="changedRaceIds")
 
 
 class TipsheetRace(FortunaBaseModel):
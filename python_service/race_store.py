@@ -0,0 +1,295 @@
+# python_service/race_store.py
+# A day of races as columns: one array per race field, one per runner field, and a
+# runner x source matrix per price, for analyzers, exports and metrics that work on
+# the whole day at once. The store is opt-in: the API and engine still pass race
+# records around, and numpy (installed with pandas) is only imported by code that
+# builds a store.
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from .models import AggregatedResponse
+from .models import SourceInfo
+from .records import OddsRecord
+from .records import RaceRecord
+from .records import RunnerRecord
+from .utils.odds import ODDS_SCALE
+from .utils.odds import Odds
+
+# Runner numbers are optional; missing ones are stored as this.
+NO_NUMBER = -1
+
+PRICES = ("win", "place", "show")
+
+
+def _encode(values: Iterable[Hashable]) -> Tuple[np.ndarray, List[Any]]:
+    """Dictionary-encodes `values`: (codes, categories) with categories[codes[i]] == values[i]."""
+    categories: Dict[Hashable, int] = {}
+    codes = [categories.setdefault(value, len(categories)) for value in values]
+    return np.asarray(codes, dtype=np.int32), list(categories)
+
+
+def _to_utc(value: datetime) -> Tuple[datetime, bool]:
+    """numpy datetimes are naive: aware values are stored in UTC and flagged."""
+    if value.tzinfo is None:
+        return value, False
+    return value.astimezone(timezone.utc).replace(tzinfo=None), True
+
+
+def _datetimes(values: Iterable[datetime]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (naive UTC datetimes, aware flags) for `values`. numpy converts datetimes
+    slowly and a day's timestamps repeat (one per fetch), so each distinct
+    value is converted once.
+    """
+    codes, distinct = _encode(values)
+    converted = [_to_utc(value) for value in distinct]
+    naive = np.array([value for value, _ in converted], dtype="datetime64[us]")
+    aware = np.array([is_aware for _, is_aware in converted], dtype=bool)
+    return naive[codes], aware[codes]
+
+
+def _from_utc(value: datetime, aware: bool) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if aware else value
+
+
+def _odds_column(prices: np.ndarray) -> List[Optional[Odds]]:
+    # Prices are units / ODDS_SCALE as float64, which round-trips any Odds below 2**53 units.
+    missing = np.isnan(prices).tolist()
+    units = np.rint(np.nan_to_num(prices) * ODDS_SCALE).astype(np.int64).tolist()
+    return [None if absent else Odds(unit) for absent, unit in zip(missing, units)]
+
+
+@dataclass(eq=False)
+class RaceStore:
+    """
+    The races of one aggregation in columnar form. Race columns have one entry
+    per race; runner columns one per runner, with race i's runners at
+    runner_offsets[i]:runner_offsets[i + 1]. Prices are float64 matrices of
+    runners x sources holding decimal odds, NaN where a source has no price;
+    odds_updated is NaT where a source has no odds entry for the runner at all.
+    Venues, race sources and runner names are dictionary-encoded:
+    venues[venue_codes[i]].
+
+    Datetimes are stored naive, aware ones converted to UTC and flagged so
+    they come back aware (in UTC). An odds entry comes back with the source it
+    is keyed by. Otherwise to_records() returns the records the store was
+    built from.
+    """
+
+    # Per race
+    race_ids: np.ndarray
+    venue_codes: np.ndarray
+    venues: List[str]
+    race_numbers: np.ndarray
+    start_times: np.ndarray
+    start_times_aware: np.ndarray
+    race_source_codes: np.ndarray
+    race_sources: List[str]
+    field_sizes: np.ndarray
+    runner_offsets: np.ndarray
+    qualification_scores: np.ndarray
+    race_names: np.ndarray
+    distances: np.ndarray
+    favorites: np.ndarray
+    # Per runner
+    runner_name_codes: np.ndarray
+    runner_names: List[str]
+    runner_numbers: np.ndarray
+    runner_ids: np.ndarray
+    scratched: np.ndarray
+    jockeys: np.ndarray
+    trainers: np.ndarray
+    # Per runner x source
+    sources: List[str]
+    win: np.ndarray
+    place: np.ndarray
+    show: np.ndarray
+    odds_updated: np.ndarray
+    odds_updated_aware: np.ndarray
+    # Passed through from the response
+    source_info: List[Dict[str, Any]] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def race_count(self) -> int:
+        return len(self.race_ids)
+
+    @property
+    def runner_count(self) -> int:
+        return len(self.runner_name_codes)
+
+    @property
+    def runner_races(self) -> np.ndarray:
+        """The race index of every runner."""
+        return np.repeat(np.arange(self.race_count), np.diff(self.runner_offsets))
+
+    @classmethod
+    def from_records(
+        cls,
+        races: Sequence[RaceRecord],
+        source_info: Optional[List[Dict[str, Any]]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "RaceStore":
+        start_times, start_times_aware = _datetimes(race.start_time for race in races)
+        runners = [runner for race in races for runner in race.runners]
+        offsets = np.zeros(len(races) + 1, dtype=np.int64)
+        np.cumsum([len(race.runners) for race in races], out=offsets[1:])
+
+        source_index: Dict[str, int] = {}
+        nan = float("nan")
+        rows, columns, updated = [], [], []
+        values: Dict[str, List[float]] = {price: [] for price in PRICES}
+        for row, runner in enumerate(runners):
+            for source, entry in runner.odds.items():
+                rows.append(row)
+                columns.append(source_index.setdefault(source, len(source_index)))
+                updated.append(entry.last_updated)
+                values["win"].append(nan if entry.win is None else entry.win / ODDS_SCALE)
+                values["place"].append(nan if entry.place is None else entry.place / ODDS_SCALE)
+                values["show"].append(nan if entry.show is None else entry.show / ODDS_SCALE)
+
+        shape = (len(runners), len(source_index))
+        prices = {price: np.full(shape, np.nan) for price in PRICES}
+        odds_updated = np.full(shape, np.datetime64("NaT"), dtype="datetime64[us]")
+        odds_updated_aware = np.zeros(shape, dtype=bool)
+        if rows:
+            for price in PRICES:
+                prices[price][rows, columns] = values[price]
+            odds_updated[rows, columns], odds_updated_aware[rows, columns] = _datetimes(updated)
+
+        venue_codes, venues = _encode(race.venue for race in races)
+        race_source_codes, race_sources = _encode(race.source for race in races)
+        runner_name_codes, runner_names = _encode(runner.name for runner in runners)
+        scratched = np.fromiter((runner.scratched for runner in runners), dtype=bool, count=len(runners))
+        active = np.concatenate(([0], np.cumsum(~scratched)))
+        return cls(
+            race_ids=np.array([race.id for race in races], dtype=str),
+            venue_codes=venue_codes,
+            venues=venues,
+            race_numbers=np.fromiter((race.race_number for race in races), dtype=np.int32, count=len(races)),
+            start_times=start_times,
+            start_times_aware=start_times_aware,
+            race_source_codes=race_source_codes,
+            race_sources=race_sources,
+            field_sizes=(active[offsets[1:]] - active[offsets[:-1]]).astype(np.int32),
+            runner_offsets=offsets,
+            qualification_scores=np.array(
+                [np.nan if race.qualification_score is None else race.qualification_score for race in races],
+                dtype=np.float64,
+            ),
+            race_names=np.array([race.race_name for race in races], dtype=object),
+            distances=np.array([race.distance for race in races], dtype=object),
+            favorites=np.array([race.favorite for race in races], dtype=object),
+            runner_name_codes=runner_name_codes,
+            runner_names=runner_names,
+            runner_numbers=np.array(
+                [NO_NUMBER if runner.number is None else runner.number for runner in runners], dtype=np.int32
+            ),
+            runner_ids=np.array([runner.id for runner in runners], dtype=object),
+            scratched=scratched,
+            jockeys=np.array([runner.jockey for runner in runners], dtype=object),
+            trainers=np.array([runner.trainer for runner in runners], dtype=object),
+            sources=list(source_index),
+            win=prices["win"],
+            place=prices["place"],
+            show=prices["show"],
+            odds_updated=odds_updated,
+            odds_updated_aware=odds_updated_aware,
+            source_info=list(source_info or []),
+            metadata=dict(metadata or {}),
+        )
+
+    @classmethod
+    def from_response(cls, response: Union[AggregatedResponse, Dict[str, Any]]) -> "RaceStore":
+        """Builds a store from an AggregatedResponse, or the response dict the engine caches."""
+        if isinstance(response, AggregatedResponse):
+            races = [RaceRecord.from_model(race) for race in response.races]
+            source_info = [info.model_dump() for info in response.source_info]
+            metadata = response.metadata
+        else:
+            races = [RaceRecord.from_dict(race) for race in response.get("races", [])]
+            source_info = response.get("source_info") or response.get("sourceInfo") or []
+            metadata = response.get("metadata", {})
+        return cls.from_records(races, source_info=source_info, metadata=metadata)
+
+    def to_records(self) -> List[RaceRecord]:
+        rows, columns = np.nonzero(~np.isnat(self.odds_updated))
+        odds_by_runner: List[Dict[str, OddsRecord]] = [{} for _ in range(self.runner_count)]
+        for row, column, updated, aware, win, place, show in zip(
+            rows.tolist(),
+            columns.tolist(),
+            self.odds_updated[rows, columns].astype(object),
+            self.odds_updated_aware[rows, columns].tolist(),
+            _odds_column(self.win[rows, columns]),
+            _odds_column(self.place[rows, columns]),
+            _odds_column(self.show[rows, columns]),
+        ):
+            source = self.sources[column]
+            odds_by_runner[row][source] = OddsRecord(source, _from_utc(updated, aware), win, place, show)
+
+        names = [self.runner_names[code] for code in self.runner_name_codes.tolist()]
+        runners = [
+            RunnerRecord(name, None if number == NO_NUMBER else number, id, scratched, odds, jockey, trainer)
+            for name, number, id, scratched, odds, jockey, trainer in zip(
+                names,
+                self.runner_numbers.tolist(),
+                self.runner_ids.tolist(),
+                self.scratched.tolist(),
+                odds_by_runner,
+                self.jockeys.tolist(),
+                self.trainers.tolist(),
+            )
+        ]
+
+        offsets = self.runner_offsets.tolist()
+        columns = zip(
+            self.race_ids.tolist(),
+            self.venue_codes.tolist(),
+            self.race_numbers.tolist(),
+            self.start_times.astype(object),
+            self.start_times_aware.tolist(),
+            offsets[:-1],
+            offsets[1:],
+            self.race_source_codes.tolist(),
+            self.qualification_scores.tolist(),
+            self.favorites.tolist(),
+            self.race_names.tolist(),
+            self.distances.tolist(),
+        )
+        races = []
+        for race_id, venue, number, start, aware, first, last, source, score, favorite, name, distance in columns:
+            races.append(
+                RaceRecord(
+                    race_id,
+                    self.venues[venue],
+                    number,
+                    _from_utc(start, aware),
+                    runners[first:last],
+                    self.race_sources[source],
+                    None if score != score else score,
+                    favorite,
+                    name,
+                    distance,
+                )
+            )
+        return races
+
+    def to_response(self) -> AggregatedResponse:
+        return AggregatedResponse.model_construct(
+            races=[race.to_model() for race in self.to_records()],
+            source_info=[SourceInfo(**info) for info in self.source_info],
+            metadata=self.metadata,
+        )
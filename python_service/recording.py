@@ -0,0 +1,191 @@
+# python_service/recording.py
+# Record/replay httpx transports, for running FortunaEngine offline and deterministically.
+#
+#   python -m python_service.recording record --date 2025-10-09 --archive runs/2025-10-09.zip
+#   python -m python_service.recording replay --date 2025-10-09 --archive runs/2025-10-09.zip --latency-scale 0
+import argparse
+import asyncio
+import hashlib
+import json
+import time
+import zipfile
+from collections import defaultdict
+from collections import deque
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import httpx
+import structlog
+
+log = structlog.get_logger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+ARCHIVE_VERSION = 1
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _interaction_key(method: str, url: str, body_digest: Optional[str]) -> Tuple[str, str, Optional[str]]:
+    return (method.upper(), url, body_digest)
+
+
+class RecordingArchive:
+    """
+    A zip archive of HTTP interactions. The manifest lists every request with its
+    response status, headers and latency; bodies are stored once each under their
+    SHA-256, so repeated payloads (unchanged racecards, empty results) cost nothing.
+    Response bodies are kept exactly as received, still content-encoded.
+    """
+
+    def __init__(self, interactions: Optional[List[Dict[str, Any]]] = None, bodies: Optional[Dict[str, bytes]] = None):
+        self.interactions = interactions or []
+        self.bodies = bodies or {}
+
+    def add(self, request: httpx.Request, status_code: int, headers: httpx.Headers, body: bytes, latency: float):
+        request_body = request.content
+        body_digest = _digest(body)
+        self.bodies.setdefault(body_digest, body)
+        self.interactions.append(
+            {
+                "method": request.method,
+                "url": str(request.url),
+                "request_digest": _digest(request_body) if request_body else None,
+                "status_code": status_code,
+                "headers": headers.multi_items(),
+                "body": body_digest,
+                "latency": round(latency, 4),
+            }
+        )
+
+    def save(self, path: str):
+        manifest = {"version": ARCHIVE_VERSION, "interactions": self.interactions}
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=1))
+            for digest, body in self.bodies.items():
+                archive.writestr(f"bodies/{digest}", body)
+
+    @classmethod
+    def load(cls, path: str) -> "RecordingArchive":
+        with zipfile.ZipFile(path) as archive:
+            manifest = json.loads(archive.read(MANIFEST_NAME))
+            if manifest.get("version") != ARCHIVE_VERSION:
+                raise ValueError(f"Unsupported recording archive version: {manifest.get('version')}")
+            bodies = {
+                name.split("/", 1)[1]: archive.read(name) for name in archive.namelist() if name.startswith("bodies/")
+            }
+        return cls(manifest["interactions"], bodies)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Passes requests through to `transport` and records every response into an archive saved on close."""
+
+    def __init__(self, path: str, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.path = path
+        self.archive = RecordingArchive()
+        self._transport = transport or httpx.AsyncHTTPTransport(http2=True)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.monotonic()
+        response = await self._transport.handle_async_request(request)
+        try:
+            # Read the transport stream directly, so the body is kept exactly as sent (still content-encoded).
+            body = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        self.archive.add(request, response.status_code, response.headers, body, time.monotonic() - started)
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=httpx.ByteStream(body),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self):
+        await self._transport.aclose()
+        self.archive.save(self.path)
+        log.info(
+            "HTTP recording saved",
+            path=self.path,
+            interactions=len(self.archive.interactions),
+            unique_bodies=len(self.archive.bodies),
+        )
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Serves responses from a RecordingArchive, after the recorded latency times
+    `latency_scale` (0 replays instantly). Repeated requests for the same URL get
+    the recorded responses in order, the last one repeating. A request that was
+    never recorded fails like an unreachable host.
+    """
+
+    def __init__(self, path: str, latency_scale: float = 1.0):
+        self.archive = RecordingArchive.load(path)
+        self.latency_scale = latency_scale
+        self._queues: Dict[Tuple[str, str, Optional[str]], Deque[Dict[str, Any]]] = defaultdict(deque)
+        for interaction in self.archive.interactions:
+            key = _interaction_key(interaction["method"], interaction["url"], interaction["request_digest"])
+            self._queues[key].append(interaction)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request_body = await request.aread()
+        key = _interaction_key(request.method, str(request.url), _digest(request_body) if request_body else None)
+        queue = self._queues.get(key)
+        if not queue:
+            raise httpx.ConnectError(f"No recorded response for {request.method} {request.url}", request=request)
+        interaction = queue.popleft() if len(queue) > 1 else queue[0]
+
+        if self.latency_scale > 0:
+            await asyncio.sleep(interaction["latency"] * self.latency_scale)
+        return httpx.Response(
+            interaction["status_code"],
+            headers=interaction["headers"],
+            stream=httpx.ByteStream(self.archive.bodies[interaction["body"]]),
+        )
+
+
+def transport_from_settings(settings) -> Optional[httpx.AsyncBaseTransport]:
+    """The transport selected by HTTP_REPLAY_PATH / HTTP_RECORD_PATH, or None for live traffic."""
+    if settings.HTTP_REPLAY_PATH:
+        return ReplayTransport(settings.HTTP_REPLAY_PATH, latency_scale=settings.HTTP_REPLAY_LATENCY_SCALE)
+    if settings.HTTP_RECORD_PATH:
+        return RecordingTransport(settings.HTTP_RECORD_PATH)
+    return None
+
+
+async def _run(date: str, transport: httpx.AsyncBaseTransport) -> Dict[str, Any]:
+    from .config import get_settings
+    from .engine import FortunaEngine
+
+    engine = FortunaEngine(config=get_settings(), transport=transport)
+    try:
+        started = time.monotonic()
+        result = await engine.aggregate_races(date)
+        return {"seconds": round(time.monotonic() - started, 3), "races": len(result["races"])}
+    finally:
+        await engine.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or replay a full FortunaEngine fetch cycle.")
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("--date", required=True, help="Race date, YYYY-MM-DD.")
+    parser.add_argument("--archive", required=True, help="Path of the recording archive (.zip).")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Replay only: multiplier for latencies.")
+    args = parser.parse_args()
+
+    if args.mode == "record":
+        transport = RecordingTransport(args.archive)
+    else:
+        transport = ReplayTransport(args.archive, latency_scale=args.latency_scale)
+    print(json.dumps(asyncio.run(_run(args.date, transport))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+# python_service/records.py
+# Compact race records used inside the service: from the adapters, through merging
+# and the caches, to the analyzers. The pydantic models in models.py describe the API.
+import sys
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+from .models import OddsData
+from .models import Race
+from .models import Runner
+from .utils.odds import Odds
+
+
+def _as_datetime(value: Any) -> datetime:
+    # Snapshots store datetimes as ISO strings; cache payloads keep them as datetimes.
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _as_odds(value: Any) -> Optional[Odds]:
+    # Models and dumps carry Decimals; JSON dumps carry them as strings.
+    if value is None or isinstance(value, Odds):
+        return value
+    return Odds.from_decimal(value)
+
+
+def _as_decimal(odds: Optional[Odds]) -> Optional[Decimal]:
+    return None if odds is None else odds.to_decimal()
+
+
+@dataclass(slots=True)
+class OddsRecord:
+    source: str
+    last_updated: datetime
+    win: Optional[Odds] = None
+    place: Optional[Odds] = None
+    show: Optional[Odds] = None
+
+    @classmethod
+    def from_model(cls, odds: OddsData) -> "OddsRecord":
+        return cls(odds.source, odds.last_updated, _as_odds(odds.win), _as_odds(odds.place), _as_odds(odds.show))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OddsRecord":
+        return cls(
+            sys.intern(data["source"]),
+            _as_datetime(data["last_updated"]),
+            _as_odds(data.get("win")),
+            _as_odds(data.get("place")),
+            _as_odds(data.get("show")),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "win": _as_decimal(self.win),
+            "place": _as_decimal(self.place),
+            "show": _as_decimal(self.show),
+            "source": self.source,
+            "last_updated": self.last_updated,
+        }
+
+    def to_model(self) -> OddsData:
+        return OddsData.model_construct(
+            win=_as_decimal(self.win),
+            place=_as_decimal(self.place),
+            show=_as_decimal(self.show),
+            source=self.source,
+            last_updated=self.last_updated,
+        )
+
+
+@dataclass(slots=True)
+class RunnerRecord:
+    name: str
+    number: Optional[int] = None
+    id: Optional[str] = None
+    scratched: bool = False
+    odds: Dict[str, OddsRecord] = field(default_factory=dict)
+    jockey: Optional[str] = None
+    trainer: Optional[str] = None
+
+    @classmethod
+    def from_model(cls, runner: Runner) -> "RunnerRecord":
+        odds = {source: OddsRecord.from_model(entry) for source, entry in runner.odds.items()}
+        return cls(runner.name, runner.number, runner.id, runner.scratched, odds, runner.jockey, runner.trainer)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RunnerRecord":
+        odds = {sys.intern(source): OddsRecord.from_dict(entry) for source, entry in (data.get("odds") or {}).items()}
+        return cls(
+            data["name"],
+            data.get("number"),
+            data.get("id"),
+            data.get("scratched", False),
+            odds,
+            data.get("jockey"),
+            data.get("trainer"),
+        )
+
+    def copy(self) -> "RunnerRecord":
+        """A copy with its own odds dict, so odds can be merged into it without touching this runner."""
+        return RunnerRecord(
+            self.name, self.number, self.id, self.scratched, dict(self.odds), self.jockey, self.trainer
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "number": self.number,
+            "scratched": self.scratched,
+            "odds": {source: entry.to_dict() for source, entry in self.odds.items()},
+            "jockey": self.jockey,
+            "trainer": self.trainer,
+        }
+
+    def to_model(self) -> Runner:
+        return Runner.model_construct(
+            id=self.id,
+            name=self.name,
+            number=self.number,
+            scratched=self.scratched,
+            odds={source: entry.to_model() for source, entry in self.odds.items()},
+            jockey=self.jockey,
+            trainer=self.trainer,
+        )
+
+
+@dataclass(slots=True)
+class RaceRecord:
+    """
+    A race as the service handles it internally. Records are built without
+    validation, so whoever builds one vouches for its types: adapters from
+    parsed data, and the caches from what was stored. Converting to a Race
+    for the API (to_model) uses model_construct and does not validate either.
+    """
+
+    id: str
+    venue: str
+    race_number: int
+    start_time: datetime
+    runners: List[RunnerRecord]
+    source: str
+    qualification_score: Optional[float] = None
+    favorite: Optional[RunnerRecord] = None
+    race_name: Optional[str] = None
+    distance: Optional[str] = None
+
+    @classmethod
+    def from_model(cls, race: Race) -> "RaceRecord":
+        return cls(
+            race.id,
+            race.venue,
+            race.race_number,
+            race.start_time,
+            [RunnerRecord.from_model(runner) for runner in race.runners],
+            race.source,
+            race.qualification_score,
+            RunnerRecord.from_model(race.favorite) if race.favorite else None,
+            race.race_name,
+            race.distance,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RaceRecord":
+        """Rebuilds a record from to_dict() or Race.model_dump() output."""
+        favorite = data.get("favorite")
+        return cls(
+            data["id"],
+            data["venue"],
+            data["race_number"],
+            _as_datetime(data["start_time"]),
+            [RunnerRecord.from_dict(runner) for runner in data["runners"]],
+            data["source"],
+            data.get("qualification_score"),
+            RunnerRecord.from_dict(favorite) if favorite else None,
+            data.get("race_name"),
+            data.get("distance"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The same dict Race.model_dump() gives for this race."""
+        return {
+            "id": self.id,
+            "venue": self.venue,
+            "race_number": self.race_number,
+            "start_time": self.start_time,
+            "runners": [runner.to_dict() for runner in self.runners],
+            "source": self.source,
+            "qualification_score": self.qualification_score,
+            "favorite": self.favorite.to_dict() if self.favorite else None,
+            "race_name": self.race_name,
+            "distance": self.distance,
+        }
+
+    def to_model(self) -> Race:
+        return Race.model_construct(
+            id=self.id,
+            venue=self.venue,
+            race_number=self.race_number,
+            start_time=self.start_time,
+            runners=[runner.to_model() for runner in self.runners],
+            source=self.source,
+            qualification_score=self.qualification_score,
+            favorite=self.favorite.to_model() if self.favorite else None,
+            race_name=self.race_name,
+            distance=self.distance,
+        )
+
+
+def as_record(race: Union[Race, RaceRecord]) -> RaceRecord:
+    """The record for a race an adapter returned, whichever form it used."""
+    return race if isinstance(race, RaceRecord) else RaceRecord.from_model(race)
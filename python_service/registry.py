@@ -0,0 +1,151 @@
+# python_service/registry.py
+# Adapter and analyzer metadata, available without importing the plugins themselves.
+import importlib
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import MutableMapping
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import structlog
+
+log = structlog.get_logger(__name__)
+
+ADAPTER = "adapter"
+ANALYZER = "analyzer"
+
+# Third-party packages can add plugins through these entry point groups.
+ENTRY_POINT_GROUPS = {ADAPTER: "fortuna.adapters", ANALYZER: "fortuna.analyzers"}
+
+
+@dataclass(frozen=True)
+class PluginSpec:
+    """
+    Describes a plugin by name and import path ("package.module:Class"). The
+    class is imported the first time it is needed. `init` selects how an adapter
+    is constructed: "config" passes the Settings as `config`, "source" passes
+    the class's SOURCE_NAME and BASE_URL, "kwargs" passes only `kwargs`.
+    """
+
+    name: str
+    target: str
+    kind: str = ADAPTER
+    init: str = "config"
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def load(self) -> type:
+        module_name, _, attribute = self.target.partition(":")
+        return getattr(importlib.import_module(module_name), attribute)
+
+    def create(self, config: Any = None) -> Any:
+        plugin_class = self.load()
+        if self.init == "source":
+            return plugin_class(source_name=plugin_class.SOURCE_NAME, base_url=plugin_class.BASE_URL, **self.kwargs)
+        if self.init == "kwargs":
+            return plugin_class(**self.kwargs)
+        return plugin_class(config=config, **self.kwargs)
+
+
+def _adapter(name: str, module: str, attribute: str, **options: Any) -> PluginSpec:
+    return PluginSpec(name=name, target=f"python_service.adapters.{module}:{attribute}", **options)
+
+
+# The built-in plugins, in the order the engine runs them.
+BUILTIN_PLUGINS: Tuple[PluginSpec, ...] = (
+    _adapter("BetfairExchange", "betfair_adapter", "BetfairAdapter", init="source"),
+    _adapter("BetfairGreyhounds", "betfair_greyhound_adapter", "BetfairGreyhoundAdapter", init="source"),
+    _adapter("Racing and Sports", "racing_and_sports_adapter", "RacingAndSportsAdapter"),
+    _adapter("Racing and Sports Greyhound", "racing_and_sports_greyhound_adapter", "RacingAndSportsGreyhoundAdapter"),
+    _adapter("AtTheRaces", "at_the_races_adapter", "AtTheRacesAdapter"),
+    _adapter("RacingPost", "racingpost_adapter", "RacingPostAdapter"),
+    _adapter("USTrotting", "harness_adapter", "HarnessAdapter"),
+    _adapter("Equibase", "equibase_adapter", "EquibaseAdapter"),
+    _adapter("SportingLife", "sporting_life_adapter", "SportingLifeAdapter"),
+    _adapter("Timeform", "timeform_adapter", "TimeformAdapter"),
+    _adapter("TheRacingAPI", "the_racing_api_adapter", "TheRacingApiAdapter"),
+    _adapter("GBGB", "gbgb_api_adapter", "GbgbApiAdapter"),
+    _adapter(
+        "BetfairDataScientist_ThoroughbredModel",
+        "betfair_datascientist_adapter",
+        "BetfairDataScientistAdapter",
+        init="kwargs",
+        kwargs={
+            "model_name": "ThoroughbredModel",
+            "url": "https://betfair-data-supplier-prod.herokuapp.com/api/widgets/kvs-ratings/datasets?id=thoroughbred-model&date=",
+        },
+    ),
+    _adapter("TVG", "tvg_adapter", "TVGAdapter"),
+    PluginSpec(name="trifecta", target="python_service.analyzer:TrifectaAnalyzer", kind=ANALYZER),
+)
+
+
+class PluginRegistry:
+    """An ordered catalogue of PluginSpecs, keyed by kind and name."""
+
+    def __init__(self, specs: Tuple[PluginSpec, ...] = ()):
+        self._specs: Dict[Tuple[str, str], PluginSpec] = {}
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: PluginSpec):
+        self._specs[(spec.kind, spec.name)] = spec
+
+    def get(self, kind: str, name: str) -> Optional[PluginSpec]:
+        return self._specs.get((kind, name))
+
+    def specs(self, kind: str) -> List[PluginSpec]:
+        return [spec for (spec_kind, _), spec in self._specs.items() if spec_kind == kind]
+
+    def load_entry_points(self):
+        """Registers plugins advertised by installed packages; built-ins keep their names."""
+        from importlib.metadata import entry_points
+
+        for kind, group in ENTRY_POINT_GROUPS.items():
+            for entry_point in entry_points(group=group):
+                if self.get(kind, entry_point.name) is None:
+                    self.register(PluginSpec(name=entry_point.name, target=entry_point.value, kind=kind))
+
+
+_registry: Optional[PluginRegistry] = None
+
+
+def get_registry() -> PluginRegistry:
+    """The process-wide registry: the built-in plugins plus any installed through entry points."""
+    global _registry
+    if _registry is None:
+        _registry = PluginRegistry(BUILTIN_PLUGINS)
+        try:
+            _registry.load_entry_points()
+        except Exception as e:
+            log.warning("plugin_entry_points_unavailable", error=str(e))
+    return _registry
+
+
+class LazyPluginMap(MutableMapping):
+    """A name -> class mapping that imports each class from its spec on first lookup."""
+
+    def __init__(self, specs: List[PluginSpec] = ()):
+        self._entries: Dict[str, Union[type, PluginSpec]] = {spec.name: spec for spec in specs}
+
+    def __getitem__(self, name: str) -> type:
+        entry = self._entries[name]
+        if isinstance(entry, PluginSpec):
+            entry = self._entries[name] = entry.load()
+        return entry
+
+    def __setitem__(self, name: str, value: Union[type, PluginSpec]):
+        self._entries[name] = value
+
+    def __delitem__(self, name: str):
+        del self._entries[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
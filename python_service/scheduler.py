@@ -0,0 +1,175 @@
+# python_service/scheduler.py
+# Post-time-aware refresh scheduling for the per-source cache.
+
+import asyncio
+import heapq
+import itertools
+import time
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import structlog
+
+from .core.rate_limit import TokenBucket
+from .core.request_scheduler import BACKGROUND
+from .core.request_scheduler import request_priority
+from .engine import USABLE_STATUSES
+from .utils.dates import as_aware
+from .utils.dates import race_day
+
+log = structlog.get_logger(__name__)
+
+# (time-to-post upper bound, refresh interval), both in seconds, most urgent first.
+REFRESH_TIERS: Tuple[Tuple[float, float], ...] = (
+    (10 * 60, 30),
+    (60 * 60, 120),
+    (3 * 60 * 60, 600),
+)
+# Interval for sources whose next race is further out, or that have no upcoming races.
+IDLE_REFRESH_SECONDS = 1800
+
+
+def refresh_interval(time_to_post: Optional[float]) -> float:
+    """How often a source should be refreshed, given the seconds until its next race."""
+    if time_to_post is None:
+        return IDLE_REFRESH_SECONDS
+    for horizon, interval in REFRESH_TIERS:
+        if time_to_post <= horizon:
+            return interval
+    return IDLE_REFRESH_SECONDS
+
+
+def seconds_to_next_post(races: Iterable[Any], now: datetime) -> Optional[float]:
+    """Seconds until the earliest race that has not gone off yet, or None if there is none."""
+    upcoming = []
+    for race in races:
+        remaining = (as_aware(race.start_time) - now).total_seconds()
+        if remaining > 0:
+            upcoming.append(remaining)
+    return min(upcoming) if upcoming else None
+
+
+class RefreshScheduler:
+    """
+    Keeps FortunaEngine's per-source cache warm, refreshing each adapter on a
+    cadence set by the time to its next race: sources with races about to jump
+    are refreshed every 30 seconds, cards that go off in hours every half hour.
+
+    Due refreshes wait in a priority queue ordered by time-to-post, and every
+    refresh spends a token from a global bucket (REFRESH_BUDGET_PER_MINUTE), so
+    when the budget is tight the most urgent sources are served first and total
+    upstream load never exceeds the budget.
+
+    Adapters are only built when first due. After every usable refresh the
+    cached all-sources response for the day is dropped, so requests see the
+    refreshed source on their next read.
+    """
+
+    def __init__(self, engine, config=None, clock: Callable[[], float] = time.time):
+        self.engine = engine
+        self.config = config or engine.config
+        self._clock = clock
+        self._sources = engine.adapter_names()
+        budget_per_minute = self.config.REFRESH_BUDGET_PER_MINUTE
+        # Allow one refresh of every source at once, so the first pass is not throttled.
+        self._bucket = TokenBucket(rate=budget_per_minute / 60.0, capacity=len(self._sources), clock=clock)
+        self._sequence = itertools.count()
+        self._schedule: List[Tuple[float, int, str]] = []  # (due_at, seq, source)
+        self._ready: List[Tuple[float, int, str]] = []  # (time_to_post, seq, source)
+        self._time_to_post: Dict[str, Optional[float]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._runner: Optional[asyncio.Task] = None
+        self._rescheduled = asyncio.Event()
+        for name in self._sources:
+            self._push(name, self._clock())
+
+    def _push(self, source_name: str, due_at: float):
+        heapq.heappush(self._schedule, (due_at, next(self._sequence), source_name))
+        self._rescheduled.set()
+
+    def _promote_due(self, now: float):
+        while self._schedule and self._schedule[0][0] <= now:
+            _, seq, name = heapq.heappop(self._schedule)
+            urgency = self._time_to_post.get(name)
+            heapq.heappush(self._ready, (urgency if urgency is not None else float("inf"), seq, name))
+
+    def dispatch_due(self) -> List[asyncio.Task]:
+        """
+        Starts a refresh for every due source the budget allows, most urgent first,
+        and returns the started tasks. Sources left over stay queued.
+        """
+        now = self._clock()
+        self._promote_due(now)
+        started = []
+        while self._ready and self._bucket.try_acquire():
+            _, _, name = heapq.heappop(self._ready)
+            task = asyncio.create_task(self._refresh(name))
+            self._inflight[name] = task
+            task.add_done_callback(lambda done, name=name: self._inflight.pop(name, None))
+            started.append(task)
+        return started
+
+    async def _refresh(self, source_name: str):
+        now = datetime.fromtimestamp(self._clock(), timezone.utc)
+        # The date requests default to, so they are served from the entries refreshed here.
+        date = race_day(self._clock()).strftime("%Y-%m-%d")
+        interval = refresh_interval(self._time_to_post.get(source_name))
+        try:
+            adapter = self.engine.get_adapter(source_name)
+            if adapter is None:
+                log.warning("Scheduled refresh skipped: adapter unavailable", source=source_name)
+                return
+            with request_priority(BACKGROUND):
+                _, payload, _ = await self.engine.refresh_source(adapter, date, ttl_seconds=2 * interval)
+            status = payload["source_info"].get("status")
+            if status in USABLE_STATUSES:
+                # A truncated card may be missing the next race, so only a complete one sets the tier.
+                if status == "SUCCESS":
+                    self._time_to_post[source_name] = seconds_to_next_post(payload["races"], now)
+                interval = refresh_interval(self._time_to_post.get(source_name))
+                await self.engine.invalidate_races(date)
+        except Exception:
+            log.error("Scheduled refresh failed", source=source_name, exc_info=True)
+        finally:
+            self._push(source_name, self._clock() + interval)
+
+    def next_wakeup(self) -> float:
+        """Seconds until the scheduler has something to do."""
+        if self._ready:
+            return max(self._bucket.wait_time(), 0.1)
+        if self._schedule:
+            return max(self._schedule[0][0] - self._clock(), 0.1)
+        return IDLE_REFRESH_SECONDS
+
+    async def run(self):
+        log.info("Refresh scheduler started", sources=len(self._sources))
+        try:
+            while True:
+                self.dispatch_due()
+                self._rescheduled.clear()
+                try:
+                    # A finished refresh may be due again sooner than anything already queued.
+                    await asyncio.wait_for(self._rescheduled.wait(), timeout=self.next_wakeup())
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in list(self._inflight.values()):
+                task.cancel()
+            log.info("Refresh scheduler stopped")
+
+    def start(self):
+        if self._runner is None:
+            self._runner = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._runner is not None:
+            self._runner.cancel()
+            await asyncio.gather(self._runner, return_exceptions=True)
+            self._runner = None
@@ -0,0 +1,77 @@
+# python_service/snapshot.py
+# On-disk snapshot of the last good aggregated race set, for warm starts.
+import gzip
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+import structlog
+
+log = structlog.get_logger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class Snapshot:
+    """The aggregated response for `date` and the per-source results it was built from."""
+
+    date: str
+    saved_at: float  # epoch seconds
+    response: Dict[str, Any]
+    sources: Dict[str, Dict[str, Any]]
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.saved_at
+
+
+class SnapshotStore:
+    """
+    Keeps a single gzipped JSON snapshot at `path`. Writes go to a temporary file
+    that replaces the previous snapshot in one rename, so a crash mid-write never
+    leaves a truncated snapshot behind. Snapshots from another format version,
+    or that cannot be read, are ignored.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def save(self, snapshot: Snapshot):
+        document = {
+            "version": SNAPSHOT_VERSION,
+            "date": snapshot.date,
+            "saved_at": snapshot.saved_at,
+            "response": snapshot.response,
+            "sources": snapshot.sources,
+        }
+        payload = gzip.compress(json.dumps(document, default=str, separators=(",", ":")).encode(), compresslevel=6)
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, self.path)
+
+    def load(self) -> Optional[Snapshot]:
+        try:
+            with open(self.path, "rb") as f:
+                document = json.loads(gzip.decompress(f.read()))
+            if document.get("version") != SNAPSHOT_VERSION:
+                log.warning("snapshot_version_mismatch", path=self.path, version=document.get("version"))
+                return None
+            return Snapshot(
+                date=document["date"],
+                saved_at=document["saved_at"],
+                response=document["response"],
+                sources=document.get("sources", {}),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            log.warning("snapshot_unreadable", path=self.path, error=str(e))
+            return None
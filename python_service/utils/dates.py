@@ -0,0 +1,19 @@
+# python_service/utils/dates.py
+# The race-day and wall-clock conventions shared by the API and the refresh scheduler.
+import time
+from datetime import date
+from datetime import datetime
+from typing import Optional
+
+
+def race_day(timestamp: Optional[float] = None) -> date:
+    """
+    The local calendar date at `timestamp` (now by default). Requests default
+    to it and the per-source cache is keyed by it, so every caller must agree.
+    """
+    return datetime.fromtimestamp(time.time() if timestamp is None else timestamp).date()
+
+
+def as_aware(value: datetime) -> datetime:
+    """`value` as an aware datetime. Naive values, as adapters report them, are local wall-clock times."""
+    return value if value.tzinfo is not None else value.astimezone()
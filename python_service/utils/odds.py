@@ -1,9 +1,115 @@
 # Centralized odds parsing utility, created by Operation: The A+ Trifecta
 from decimal import Decimal
 from decimal import InvalidOperation
+from fractions import Fraction
+from functools import lru_cache
 from typing import Optional
 from typing import Union
 
+# Odds are held as integer multiples of 1/ODDS_SCALE in decimal (European) terms.
+# ODDS_SCALE is divisible by every denominator from 1 to 16 and by 20, 25, 30, 40,
+# 50, 100 and 1000, so the fractional ladder (8/13, 4/11, 15/8, 100/30, ...) and
+# decimal prices with up to three places are held exactly.
+ODDS_SCALE = 18_018_000
+
+_SPECIAL_ODDS = {"EVS": "2.0", "EVENS": "2.0", "SP": None, "SCRATCHED": None, "SCR": None, "": None}
+
+
+class Odds(int):
+    """
+    A price as a scaled integer: Odds(units) is units / ODDS_SCALE in decimal
+    odds, so 5/2 is Odds(3.5 * ODDS_SCALE). Odds compare, sort and hash as
+    plain ints, exactly and without Decimal overhead, which is what the
+    scoring and merging hot paths need. Compare odds with odds, not with
+    bare numbers. float() gives the decimal price; to_decimal() is for API
+    output.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_decimal(cls, value: Union[Decimal, str, int, float]) -> "Odds":
+        """Decimal odds, e.g. Decimal("3.5"), "3.5" or 3.5. Prices finer than 1/ODDS_SCALE are rounded."""
+        if isinstance(value, float):
+            return cls(round(value * ODDS_SCALE))
+        if isinstance(value, int):
+            return cls(value * ODDS_SCALE)
+        if not isinstance(value, Decimal):
+            value = Decimal(value)
+        scaled = value * ODDS_SCALE
+        units = int(scaled)
+        if units != scaled:
+            units = round(Fraction(value) * ODDS_SCALE)
+        return cls(units)
+
+    @classmethod
+    def from_fraction(cls, numerator: Union[int, Fraction], denominator: Union[int, Fraction]) -> "Odds":
+        """Fractional odds, e.g. from_fraction(5, 2) for 5/2."""
+        units, remainder = divmod(numerator * ODDS_SCALE, denominator)
+        if remainder:
+            units = round(Fraction(numerator * ODDS_SCALE, denominator))
+        return cls(ODDS_SCALE + units)
+
+    @classmethod
+    def from_american(cls, value: Union[str, int, Decimal]) -> "Odds":
+        """American (moneyline) odds, e.g. "+250" or -150."""
+        line = Fraction(Decimal(value) if isinstance(value, str) else value)
+        if line >= 100:
+            profit = line / 100
+        elif line <= -100:
+            profit = 100 / -line
+        else:
+            raise ValueError(f"American odds must be at least +100 or at most -100, got {value}")
+        return cls(ODDS_SCALE + round(profit * ODDS_SCALE))
+
+    @property
+    def units(self) -> int:
+        return int(self)
+
+    def to_fraction(self) -> Fraction:
+        """The decimal price as an exact fraction."""
+        return Fraction(int(self), ODDS_SCALE)
+
+    def to_decimal(self) -> Decimal:
+        """
+        The decimal price, exact when it has a terminating decimal expansion and
+        otherwise to 28 significant digits, always with at least one decimal place.
+        """
+        return _to_decimal(self.to_fraction())
+
+    def to_fractional(self) -> str:
+        """Fractional odds in lowest terms, e.g. "5/2"; evens is "1/1"."""
+        profit = self.to_fraction() - 1
+        return f"{profit.numerator}/{profit.denominator}"
+
+    def to_american(self) -> Decimal:
+        """American odds, e.g. Decimal("250.0") for 5/2 and Decimal("-150.0") for 4/6."""
+        profit = self.to_fraction() - 1
+        if profit <= 0:
+            raise ValueError(f"Odds of {self} have no American equivalent")
+        return _to_decimal(profit * 100 if profit >= 1 else -100 / profit)
+
+    def __float__(self) -> float:
+        return int(self) / ODDS_SCALE
+
+    def __format__(self, format_spec: str) -> str:
+        return format(float(self), format_spec) if format_spec else str(self)
+
+    def __str__(self) -> str:
+        return str(self.to_decimal())
+
+    def __repr__(self) -> str:
+        return f"Odds({str(self)!r})"
+
+
+# Sources report unknown prices as placeholders such as 999; prices from here up are ignored.
+MAX_VALID_ODDS = Odds.from_decimal(999)
+
+
+def _to_decimal(value: Fraction) -> Decimal:
+    result = Decimal(value.numerator) / Decimal(value.denominator)
+    return result.quantize(Decimal("0.1")) if result.as_tuple().exponent > -1 else result
+
 
 def parse_odds_to_decimal(odds: Union[str, int, float, None]) -> Optional[Decimal]:
     """
@@ -47,3 +153,42 @@ def parse_odds_to_decimal(odds: Union[str, int, float, None]) -> Optional[Decima
         return Decimal(odds_str)
     except (ValueError, InvalidOperation):
         return None
+
+
+def parse_odds(odds: Union[str, int, float, Decimal, None]) -> Optional[Odds]:
+    """
+    Parse fractional, decimal and special cases ('EVS', 'SP', etc.) into Odds,
+    the canonical form used inside the service. Returns None for unparseable or
+    invalid values, as parse_odds_to_decimal does.
+    """
+    if odds is None:
+        return None
+    if isinstance(odds, Odds):
+        return odds
+    if isinstance(odds, (int, float, Decimal)):
+        try:
+            return Odds.from_decimal(odds)
+        except (ValueError, OverflowError):
+            return None
+    return _parse_odds_text(str(odds).strip().upper())
+
+
+@lru_cache(maxsize=4096)
+def _parse_odds_text(odds_str: str) -> Optional[Odds]:
+    # Scraped prices come from a short ladder, so nearly every string has been seen before.
+    if odds_str in _SPECIAL_ODDS:
+        special = _SPECIAL_ODDS[odds_str]
+        return Odds.from_decimal(special) if special else None
+
+    try:
+        if "/" in odds_str:
+            parts = odds_str.split("/")
+            if len(parts) != 2:
+                return None
+            numerator, denominator = (int(part) if part.isdigit() else Fraction(part) for part in parts)
+            if denominator <= 0:
+                return None
+            return Odds.from_fraction(numerator, denominator)
+        return Odds.from_decimal(Decimal(odds_str))
+    except (ValueError, OverflowError, InvalidOperation):
+        return None
@@ -0,0 +1,275 @@
+# tests/adapters/test_base_adapter.py
+import asyncio
+import httpx
+import pytest
+import respx
+
+from python_service.adapters.base import BaseAdapter
+from python_service.adapters.base import shutdown_parse_executor
+from python_service.adapters.timeform_adapter import TimeformAdapter
+from python_service.adapters.timeform_adapter import parse_race_page
+from python_service.utils.odds import Odds
+from python_service.core.errors import ErrorCategory
+from python_service.core.http_cache import ConditionalCache
+from python_service.core.fetch_context import FetchContext
+from python_service.core.fetch_context import fetch_context
+
+
+class HedgedAdapter(BaseAdapter):
+    HEDGE_ELIGIBLE = True
+
+
+@pytest.fixture
+def hedge_config():
+    return {"HEDGED_REQUESTS_ENABLED": True, "HEDGE_DEFAULT_DELAY_SECONDS": 0.05}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_hedges_slow_idempotent_requests(hedge_config):
+    """
+    SPEC: For hedge-eligible adapters, a second request should be sent once the
+    first exceeds the hedge delay, and the first successful response returned.
+    """
+    adapter = HedgedAdapter(source_name="Hedged", base_url="https://api.test/", config=hedge_config)
+    calls = []
+
+    async def _respond(request):
+        calls.append(request)
+        if len(calls) == 1:
+            await asyncio.sleep(1.0)
+            return httpx.Response(200, json={"attempt": 1})
+        return httpx.Response(200, json={"attempt": 2})
+
+    respx.get("https://api.test/meetings").mock(side_effect=_respond)
+
+    async with httpx.AsyncClient() as client:
+        response = await adapter.make_request(client, "GET", "meetings")
+
+    assert len(calls) == 2
+    assert response.json() == {"attempt": 2}
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_is_cancelled_with_its_caller(hedge_config):
+    """SPEC: A caller cancelled or timed out before the hedge delay leaves no request running."""
+    adapter = HedgedAdapter(source_name="Hedged", base_url="https://api.test/", config=hedge_config)
+    sends = []
+
+    async def _send():
+        sends.append(asyncio.current_task())
+        await asyncio.sleep(1.0)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(adapter._send_hedged(_send), timeout=0.01)
+    await asyncio.sleep(0)
+
+    assert len(sends) == 1 and sends[0].cancelled()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_does_not_hedge_ineligible_adapters(hedge_config):
+    """SPEC: Adapters that have not opted in should never send duplicate requests."""
+    adapter = BaseAdapter(source_name="Plain", base_url="https://api.test/", config=hedge_config)
+    route = respx.get("https://api.test/page").mock(return_value=httpx.Response(200, text="ok"))
+
+    async with httpx.AsyncClient() as client:
+        response = await adapter.make_request(client, "GET", "page")
+
+    assert response.text == "ok"
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_skips_requests_once_budget_is_exhausted():
+    """SPEC: make_request should not start new requests after the fetch deadline has passed."""
+    adapter = BaseAdapter(source_name="Expired", base_url="https://api.test/")
+    route = respx.get("https://api.test/page").mock(return_value=httpx.Response(200, text="ok"))
+    context = FetchContext.with_budget("Expired", 0.0001)
+    await asyncio.sleep(0.01)
+
+    async with httpx.AsyncClient() as client:
+        with fetch_context(context):
+            response = await adapter.make_request(client, "GET", "page")
+
+    assert response is None
+    assert route.call_count == 0
+    assert context.truncated
+
+
+@pytest.mark.asyncio
+async def test_gather_within_budget_returns_completed_results_in_order():
+    """SPEC: gather_within_budget keeps finished results and cancels the rest at the deadline."""
+    adapter = BaseAdapter(source_name="Gatherer")
+
+    async def _result(value, delay):
+        await asyncio.sleep(delay)
+        return value
+
+    context = FetchContext.with_budget("Gatherer", 0.1)
+    with fetch_context(context):
+        results = await adapter.gather_within_budget([_result("a", 0.01), _result("slow", 2.0), _result("b", 0.02)])
+
+    assert results == ["a", "b"]
+    assert context.truncated
+
+
+def timeform_racecard_page() -> str:
+    """Wraps the Timeform runner fixture in the racecard header the page parser expects."""
+    with open("tests/fixtures/timeform_modern_sample.html") as f:
+        rows = f.read()
+    return (
+        '<h1 class="rp-raceTimeCourseName_name">Ascot</h1>'
+        '<span class="rp-raceTimeCourseName_time">14:30</span>'
+        '<a class="rp-racecard-off-link" href="/r1">13:50</a>'
+        '<a class="rp-racecard-off-link" href="/r2">14:30</a>' + rows
+    )
+
+
+@pytest.mark.asyncio
+async def test_parse_off_loop_runs_page_parsers_in_the_process_pool():
+    """SPEC: With PARSE_WORKERS set, page parsers run in worker processes and return the same data as inline."""
+    pooled = TimeformAdapter(config={"PARSE_WORKERS": 1})
+    inline = TimeformAdapter(config={"PARSE_WORKERS": 0})
+    html = timeform_racecard_page()
+    try:
+        parsed = await pooled.parse_off_loop(parse_race_page, html, "2025-10-09")
+    finally:
+        shutdown_parse_executor()
+
+    assert parsed == await inline.parse_off_loop(parse_race_page, html, "2025-10-09")
+    race = pooled._race_from_parsed(parsed)
+    assert (race.venue, race.race_number, race.source) == ("Ascot", 2, "Timeform")
+    assert [r.name for r in race.runners] == ["Braveheart", "Speedster", "Steady Eddy"]
+    assert race.runners[0].odds["Timeform"].win == Odds.from_decimal("3.5")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_revalidates_and_replays_unchanged_bodies():
+    """
+    SPEC: A GET that returned validators is revalidated with If-None-Match /
+    If-Modified-Since; a 304 is answered from the cache and reported as unchanged.
+    """
+    adapter = BaseAdapter(source_name="Conditional", base_url="https://api.test/")
+    seen_headers = []
+
+    def _respond(request):
+        seen_headers.append(request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json={"meetings": 1}, headers={"ETag": '"v1"', "Last-Modified": "Thu, 09 Oct 2025 12:00:00 GMT"}
+        )
+
+    respx.get("https://api.test/meetings").mock(side_effect=_respond)
+    parses = []
+
+    def _parse(response):
+        parses.append(response)
+        return response.json()
+
+    async with httpx.AsyncClient() as client:
+        first = await adapter.make_request(client, "GET", "meetings")
+        first_parse = await adapter.parse_unless_unchanged(first, _parse)
+        second = await adapter.make_request(client, "GET", "meetings")
+        second_parse = await adapter.parse_unless_unchanged(second, _parse)
+
+    assert "If-None-Match" not in seen_headers[0]
+    assert seen_headers[1]["If-Modified-Since"] == "Thu, 09 Oct 2025 12:00:00 GMT"
+    assert not adapter.is_unchanged(first)
+    assert adapter.is_unchanged(second)
+    assert second.status_code == 200 and second.json() == {"meetings": 1}
+    assert second_parse is first_parse
+    assert len(parses) == 1
+    # Only the full fetch is a latency sample for the hedge delay.
+    assert len(adapter.latency_tracker.samples) == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_a_304_the_cache_cannot_replay_is_fetched_again_in_full():
+    """SPEC: If the cached body was evicted before its 304 arrived, the request is retried once without validators."""
+    adapter = BaseAdapter(source_name="Conditional", base_url="https://api.test/")
+    seen_headers = []
+
+    def _respond(request):
+        seen_headers.append(request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            adapter.conditional_cache = ConditionalCache()
+            return httpx.Response(304)
+        return httpx.Response(200, json={"meetings": 1}, headers={"ETag": '"v1"'})
+
+    respx.get("https://api.test/meetings").mock(side_effect=_respond)
+    async with httpx.AsyncClient() as client:
+        await adapter.make_request(client, "GET", "meetings")
+        response = await adapter.make_request(client, "GET", "meetings")
+
+    assert response.status_code == 200 and response.json() == {"meetings": 1}
+    assert [headers.get("If-None-Match") for headers in seen_headers] == [None, '"v1"', None]
+    assert adapter.conditional_cache.get("https://api.test/meetings") is not None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_unchanged_racecards_are_not_parsed_again():
+    """SPEC: A racecard page the server reports unchanged reuses its earlier parse."""
+    adapter = TimeformAdapter(config={"PARSE_WORKERS": 0})
+    url = "https://www.timeform.com/horse-racing/racecards/ascot/2"
+    respx.get(url).mock(
+        side_effect=lambda request: httpx.Response(304)
+        if request.headers.get("If-None-Match")
+        else httpx.Response(200, text=timeform_racecard_page(), headers={"ETag": '"card"'})
+    )
+    parses = []
+    original = adapter.parse_off_loop
+
+    async def _counting_parse(func, *args):
+        parses.append(func)
+        return await original(func, *args)
+
+    adapter.parse_off_loop = _counting_parse
+    async with httpx.AsyncClient() as client:
+        first = await adapter._parse_race_page(await adapter.fetch_page(client, url))
+        second = await adapter._parse_race_page(await adapter.fetch_page(client, url))
+
+    assert len(parses) == 1
+    assert (second.venue, second.race_number) == (first.venue, first.race_number) == ("Ascot", 2)
+
+
+def test_conditional_cache_keeps_bodies_within_its_byte_budget():
+    """SPEC: Bodies are evicted least recently used first to stay within max_bytes; oversized ones are skipped."""
+    cache = ConditionalCache(max_entries=10, max_bytes=250, sizer=lambda entry: len(entry.content))
+
+    def _page(size):
+        return httpx.Response(200, content=b"x" * size, headers={"ETag": '"v1"'})
+
+    cache.store("a", _page(100))
+    cache.store("b", _page(100))
+    cache.get("a")
+    cache.store("c", _page(100))
+    assert cache.get("a") is not None and cache.get("b") is None
+    assert cache.current_bytes == 200
+
+    cache.store("d", _page(300))
+    cache.store("a", _page(50))
+    assert cache.get("d") is None and len(cache) == 2 and cache.current_bytes == 150
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_make_request_gives_up_on_rejections_and_records_the_category():
+    """SPEC: A 4xx rejection is not retried, and the fetch context records why the request failed."""
+    adapter = BaseAdapter(source_name="Plain", base_url="https://api.test/", config={})
+    route = respx.get("https://api.test/meetings").mock(return_value=httpx.Response(401))
+    context = FetchContext(source_name="Plain")
+
+    async with httpx.AsyncClient() as client:
+        with fetch_context(context):
+            response = await adapter.make_request(client, "GET", "meetings")
+
+    assert response is None
+    assert route.call_count == 1
+    assert context.failure is ErrorCategory.CLIENT_ERROR
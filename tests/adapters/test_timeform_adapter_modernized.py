@@ -2,9 +2,9 @@
 import pytest
 from unittest.mock import MagicMock, patch
 import httpx
-from decimal import Decimal
 from python_service.adapters.timeform_adapter import TimeformAdapter
 from python_service.models import Race, Runner
+from python_service.utils.odds import Odds
 
 @pytest.fixture
 def timeform_adapter():
@@ -29,8 +29,8 @@ async def test_timeform_adapter_parses_html_correctly(timeform_adapter):
 
     braveheart = next((r for r in runners if r.name == 'Braveheart'), None)
     assert braveheart is not None
-    assert braveheart.odds['Timeform'].win == Decimal('3.5')
+    assert braveheart.odds['Timeform'].win == Odds.from_decimal('3.5')
 
     steady_eddy = next((r for r in runners if r.name == 'Steady Eddy'), None)
     assert steady_eddy is not None
-    assert steady_eddy.odds['Timeform'].win == Decimal('2.0')
\ No newline at end of file
+    assert steady_eddy.odds['Timeform'].win == Odds.from_decimal('2.0')
\ No newline at end of file
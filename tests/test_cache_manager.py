@@ -0,0 +1,274 @@
+# tests/test_cache_manager.py
+import asyncio
+
+import fakeredis
+import pytest
+
+from python_service import cache_manager as cache_module
+from python_service.cache_manager import CacheManager
+from python_service.cache_manager import SingleFlight
+from python_service.cache_manager import cache_async_result
+from python_service.core.ttl_cache import BoundedTTLCache
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    """Installs a fresh in-memory CacheManager and SingleFlight for the decorator."""
+    manager = CacheManager()
+    monkeypatch.setattr(cache_module, "cache_manager", manager)
+    monkeypatch.setattr(cache_module, "single_flight", SingleFlight())
+    return manager
+
+
+def redis_backed_manager(server) -> CacheManager:
+    manager = CacheManager()
+    manager.redis_client = fakeredis.FakeRedis(server=server)
+    manager.async_redis_client = fakeredis.FakeAsyncRedis(server=server)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_are_coalesced_into_one_call(memory_cache):
+    """SPEC: Concurrent callers missing the same key should share a single computation."""
+    calls = []
+
+    @cache_async_result(ttl_seconds=60, key_prefix="test")
+    async def fetch(date):
+        calls.append(date)
+        await asyncio.sleep(0.05)
+        return {"date": date}
+
+    results = await asyncio.gather(*[fetch("2025-10-09") for _ in range(10)])
+
+    assert len(calls) == 1
+    assert all(result == {"date": "2025-10-09"} for result in results)
+
+
+@pytest.mark.asyncio
+async def test_failed_computation_propagates_and_is_not_cached(memory_cache):
+    """SPEC: Every waiter sees the leader's exception, and the next call retries."""
+    attempts = []
+
+    @cache_async_result(ttl_seconds=60, key_prefix="test")
+    async def fetch(date):
+        attempts.append(date)
+        await asyncio.sleep(0.01)
+        if len(attempts) == 1:
+            raise RuntimeError("Upstream failure")
+        return {"date": date}
+
+    results = await asyncio.gather(*[fetch("2025-10-09") for _ in range(3)], return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    assert await fetch("2025-10-09") == {"date": "2025-10-09"}
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_computation(memory_cache):
+    """SPEC: A caller that goes away must not abort the computation other callers await."""
+
+    @cache_async_result(ttl_seconds=60, key_prefix="test")
+    async def fetch(date):
+        await asyncio.sleep(0.05)
+        return {"date": date}
+
+    leader = asyncio.create_task(fetch("2025-10-09"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(fetch("2025-10-09"))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == {"date": "2025-10-09"}
+
+
+@pytest.mark.asyncio
+async def test_redis_lock_makes_other_workers_wait_for_the_leader(monkeypatch):
+    """SPEC: With Redis, a worker that finds the key locked waits for the leader's value instead of computing."""
+    server = fakeredis.FakeServer()
+    leader_manager, follower_manager = redis_backed_manager(server), redis_backed_manager(server)
+    cache_key = leader_manager._generate_key("test:fetch", "2025-10-09")
+    token = leader_manager.acquire_lock(cache_key, 30)
+    assert follower_manager.acquire_lock(cache_key, 30) is None
+
+    monkeypatch.setattr(cache_module, "cache_manager", follower_manager)
+    monkeypatch.setattr(cache_module, "single_flight", SingleFlight())
+    calls = []
+
+    @cache_async_result(ttl_seconds=60, key_prefix="test")
+    async def fetch(date):
+        calls.append(date)
+        return {"computed_by": "follower"}
+
+    async def _leader_finishes():
+        await asyncio.sleep(0.15)
+        leader_manager.set(cache_key, {"computed_by": "leader"}, 60)
+        leader_manager.release_lock(cache_key, token)
+
+    result, _ = await asyncio.gather(fetch("2025-10-09"), _leader_finishes())
+
+    assert result == {"computed_by": "leader"}
+    assert calls == []
+    assert not leader_manager.is_locked(cache_key)
+
+
+@pytest.mark.asyncio
+async def test_stale_value_is_served_while_refreshing_in_background(memory_cache):
+    """SPEC: Within the stale window, callers get the old value at once and one background refresh replaces it."""
+    calls = []
+
+    @cache_async_result(ttl_seconds=0.05, key_prefix="test", stale_ttl_seconds=60)
+    async def fetch(date):
+        calls.append(date)
+        await asyncio.sleep(0.05)
+        return {"version": len(calls)}
+
+    assert await fetch("2025-10-09") == {"version": 1}
+    await asyncio.sleep(0.1)
+
+    stale_results = await asyncio.gather(*[fetch("2025-10-09") for _ in range(5)])
+    assert stale_results == [{"version": 1}] * 5
+
+    await asyncio.sleep(0.1)
+    assert await fetch("2025-10-09") == {"version": 2}
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_a_miss_does_not_join_a_failing_background_refresh(memory_cache):
+    """SPEC: A miss during a background refresh computes its own value, so a failed refresh never yields None."""
+    calls = []
+
+    @cache_async_result(ttl_seconds=0.05, key_prefix="test", stale_ttl_seconds=60)
+    async def fetch(date):
+        calls.append(date)
+        await asyncio.sleep(0.05)
+        if len(calls) == 2:
+            raise RuntimeError("refresh failed")
+        return {"version": len(calls)}
+
+    await fetch("2025-10-09")
+    await asyncio.sleep(0.1)
+    assert await fetch("2025-10-09") == {"version": 1}  # stale, refreshing in the background
+    await memory_cache.adelete([fetch.cache_key_for("2025-10-09")])
+
+    assert await fetch("2025-10-09") == {"version": 3}
+
+
+@pytest.mark.asyncio
+async def test_hot_key_is_refreshed_before_it_expires(memory_cache):
+    """SPEC: With early refresh enabled, a slow-to-compute value is refreshed while still fresh."""
+    calls = []
+
+    @cache_async_result(ttl_seconds=60, key_prefix="test", early_refresh_beta=1e6)
+    async def fetch(date):
+        calls.append(date)
+        await asyncio.sleep(0.01)
+        return {"version": len(calls)}
+
+    assert await fetch("2025-10-09") == {"version": 1}
+    assert await fetch("2025-10-09") == {"version": 1}
+    await asyncio.sleep(0.05)
+
+    assert len(calls) == 2
+    assert await fetch("2025-10-09") == {"version": 2}
+
+
+def test_memory_cache_evicts_least_recently_used_within_its_byte_budget():
+    """SPEC: The in-memory cache stays within its byte budget, evicting the least recently used entries first."""
+    cache = BoundedTTLCache(max_entries=100, max_bytes=300, sizer=lambda value: 100)
+    for key in ("a", "b", "c"):
+        cache.set(key, key, ttl_seconds=60)
+    cache.get("a")
+    cache.set("d", "d", ttl_seconds=60)
+
+    assert [key for key in ("a", "b", "c", "d") if key in cache] == ["a", "c", "d"]
+    assert cache.stats()["bytes"] == 300
+    assert cache.stats()["evictions"] == 1
+
+    cache.sizer = lambda value: 1000
+    cache.set("too-big", "x", ttl_seconds=60)
+    assert "too-big" not in cache
+    assert len(cache) == 3
+
+
+def test_memory_cache_expires_entries_lazily_and_in_periodic_sweeps():
+    """SPEC: Expired entries are dropped on lookup, and unread ones by the periodic sweep on a later write."""
+    now = [1000.0]
+    cache = BoundedTTLCache(sweep_interval=30, clock=lambda: now[0])
+    cache.set("read-again", 1, ttl_seconds=10)
+    cache.set("never-read", 2, ttl_seconds=10)
+    now[0] += 11
+
+    assert cache.get("read-again") is None
+    assert len(cache) == 1
+
+    now[0] += 30
+    cache.set("new", 3, ttl_seconds=10)
+    assert len(cache) == 1
+    assert cache.stats() == {
+        "entries": 1, "bytes": cache.current_bytes, "max_bytes": cache.max_bytes,
+        "hits": 0, "misses": 1, "evictions": 0, "expirations": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_batch_operations_share_entries_with_the_sync_interface():
+    """SPEC: Pipelined async writes and MGET reads see the same entries as the synchronous interface."""
+    manager = redis_backed_manager(fakeredis.FakeServer())
+    await manager.aset_entries([("a", {"n": 1}, 60, 0, 0.0), ("b", {"n": 2}, 0, 60, 0.0)])
+    manager.set("c", {"n": 3}, 60)
+
+    assert await manager.aget_many(["a", "b", "c", "missing"]) == {"a": {"n": 1}, "c": {"n": 3}}
+    assert manager.get("a") == {"n": 1}
+    assert (await manager.aget_entries(["b"]))["b"]["value"] == {"n": 2}  # stale, but still stored
+
+
+@pytest.mark.asyncio
+async def test_slow_redis_falls_back_to_the_local_tier():
+    """SPEC: A Redis call exceeding the timeout falls back to memory, and Redis is skipped while it recovers."""
+
+    class HangingRedis:
+        calls = 0
+
+        async def mget(self, keys):
+            HangingRedis.calls += 1
+            await asyncio.sleep(10)
+
+    manager = CacheManager(redis_timeout=0.05, redis_retry_seconds=60)
+    manager.async_redis_client = HangingRedis()
+    manager.memory_cache.set("a", {"value": 1, "fresh_until": float("inf"), "delta": 0.0}, 60)
+
+    started = asyncio.get_running_loop().time()
+    assert await manager.aget_many(["a", "b"]) == {"a": 1}
+    assert await manager.aget_many(["a", "b"]) == {"a": 1}
+    assert asyncio.get_running_loop().time() - started < 0.5
+    assert HangingRedis.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_rewrites_invalidate_other_workers_l1():
+    """SPEC: Hot reads are served from L1; a rewrite by one worker replaces the value in every worker's L1."""
+    server = fakeredis.FakeServer()
+    worker_a, worker_b = redis_backed_manager(server), redis_backed_manager(server)
+    worker_a.start_invalidation_listener()
+    worker_b.start_invalidation_listener()
+    try:
+        await asyncio.sleep(0.05)  # let both subscribe
+        await worker_a.aset("races", {"version": 1}, 60)
+        assert await worker_b.aget("races") == {"version": 1}
+
+        # Served from L1 without touching Redis.
+        fakeredis.FakeRedis(server=server).delete("races")
+        assert await worker_b.aget("races") == {"version": 1}
+
+        worker_a.set("races", {"version": 2}, 60)  # synchronous writers announce too
+        for _ in range(50):
+            if "races" not in worker_b.memory_cache:
+                break
+            await asyncio.sleep(0.01)
+        assert await worker_b.aget("races") == {"version": 2}
+        assert await worker_a.aget("races") == {"version": 2}
+    finally:
+        await worker_a.stop_invalidation_listener()
+        await worker_b.stop_invalidation_listener()
@@ -0,0 +1,71 @@
+# tests/test_codec.py
+from datetime import date
+from datetime import datetime
+from datetime import timezone
+from decimal import Decimal
+
+import pytest
+
+from python_service.core import codec as codec_module
+from python_service.core.codec import CacheCodec
+from python_service.core.codec import CodecError
+
+AVAILABLE_FORMATS = ["json"] + (["msgpack"] if codec_module.MSGPACK_AVAILABLE else [])
+AVAILABLE_COMPRESSIONS = (
+    ["none", "zlib"] + (["zstd"] if codec_module.ZSTD_AVAILABLE else []) + (["lz4"] if codec_module.LZ4_AVAILABLE else [])
+)
+
+VALUE = {
+    "races": [
+        {
+            "start_time": datetime(2025, 10, 9, 14, 30, tzinfo=timezone.utc),
+            "meeting_date": date(2025, 10, 9),
+            "odds": [Decimal("2.50"), Decimal("11.0")],
+            "runners": [{"number": n, "name": f"Runner {n}", "scratched": False} for n in range(12)],
+        }
+    ]
+    * 20,
+    "metadata": {"total_races": 20, "stale": None},
+}
+
+
+@pytest.mark.parametrize("format", AVAILABLE_FORMATS)
+@pytest.mark.parametrize("compression", AVAILABLE_COMPRESSIONS)
+def test_values_round_trip_with_their_types(format, compression):
+    """SPEC: Datetimes, dates and Decimals come back as themselves; large payloads are compressed."""
+    codec = CacheCodec(format=format, compression=compression, compress_threshold=256)
+    payload = codec.encode(VALUE)
+
+    assert codec.decode(payload) == VALUE
+    assert payload[0] == codec.format | codec.compression << 2
+    if compression != "none":
+        assert len(payload) < len(CacheCodec(format=format, compression="none").encode(VALUE))
+    small = codec.encode({"n": 1})
+    assert small[0] == codec.format  # below the threshold, stored uncompressed
+    assert codec.decode(small) == {"n": 1}
+
+
+def test_readers_decode_any_writer_and_legacy_json():
+    """SPEC: The header byte tells a reader how a payload was written, whatever the reader's own settings."""
+    reader = CacheCodec(format="json", compression="zlib")
+    for format in AVAILABLE_FORMATS:
+        for compression in AVAILABLE_COMPRESSIONS:
+            writer = CacheCodec(format=format, compression=compression, compress_threshold=0)
+            assert reader.decode(writer.encode(VALUE)) == VALUE
+
+    assert reader.decode('{"value": "2025-10-09", "n": [1, 2]}') == {"value": "2025-10-09", "n": [1, 2]}
+    with pytest.raises(CodecError):
+        reader.decode(bytes((0x1F,)) + b"junk")
+    with pytest.raises(CodecError):
+        reader.decode(bytes((codec_module.FORMAT_JSON | codec_module.COMPRESSION_ZLIB << 2,)) + b"not zlib")
+
+
+def test_legacy_json_starting_with_whitespace_is_not_read_as_a_header():
+    """SPEC: Untagged JSON may open with \\t, \\n or \\r, which share their byte with a compressed format's header."""
+    reader = CacheCodec(format="json", compression="zlib")
+    for prefix in (" ", "\t", "\n", "\r\n"):
+        assert reader.decode(prefix + '{"n": [1, 2]}') == {"n": [1, 2]}
+    for compression in {"zstd", "lz4"} & set(AVAILABLE_COMPRESSIONS):
+        for format in AVAILABLE_FORMATS:
+            writer = CacheCodec(format=format, compression=compression, compress_threshold=0)
+            assert reader.decode(writer.encode(VALUE)) == VALUE
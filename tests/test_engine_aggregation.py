@@ -0,0 +1,336 @@
+# tests/test_engine_aggregation.py
+import asyncio
+import time
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from python_service import cache_manager as cache_module
+from python_service import engine as engine_module
+from python_service.adapters.base import BaseAdapter
+from python_service.cache_manager import CacheManager
+from python_service.config import get_settings
+from python_service.engine import FortunaEngine
+from python_service.models import OddsData
+from python_service.models import Race
+from python_service.models import Runner
+
+
+def create_mock_race(source: str, venue: str, race_number: int, odds: str = "5.0") -> Race:
+    """Helper function to create a single-runner Race object for testing."""
+    runner = Runner(
+        number=1,
+        name="Speedy",
+        odds={source: OddsData(win=Decimal(odds), source=source, last_updated=datetime.now())},
+    )
+    return Race(
+        id=f"test_{source}_{race_number}",
+        venue=venue,
+        race_number=race_number,
+        start_time=datetime(2025, 10, 9, 14, 30),
+        runners=[runner],
+        source=source,
+    )
+
+
+class FakeAdapter:
+    """A minimal V2 adapter that returns canned races after a delay."""
+
+    def __init__(self, source_name: str, delay: float, races=None, fail: bool = False):
+        self.source_name = source_name
+        self.delay = delay
+        self.races = races or []
+        self.fail = fail
+        self.cancelled = False
+        self.calls = 0
+
+    async def fetch_races(self, date, http_client):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise RuntimeError("Simulated adapter failure")
+        return {
+            "races": self.races,
+            "source_info": {"name": self.source_name, "status": "SUCCESS", "races_fetched": len(self.races)},
+        }
+
+
+@pytest.fixture
+def source_cache(monkeypatch):
+    """Gives each test an empty in-memory per-source cache."""
+    manager = CacheManager()
+    monkeypatch.setattr(engine_module, "cache_manager", manager)
+    return manager
+
+
+@pytest.fixture
+def engine(source_cache):
+    engine = FortunaEngine(config=get_settings())
+    engine.v3_adapters = []
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_stream_races_yields_fast_sources_first(engine):
+    """
+    SPEC: stream_races should yield each adapter's result as it completes,
+    independent of the order in which the adapters are configured.
+    """
+    engine.adapters = [
+        FakeAdapter("Slow", 0.2, [create_mock_race("Slow", "Slow Park", 1)]),
+        FakeAdapter("Fast", 0.01, [create_mock_race("Fast", "Fast Park", 1)]),
+    ]
+
+    partials = [partial async for partial in engine.stream_races("2025-10-09")]
+
+    assert [p["source_info"]["name"] for p in partials] == ["Fast", "Slow"]
+    assert [p["completed"] for p in partials] == [1, 2]
+    assert all(p["total"] == 2 for p in partials)
+    assert partials[0]["races"][0].venue == "Fast Park"
+    await engine.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_races_cancels_pending_adapters_on_early_exit(engine):
+    """SPEC: Breaking out of the stream should cancel adapters that are still running."""
+    slow = FakeAdapter("Slow", 5.0)
+    engine.adapters = [FakeAdapter("Fast", 0.01), slow]
+
+    stream = engine.stream_races("2025-10-09")
+    async for _ in stream:
+        break
+    await stream.aclose()
+    await asyncio.sleep(0)
+
+    assert slow.cancelled
+    await engine.close()
+
+
+@pytest.mark.asyncio
+async def test_aggregate_races_reports_partials_and_merges(engine):
+    """
+    SPEC: aggregate_races should invoke the partial callback once per adapter,
+    report failed adapters in source_info and de-duplicate the final race set.
+    """
+    engine.adapters = [
+        FakeAdapter("SourceA", 0.01, [create_mock_race("SourceA", "Test Park", 1, "5.0")]),
+        FakeAdapter("SourceB", 0.02, [create_mock_race("SourceB", "Test Park", 1, "5.5")]),
+        FakeAdapter("Broken", 0.01, fail=True),
+    ]
+    seen = []
+
+    async def on_partial(partial):
+        seen.append(partial["source_info"]["name"])
+
+    result = await engine.aggregate_races("2025-10-09", on_partial=on_partial)
+
+    assert sorted(seen) == ["Broken", "SourceA", "SourceB"]
+    assert len(result["races"]) == 1
+    assert set(result["races"][0]["runners"][0]["odds"]) == {"SourceA", "SourceB"}
+    statuses = {info["name"]: info["status"] for info in result["source_info"]}
+    assert statuses == {"SourceA": "SUCCESS", "SourceB": "SUCCESS", "Broken": "FAILED"}
+    await engine.close()
+
+
+class BudgetedAdapter(BaseAdapter):
+    """An adapter whose racecard fetches take varying amounts of time."""
+
+    TIMEOUT_SECONDS = 0.1
+
+    def __init__(self, delays):
+        super().__init__(source_name="Budgeted")
+        self.delays = delays
+
+    async def _fetch_one(self, index, delay):
+        await asyncio.sleep(delay)
+        return create_mock_race(self.source_name, f"Park {index}", 1)
+
+    async def fetch_races(self, date, http_client):
+        races = await self.gather_within_budget(self._fetch_one(i, d) for i, d in enumerate(self.delays))
+        return {"races": races, "source_info": {"name": self.source_name, "status": "SUCCESS"}}
+
+
+@pytest.mark.asyncio
+async def test_adapter_exceeding_budget_is_cancelled_and_reported(engine):
+    """SPEC: An adapter still running after its budget and grace period should be cancelled as TIMEOUT."""
+    engine.config.ADAPTER_TIMEOUT_GRACE_SECONDS = 0.05
+    hung = FakeAdapter("Hung", 5.0)
+    hung.TIMEOUT_SECONDS = 0.05
+    engine.adapters = [hung]
+
+    result = await engine.aggregate_races("2025-10-09")
+
+    assert hung.cancelled
+    assert result["source_info"][0]["status"] == "TIMEOUT"
+    await engine.close()
+
+
+@pytest.mark.asyncio
+async def test_adapter_truncated_by_budget_reports_partial_result(engine):
+    """SPEC: Races an adapter gathered before its deadline are kept and reported as PARTIAL."""
+    engine.adapters = [BudgetedAdapter([0.01, 5.0, 0.02])]
+
+    result = await engine.aggregate_races("2025-10-09")
+
+    assert result["source_info"][0]["status"] == "PARTIAL"
+    assert sorted(r["venue"] for r in result["races"]) == ["Park 0", "Park 2"]
+    await engine.close()
+
+
+@pytest.mark.asyncio
+async def test_partial_results_are_cached_briefly_and_never_over_a_complete_card(engine, source_cache):
+    """SPEC: A PARTIAL result is cached for PARTIAL_CACHE_TTL_SECONDS at most, and never replaces a fresh SUCCESS."""
+    adapter = BudgetedAdapter([0.01, 0.02])
+    engine.adapters = [adapter]
+    await engine.refresh_source(adapter, "2025-10-09")
+
+    adapter.delays = [0.01, 5.0]
+    _, payload, _ = await engine.refresh_source(adapter, "2025-10-09")
+    _, partial_only, _ = await engine.refresh_source(adapter, "2025-10-10")
+
+    assert payload["source_info"]["status"] == partial_only["source_info"]["status"] == "PARTIAL"
+    complete = await source_cache.aget(engine._source_cache_key("Budgeted", "2025-10-09"))
+    assert complete["source_info"]["status"] == "SUCCESS" and len(complete["races"]) == 2
+    entry = await source_cache.aget_entry(engine._source_cache_key("Budgeted", "2025-10-10"))
+    assert entry["value"]["source_info"]["status"] == "PARTIAL"
+    assert entry["fresh_until"] - time.time() <= engine.config.PARTIAL_CACHE_TTL_SECONDS
+    await engine.close()
+
+
+@pytest.mark.asyncio
+async def test_source_filtered_requests_are_served_from_the_per_source_cache(engine):
+    """SPEC: Each source's result is cached per (source, date), so a filtered request reuses it."""
+    source_a = FakeAdapter("SourceA", 0.01, [create_mock_race("SourceA", "Test Park", 1)])
+    engine.adapters = [source_a]
+    await engine.aggregate_races("2025-10-09")
+
+    source_a.races = [create_mock_race("SourceA", "Changed Park", 1)]
+    result = await engine.get_races("2025-10-09", set(), source_filter="sourcea")
+
+    assert [race["venue"] for race in result["races"]] == ["Test Park"]
+    assert result["source_info"][0]["status"] == "SUCCESS"
+    await engine.close()
+
+
+@pytest.mark.asyncio
+async def test_refreshed_sources_reach_the_merged_response_once_it_is_invalidated(engine, source_cache, monkeypatch):
+    """SPEC: After a source is refreshed and the day's merged response dropped, requests see the refreshed races."""
+    monkeypatch.setattr(cache_module, "cache_manager", source_cache)
+    source_a = FakeAdapter("SourceA", 0.01, [create_mock_race("SourceA", "Test Park", 1)])
+    engine.adapters = [source_a]
+    await engine.get_races("2025-10-09", set())
+
+    source_a.races = [create_mock_race("SourceA", "Test Park", 1, odds="9.0")]
+    await engine.refresh_source(source_a, "2025-10-09")
+    assert (await engine.get_races("2025-10-09", set()))["races"][0]["runners"][0]["odds"]["SourceA"]["win"] == 5
+    await engine.invalidate_races("2025-10-09")
+    refreshed = await engine.get_races("2025-10-09", set())
+
+    assert refreshed["races"][0]["runners"][0]["odds"]["SourceA"]["win"] == 9
+    await engine.close()
+
+
+@pytest.mark.asyncio
+async def test_adapters_are_built_one_at_a_time_on_request():
+    """SPEC: Listing adapter names builds nothing; getting one adapter builds only that one."""
+    engine = FortunaEngine(config=get_settings())
+
+    assert "GBGB" in engine.adapter_names() and engine._built == {}
+    assert engine.get_adapter("GBGB").source_name == "GBGB"
+    assert list(engine._built) == ["GBGB"]
+    await engine.close()
+
+
+@pytest.mark.asyncio
+async def test_refresh_only_refetches_sources_that_failed(engine):
+    """SPEC: Failed results are not cached, so once their failure memo lapses the next aggregation re-runs only them."""
+    engine.config = engine.config.model_copy(update={"FAILURE_TTL_SECONDS": {"UNEXPECTED_ERROR": 0}})
+    healthy = FakeAdapter("Healthy", 0.01, [create_mock_race("Healthy", "Test Park", 1)])
+    flaky = FakeAdapter("Flaky", 0.01, fail=True)
+    engine.adapters = [healthy, flaky]
+    await engine.aggregate_races("2025-10-09")
+
+    healthy.fail = True
+    flaky.fail = False
+    flaky.races = [create_mock_race("Flaky", "Other Park", 2)]
+    result = await engine.aggregate_races("2025-10-09")
+
+    statuses = {info["name"]: info["status"] for info in result["source_info"]}
+    assert statuses == {"Healthy": "SUCCESS", "Flaky": "SUCCESS"}
+    assert sorted(race["venue"] for race in result["races"]) == ["Other Park", "Test Park"]
+    await engine.close()
+
+
+@pytest.mark.asyncio
+async def test_failures_are_memoized_per_category(engine):
+    """SPEC: A failed source is reported from its failure memo, without being fetched, until the memo lapses."""
+
+    class MisconfiguredAdapter(FakeAdapter):
+        async def fetch_races(self, date, http_client):
+            self.calls += 1
+            return {
+                "races": [],
+                "source_info": {
+                    "status": "FAILED",
+                    "error_message": "ConfigurationError: Token not set",
+                    "error_category": "CONFIGURATION_ERROR",
+                },
+            }
+
+    flaky = FakeAdapter("Flaky", 0.01, fail=True)
+    misconfigured = MisconfiguredAdapter("Misconfigured", 0.0)
+    engine.adapters = [flaky, misconfigured]
+    engine.config = engine.config.model_copy(
+        update={"FAILURE_TTL_SECONDS": {"UNEXPECTED_ERROR": 60, "CONFIGURATION_ERROR": 3600}}
+    )
+    first = await engine.aggregate_races("2025-10-09")
+    categories = {info["name"]: (info["status"], info["error_category"]) for info in first["source_info"]}
+    assert categories == {"Flaky": ("FAILED", "UNEXPECTED_ERROR"), "Misconfigured": ("FAILED", "CONFIGURATION_ERROR")}
+
+    flaky.fail = False
+    second = await engine.aggregate_races("2025-10-09")
+    _, payload, _ = await engine.refresh_source(misconfigured, "2025-10-09")
+
+    assert (flaky.calls, misconfigured.calls) == (1, 1)
+    retry_in = {info["name"]: info["retry_in_seconds"] for info in second["source_info"]}
+    assert 0 < retry_in["Flaky"] <= 60 and 60 < retry_in["Misconfigured"] <= 3600
+    assert payload["source_info"]["error_message"] == "ConfigurationError: Token not set"
+    await engine.close()
+
+
+@pytest.mark.asyncio
+async def test_warm_start_serves_the_snapshot_stale_while_refreshing(source_cache, monkeypatch, tmp_path):
+    """SPEC: After a restart the last snapshot is served at once, marked stale, and refreshed in the background."""
+    monkeypatch.setattr(cache_module, "cache_manager", source_cache)
+    settings = get_settings().model_copy(update={"SNAPSHOT_PATH": str(tmp_path / "snapshot.json.gz")})
+    first = FortunaEngine(config=settings)
+    first.v3_adapters = []
+    first.adapters = [FakeAdapter("SourceA", 0.01, [create_mock_race("SourceA", "Test Park", 1)])]
+    await first.get_races("2025-10-09", set())
+    await first.close()
+
+    restarted_cache = CacheManager()
+    monkeypatch.setattr(engine_module, "cache_manager", restarted_cache)
+    monkeypatch.setattr(cache_module, "cache_manager", restarted_cache)
+    restarted = FortunaEngine(config=settings)
+    restarted.v3_adapters = []
+    slow = FakeAdapter("SourceA", 0.2, [create_mock_race("SourceA", "Fresh Park", 1)])
+    restarted.adapters = [slow]
+
+    assert await restarted.warm_start()
+    started = time.monotonic()
+    result = await restarted.get_races("2025-10-09", set())
+
+    assert time.monotonic() - started < 0.1
+    assert result["metadata"]["stale"] is True
+    assert [race["venue"] for race in result["races"]] == ["Test Park"]
+    # The snapshot's per-source result is still fresh, so the refresh reuses it.
+    await asyncio.sleep(0.05)
+    refreshed = await restarted.get_races("2025-10-09", set())
+    assert "stale" not in refreshed["metadata"]
+    await restarted.close()
@@ -0,0 +1,76 @@
+# tests/test_merger.py
+from datetime import datetime
+from decimal import Decimal
+
+from python_service.merge import RaceMergeIndex
+from python_service.models import OddsData
+from python_service.models import Race
+from python_service.models import Runner
+from python_service.utils.odds import Odds
+
+
+def create_race(source: str, runners_data: list, venue: str = "Test Park", race_number: int = 1) -> Race:
+    """Helper function to create a Race object for testing."""
+    runners = []
+    for r_data in runners_data:
+        odds = {source: OddsData(win=Decimal(r_data["odds"]), source=source, last_updated=datetime.now())}
+        runners.append(Runner(number=r_data["number"], name=r_data["name"], odds=odds))
+    return Race(
+        id=f"test_{source}_{race_number}",
+        venue=venue,
+        race_number=race_number,
+        start_time=datetime(2025, 10, 9, 14, 30),
+        runners=runners,
+        source=source,
+    )
+
+
+def test_merge_index_stacks_odds_and_adds_new_runners():
+    """SPEC: Duplicate races should merge runners by number and stack odds from every source."""
+    index = RaceMergeIndex()
+    index.add_batch([create_race("SourceA", [{"number": 1, "name": "Speedy", "odds": "5.0"},
+                                             {"number": 2, "name": "Steady", "odds": "10.0"}])])
+    index.add_batch([create_race("SourceB", [{"number": 1, "name": "Speedy", "odds": "5.5"},
+                                             {"number": 3, "name": "Newcomer", "odds": "15.0"}])])
+
+    races = index.races()
+    assert len(races) == 1
+    runners = {r.number: r for r in races[0].runners}
+    assert set(runners) == {1, 2, 3}
+    assert runners[1].odds["SourceA"].win == Odds.from_decimal("5.0")
+    assert runners[1].odds["SourceB"].win == Odds.from_decimal("5.5")
+    assert set(runners[2].odds) == {"SourceA"}
+    assert set(runners[3].odds) == {"SourceB"}
+    assert races[0].source == "SourceA, SourceB"
+
+
+def test_merge_index_keeps_provenance_unique_and_inputs_untouched():
+    """SPEC: Provenance is a de-duplicated list and the adapters' race objects are never mutated."""
+    first = create_race("SourceA", [{"number": 1, "name": "Speedy", "odds": "5.0"}])
+    second = create_race("SourceB", [{"number": 1, "name": "Speedy", "odds": "5.5"}])
+    index = RaceMergeIndex()
+
+    key = index.add(first)
+    index.add(second)
+    index.add(create_race("SourceA", [{"number": 1, "name": "Speedy", "odds": "4.5"}]))
+
+    assert index.sources(key) == ["SourceA", "SourceB"]
+    assert first.source == "SourceA"
+    assert set(first.runners[0].odds) == {"SourceA"}
+    assert index.get(key).runners[0].odds["SourceA"].win == Odds.from_decimal("4.5")
+
+
+def test_merge_index_reports_touched_keys_per_batch():
+    """SPEC: add_batch returns each touched race key once, in first-seen order."""
+    index = RaceMergeIndex()
+    batch = [
+        create_race("SourceA", [{"number": 1, "name": "Solo", "odds": "3.0"}], venue="Another Place", race_number=2),
+        create_race("SourceA", [{"number": 1, "name": "Speedy", "odds": "5.0"}]),
+        create_race("SourceA", [{"number": 2, "name": "Steady", "odds": "9.0"}]),
+    ]
+
+    touched = index.add_batch(batch)
+
+    assert touched == ["ANOTHER PLACE-2025-10-09-2", "TEST PARK-2025-10-09-1"]
+    assert len(index) == 2
+    assert len(index.get("TEST PARK-2025-10-09-1").runners) == 2
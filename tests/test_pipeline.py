@@ -0,0 +1,85 @@
+# tests/test_pipeline.py
+import asyncio
+
+import pytest
+
+from python_service.core.pipeline import StagedPipeline
+
+
+@pytest.mark.asyncio
+async def test_results_keep_item_order_and_failures_are_skipped():
+    """SPEC: Every item goes through both stages; failed or empty items are dropped, the rest keep their order."""
+
+    async def _fetch(item):
+        await asyncio.sleep(0.01 * (5 - item))  # later items finish fetching first
+        if item == 1:
+            raise ValueError("fetch failed")
+        return None if item == 2 else f"page-{item}"
+
+    def _parse(page):
+        if page == "page-3":
+            raise ValueError("parse failed")
+        return page.upper()
+
+    pipeline = StagedPipeline(_fetch, _parse, fetch_workers=5, parse_workers=2, queue_size=2)
+    results = await pipeline.run(range(5))
+
+    assert results == ["PAGE-0", "PAGE-4"]
+    assert not pipeline.truncated
+
+
+@pytest.mark.asyncio
+async def test_fetching_pauses_when_parsing_falls_behind():
+    """SPEC: With a slow parse stage, raw payloads held at once never exceed the queue plus one per fetcher."""
+    held = {"now": 0, "peak": 0}
+
+    async def _fetch(item):
+        held["now"] += 1
+        held["peak"] = max(held["peak"], held["now"])
+        return item
+
+    async def _parse(item):
+        await asyncio.sleep(0.005)
+        held["now"] -= 1
+        return item
+
+    pipeline = StagedPipeline(_fetch, _parse, fetch_workers=3, parse_workers=1, queue_size=2)
+    results = await pipeline.run(range(20))
+
+    assert results == list(range(20))
+    assert pipeline.peak_queue_depth <= 2
+    # Queued payloads, one being parsed, and one waiting to be queued per fetcher.
+    assert held["peak"] <= 2 + 1 + 3
+
+
+@pytest.mark.asyncio
+async def test_timeout_returns_finished_results_and_marks_truncation():
+    """SPEC: At the timeout the workers are cancelled and whatever was parsed so far is returned."""
+
+    async def _fetch(item):
+        await asyncio.sleep(0.01 if item < 2 else 5)
+        return item
+
+    pipeline = StagedPipeline(_fetch, lambda item: item, fetch_workers=4, parse_workers=1, queue_size=4)
+    results = await asyncio.wait_for(pipeline.run(range(4), timeout=0.2), timeout=2)
+
+    assert results == [0, 1]
+    assert pipeline.truncated
+
+
+@pytest.mark.asyncio
+async def test_timeout_with_a_full_queue_returns_the_parsed_prefix():
+    """SPEC: A timeout while fetchers wait on a full queue behind a slow parser still returns, truncated."""
+
+    async def _fetch(item):
+        return item
+
+    async def _parse(item):
+        await asyncio.sleep(0.05)
+        return item
+
+    pipeline = StagedPipeline(_fetch, _parse, fetch_workers=2, parse_workers=1, queue_size=1)
+    results = await asyncio.wait_for(pipeline.run(range(50), timeout=0.2), timeout=2)
+
+    assert results == list(range(len(results))) and 0 < len(results) < 50
+    assert pipeline.truncated
@@ -0,0 +1,86 @@
+# tests/test_race_store.py
+from datetime import datetime
+from datetime import timezone
+
+import numpy as np
+
+from python_service.models import AggregatedResponse
+from python_service.race_store import NO_NUMBER
+from python_service.race_store import RaceStore
+from python_service.records import OddsRecord
+from python_service.records import RaceRecord
+from python_service.records import RunnerRecord
+from python_service.utils.odds import parse_odds
+
+FETCHED = datetime(2025, 10, 9, 12, tzinfo=timezone.utc)
+
+
+def runner(number, name, scratched=False, **prices) -> RunnerRecord:
+    odds = {
+        source: OddsRecord(source=source, last_updated=FETCHED, win=parse_odds(price))
+        for source, price in prices.items()
+    }
+    return RunnerRecord(name=name, number=number, scratched=scratched, odds=odds)
+
+
+def sample_races():
+    return [
+        RaceRecord(
+            id="ascot_1",
+            venue="Ascot",
+            race_number=1,
+            start_time=datetime(2025, 10, 9, 14, 30, tzinfo=timezone.utc),
+            runners=[
+                runner(1, "Braveheart", SourceA="5/2", SourceB="11/4"),
+                runner(2, "Steady Eddy", SourceA="EVS"),
+                runner(None, "Late Entry", scratched=True),
+            ],
+            source="SourceA",
+            race_name="Maiden Stakes",
+        ),
+        RaceRecord(
+            id="empty", venue="Ayr", race_number=2, start_time=datetime(2025, 10, 9, 15), runners=[], source="SourceB"
+        ),
+        RaceRecord(
+            id="ascot_2",
+            venue="Ascot",
+            race_number=3,
+            start_time=datetime(2025, 10, 9, 15, 5),
+            runners=[runner(1, "Braveheart", SourceB="8/13")],
+            source="SourceB",
+            qualification_score=72.5,
+        ),
+    ]
+
+
+def test_race_store_lays_races_out_as_columns():
+    """SPEC: Races, runners and runner x source prices are held as arrays, with ragged fields via offsets."""
+    store = RaceStore.from_records(sample_races())
+
+    assert store.race_ids.tolist() == ["ascot_1", "empty", "ascot_2"]
+    assert store.runner_offsets.tolist() == [0, 3, 3, 4]
+    assert store.field_sizes.tolist() == [2, 0, 1]
+    assert store.runner_races.tolist() == [0, 0, 0, 2]
+    assert [store.venues[code] for code in store.venue_codes] == ["Ascot", "Ayr", "Ascot"]
+    assert store.runner_name_codes.tolist() == [0, 1, 2, 0]
+    assert store.runner_numbers.tolist() == [1, 2, NO_NUMBER, 1]
+    assert store.sources == ["SourceA", "SourceB"]
+    np.testing.assert_array_equal(store.win, [[3.5, 3.75], [2.0, np.nan], [np.nan, np.nan], [np.nan, 21 / 13]])
+    assert np.isnan(store.qualification_scores).tolist() == [True, True, False]
+
+
+def test_race_store_round_trips_records_and_responses():
+    """SPEC: A store converts back to the exact records, and response, it was built from."""
+    races = sample_races()
+    assert RaceStore.from_records(races).to_records() == races
+
+    response = AggregatedResponse(
+        races=[race.to_model() for race in races],
+        sourceInfo=[{"name": "SourceA", "status": "SUCCESS", "racesFetched": 1, "fetchDuration": 0.2}],
+        metadata={"total_races": 3},
+    )
+    expected = response.model_dump(mode="json", by_alias=True)
+    assert RaceStore.from_response(response).to_response().model_dump(mode="json", by_alias=True) == expected
+    from_dict = RaceStore.from_response(response.model_dump())
+    assert from_dict.to_response().model_dump(mode="json", by_alias=True) == expected
+    assert RaceStore.from_records([]).to_records() == []
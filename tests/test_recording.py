@@ -0,0 +1,69 @@
+# tests/test_recording.py
+import gzip
+import zipfile
+
+import httpx
+import pytest
+
+from python_service.recording import RecordingTransport
+from python_service.recording import ReplayTransport
+
+PAGES = {
+    "/racecards": b"<html>index</html>",
+    "/race/1": b"<html>same card</html>",
+    "/race/2": b"<html>same card</html>",
+}
+
+
+def live_transport() -> httpx.MockTransport:
+    """Stands in for the live sites, gzip-encoding its bodies like a real server."""
+
+    def _handler(request):
+        body = PAGES.get(request.url.path)
+        if body is None:
+            return httpx.Response(404)
+        return httpx.Response(200, headers={"Content-Encoding": "gzip"}, content=gzip.compress(body))
+
+    return httpx.MockTransport(_handler)
+
+
+async def record(path) -> None:
+    async with httpx.AsyncClient(transport=RecordingTransport(str(path), transport=live_transport())) as client:
+        for page in PAGES:
+            response = await client.get(f"https://racing.test{page}")
+            assert response.content == PAGES[page]
+
+
+@pytest.mark.asyncio
+async def test_recorded_traffic_replays_identically(tmp_path):
+    """SPEC: Responses recorded in record mode are served back byte-for-byte in replay mode."""
+    archive_path = tmp_path / "run.zip"
+    await record(archive_path)
+
+    async with httpx.AsyncClient(transport=ReplayTransport(str(archive_path), latency_scale=0)) as client:
+        for page, body in PAGES.items():
+            response = await client.get(f"https://racing.test{page}")
+            assert response.status_code == 200
+            assert response.content == body
+
+
+@pytest.mark.asyncio
+async def test_archive_stores_each_distinct_body_once(tmp_path):
+    """SPEC: The archive is content-addressed, so identical payloads are stored a single time."""
+    archive_path = tmp_path / "run.zip"
+    await record(archive_path)
+
+    with zipfile.ZipFile(archive_path) as archive:
+        bodies = [name for name in archive.namelist() if name.startswith("bodies/")]
+    assert len(bodies) == 2
+
+
+@pytest.mark.asyncio
+async def test_unrecorded_request_fails_like_an_unreachable_host(tmp_path):
+    """SPEC: Replay mode never reaches the network; unknown requests raise a connection error."""
+    archive_path = tmp_path / "run.zip"
+    await record(archive_path)
+
+    async with httpx.AsyncClient(transport=ReplayTransport(str(archive_path), latency_scale=0)) as client:
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://racing.test/race/99")
@@ -0,0 +1,52 @@
+# tests/test_records.py
+from datetime import datetime
+from decimal import Decimal
+
+from python_service.analyzer import TrifectaAnalyzer
+from python_service.models import OddsData
+from python_service.models import Race
+from python_service.models import Runner
+from python_service.records import RaceRecord
+from python_service.records import as_record
+
+
+def create_race(odds: list) -> Race:
+    runners = [
+        Runner(
+            number=number,
+            name=f"Runner {number}",
+            odds={"SourceA": OddsData(win=Decimal(price), source="SourceA", last_updated=datetime(2025, 10, 9, 12))},
+        )
+        for number, price in enumerate(odds, start=1)
+    ]
+    return Race(
+        id="test_1",
+        venue="Test Park",
+        race_number=1,
+        start_time=datetime(2025, 10, 9, 14, 30),
+        runners=runners,
+        source="SourceA",
+        race_name="Maiden Stakes",
+    )
+
+
+def test_records_round_trip_through_dicts_and_models():
+    """SPEC: A record dumps exactly as its Race would, and is rebuilt with its types from either dump."""
+    race = create_race(["3.0", "5.5", "8.0"])
+    record = as_record(race)
+
+    assert record.to_dict() == race.model_dump()
+    assert RaceRecord.from_dict(record.to_dict()) == record
+    # JSON dumps (as in snapshots) carry datetimes and Decimals as strings.
+    assert RaceRecord.from_dict(race.model_dump(mode="json")) == record
+    assert record.to_model().model_dump(mode="json", by_alias=True) == race.model_dump(mode="json", by_alias=True)
+    assert as_record(record) is record
+
+
+def test_analyzer_scores_records_rebuilt_from_the_aggregated_response():
+    """SPEC: Races from the cached response dicts are rebuilt as records the analyzer can score."""
+    records = [RaceRecord.from_dict(create_race(["3.0", "5.5", "8.0"]).model_dump())]
+
+    result = TrifectaAnalyzer().qualify_races(records)
+
+    assert result["races"][0].qualification_score > 0
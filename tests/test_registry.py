@@ -0,0 +1,39 @@
+# tests/test_registry.py
+import subprocess
+import sys
+
+from python_service.analyzer import AnalyzerEngine
+from python_service.analyzer import TrifectaAnalyzer
+from python_service.config import get_settings
+from python_service.engine import FortunaEngine
+from python_service.registry import ADAPTER
+from python_service.registry import get_registry
+
+
+def test_manifest_names_match_the_adapters_they_build():
+    """SPEC: Every built-in adapter spec imports, builds, and reports the source name it is registered under."""
+    engine = FortunaEngine(config=get_settings())
+    built = {adapter.source_name for adapter in engine.adapters + engine.v3_adapters}
+
+    assert built == {spec.name for spec in get_registry().specs(ADAPTER)}
+
+
+def test_importing_the_engine_does_not_import_adapter_modules():
+    """SPEC: Adapter modules (and pandas) are only imported once the engine's adapters are first used."""
+    probe = (
+        "import sys\n"
+        "from python_service.engine import FortunaEngine\n"
+        "engine = FortunaEngine()\n"
+        "print(sorted(m for m in sys.modules if m.startswith('python_service.adapters.') and m.endswith('_adapter') or m == 'pandas'))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout
+
+    assert output.strip().splitlines()[-1] == "[]"
+
+
+def test_analyzers_are_resolved_on_lookup():
+    """SPEC: The analyzer engine lists registered analyzers and imports their classes when asked for one."""
+    engine = AnalyzerEngine()
+
+    assert "trifecta" in engine.analyzers
+    assert isinstance(engine.get_analyzer("trifecta"), TrifectaAnalyzer)
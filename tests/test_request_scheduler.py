@@ -0,0 +1,89 @@
+# tests/test_request_scheduler.py
+import asyncio
+import time
+
+import httpx
+import pytest
+import respx
+
+from python_service.adapters.base import BaseAdapter
+from python_service.core.request_scheduler import BACKGROUND
+from python_service.core.request_scheduler import INTERACTIVE
+from python_service.core.request_scheduler import RequestScheduler
+from python_service.core.request_scheduler import request_priority
+
+
+@pytest.mark.asyncio
+async def test_per_host_and_global_concurrency_caps_are_enforced():
+    """SPEC: No more than the per-host cap runs against one host, nor the global cap overall."""
+    scheduler = RequestScheduler(max_concurrent=3, per_host_limit=2, host_rate=1000)
+    in_flight = {"a.test": 0, "b.test": 0, "total": 0}
+    peaks = {"a.test": 0, "b.test": 0, "total": 0}
+
+    async def _request(host):
+        async with scheduler.slot(f"https://{host}/page"):
+            for key in (host, "total"):
+                in_flight[key] += 1
+                peaks[key] = max(peaks[key], in_flight[key])
+            await asyncio.sleep(0.02)
+            for key in (host, "total"):
+                in_flight[key] -= 1
+
+    await asyncio.gather(*[_request(host) for host in ["a.test", "b.test"] * 5])
+
+    assert peaks == {"a.test": 2, "b.test": 2, "total": 3}
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_overtake_queued_background_requests():
+    """SPEC: When a slot frees up, waiting interactive work is served before background refreshes."""
+    scheduler = RequestScheduler(max_concurrent=1, per_host_limit=1, host_rate=1000)
+    order = []
+    release = asyncio.Event()
+
+    async def _holder():
+        async with scheduler.slot("https://a.test/first"):
+            await release.wait()
+
+    async def _request(name, priority):
+        with request_priority(priority):
+            async with scheduler.slot("https://a.test/page"):
+                order.append(name)
+
+    holder = asyncio.create_task(_holder())
+    await asyncio.sleep(0)
+    waiters = [
+        asyncio.create_task(_request("background-1", BACKGROUND)),
+        asyncio.create_task(_request("background-2", BACKGROUND)),
+        asyncio.create_task(_request("interactive", INTERACTIVE)),
+    ]
+    await asyncio.sleep(0.01)
+    release.set()
+    await asyncio.gather(holder, *waiters)
+
+    assert order == ["interactive", "background-1", "background-2"]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_rate_limited_host_is_paused_for_retry_after():
+    """SPEC: A 429 pauses the host for its Retry-After before the retry goes out."""
+    scheduler = RequestScheduler(max_concurrent=4, per_host_limit=2, host_rate=1000)
+    adapter = BaseAdapter(source_name="Throttled", base_url="https://api.test/")
+    adapter.request_scheduler = scheduler
+    adapter.retryer = adapter.retryer.copy(wait=lambda retry_state: 0)
+    sent_at = []
+
+    def _respond(request):
+        sent_at.append(time.monotonic())
+        if len(sent_at) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.2"})
+        return httpx.Response(200, text="ok")
+
+    respx.get("https://api.test/page").mock(side_effect=_respond)
+
+    async with httpx.AsyncClient() as client:
+        response = await adapter.make_request(client, "GET", "page")
+
+    assert response.text == "ok"
+    assert sent_at[1] - sent_at[0] >= 0.2
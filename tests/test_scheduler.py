@@ -0,0 +1,174 @@
+# tests/test_scheduler.py
+import asyncio
+import time
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from types import SimpleNamespace
+
+import pytest
+
+from python_service.core.rate_limit import TokenBucket
+from python_service.scheduler import IDLE_REFRESH_SECONDS
+from python_service.scheduler import RefreshScheduler
+from python_service.scheduler import refresh_interval
+from python_service.scheduler import seconds_to_next_post
+
+NOW = datetime(2025, 10, 9, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self, start: float):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeEngine:
+    """Records refreshes and returns races posting at canned offsets from NOW."""
+
+    def __init__(self, minutes_to_post, budget_per_minute=60):
+        self.config = SimpleNamespace(REFRESH_BUDGET_PER_MINUTE=budget_per_minute)
+        self.minutes_to_post = minutes_to_post
+        self.refreshed = []
+        self.dates = []
+        self.built = []
+        self.status = "SUCCESS"
+        self.invalidated = []
+
+    def adapter_names(self):
+        return list(self.minutes_to_post)
+
+    def get_adapter(self, name):
+        self.built.append(name)
+        return SimpleNamespace(source_name=name)
+
+    async def invalidate_races(self, date):
+        self.invalidated.append(date)
+
+    async def refresh_source(self, adapter, date, ttl_seconds=None):
+        self.refreshed.append(adapter.source_name)
+        self.dates.append(date)
+        races = [
+            SimpleNamespace(start_time=NOW + timedelta(minutes=minutes))
+            for minutes in self.minutes_to_post[adapter.source_name]
+        ]
+        return adapter.source_name, {"races": races, "source_info": {"status": self.status}}, 0.1
+
+
+@pytest.fixture
+def new_york(monkeypatch):
+    """Runs the test with the process in a timezone whose date differs from UTC's in the evening."""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_refresh_interval_tightens_as_post_time_approaches():
+    """SPEC: Sources with races about to jump refresh fastest; far-off or empty cards slowest."""
+    assert refresh_interval(5 * 60) == 30
+    assert refresh_interval(45 * 60) == 120
+    assert refresh_interval(2 * 60 * 60) == 600
+    assert refresh_interval(6 * 60 * 60) == IDLE_REFRESH_SECONDS
+    assert refresh_interval(None) == IDLE_REFRESH_SECONDS
+
+
+def test_token_bucket_refills_at_its_rate():
+    clock = FakeClock(0.0)
+    bucket = TokenBucket(rate=1.0, capacity=2, clock=clock)
+
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert bucket.wait_time() == pytest.approx(1.0)
+    clock.now = 1.0
+    assert bucket.try_acquire()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_reschedules_sources_by_time_to_post():
+    """SPEC: After a refresh, each source is due again according to its next race's time-to-post."""
+    clock = FakeClock(NOW.timestamp())
+    engine = FakeEngine({"Imminent": [5, 90], "Later": [300], "Finished": [-30]})
+    scheduler = RefreshScheduler(engine, clock=clock)
+
+    await asyncio.gather(*scheduler.dispatch_due())
+
+    due = {name: due_at - clock.now for due_at, _, name in scheduler._schedule}
+    assert due == {"Imminent": 30, "Later": IDLE_REFRESH_SECONDS, "Finished": IDLE_REFRESH_SECONDS}
+
+    clock.now += 30
+    await asyncio.gather(*scheduler.dispatch_due())
+    assert engine.refreshed.count("Imminent") == 2
+    assert engine.refreshed.count("Later") == 1
+
+
+@pytest.mark.asyncio
+async def test_scheduler_spends_a_tight_budget_on_the_most_urgent_sources():
+    """SPEC: When more sources are due than the budget allows, the nearest post times are refreshed first."""
+    clock = FakeClock(NOW.timestamp())
+    engine = FakeEngine({"Far": [240], "Near": [8], "Mid": [50]}, budget_per_minute=1)
+    scheduler = RefreshScheduler(engine, clock=clock)
+    await asyncio.gather(*scheduler.dispatch_due())
+    engine.refreshed.clear()
+
+    # Everything is due again, but the budget has only refilled enough for one refresh.
+    clock.now += IDLE_REFRESH_SECONDS
+    scheduler._bucket._tokens = 0
+    scheduler._bucket._updated = clock.now - 60
+    await asyncio.gather(*scheduler.dispatch_due())
+
+    assert engine.refreshed == ["Near"]
+    assert [name for _, _, name in scheduler._ready] == ["Mid", "Far"]
+
+
+def test_naive_start_times_are_local_wall_clock_times(new_york):
+    """SPEC: Adapters report naive start times in local time, so time-to-post is measured from local time."""
+    # 12:00 UTC is 08:00 in New York.
+    races = [SimpleNamespace(start_time=datetime(2025, 10, 9, 8, 5)), SimpleNamespace(start_time=NOW)]
+    assert seconds_to_next_post(races, NOW) == 5 * 60
+
+
+@pytest.mark.asyncio
+async def test_scheduler_refreshes_the_local_race_day(new_york):
+    """SPEC: Refreshes warm the cache entries for the local date, the one requests default to."""
+    # 02:00 UTC on the 10th is still the evening of the 9th in New York.
+    clock = FakeClock(datetime(2025, 10, 10, 2, 0, tzinfo=timezone.utc).timestamp())
+    engine = FakeEngine({"Evening": [30]})
+    scheduler = RefreshScheduler(engine, clock=clock)
+
+    await asyncio.gather(*scheduler.dispatch_due())
+
+    assert engine.dates == ["2025-10-09"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_builds_adapters_when_due_and_drops_the_stale_aggregate():
+    """SPEC: Adapters are built on their first refresh, and each usable refresh drops that day's merged response."""
+    clock = FakeClock(NOW.timestamp())
+    engine = FakeEngine({"Near": [8], "Far": [240]})
+    scheduler = RefreshScheduler(engine, clock=clock)
+    assert engine.built == []
+
+    await asyncio.gather(*scheduler.dispatch_due())
+
+    assert sorted(engine.built) == ["Far", "Near"]
+    assert engine.invalidated == ["2025-10-09", "2025-10-09"]
+
+
+@pytest.mark.asyncio
+async def test_truncated_refreshes_do_not_move_a_source_to_another_tier():
+    """SPEC: A PARTIAL card may be missing the next race, so only a complete one sets the refresh tier."""
+    clock = FakeClock(NOW.timestamp())
+    engine = FakeEngine({"Imminent": [5]})
+    scheduler = RefreshScheduler(engine, clock=clock)
+    await asyncio.gather(*scheduler.dispatch_due())
+
+    engine.status = "PARTIAL"
+    engine.minutes_to_post["Imminent"] = [300]
+    clock.now += 30
+    await asyncio.gather(*scheduler.dispatch_due())
+
+    assert [due_at - clock.now for due_at, _, _ in scheduler._schedule] == [30]
@@ -0,0 +1,123 @@
+# tests/test_scorer.py
+import random
+from datetime import datetime
+
+from python_service.analyzer import AnalyzerEngine
+from python_service.analyzer import TrifectaAnalyzer
+from python_service.race_store import RaceStore
+from python_service.records import OddsRecord
+from python_service.records import RaceRecord
+from python_service.records import RunnerRecord
+from python_service.utils.odds import parse_odds
+
+FETCHED = datetime(2025, 10, 9, 12)
+LADDER = ["1/5", "4/6", "EVS", "6/4", "2/1", "5/2", "3/1", "7/2", "4/1", "5/1", "8/1", "14/1", "33/1", "999", "1000"]
+
+
+def random_races(count: int, seed: int = 11):
+    """Races covering the scoring edge cases: scratchings, placeholder and missing prices, ties, tiny fields."""
+    rng = random.Random(seed)
+    races = []
+    for index in range(count):
+        runners = []
+        for number in range(1, rng.randint(0, 14) + 1):
+            odds = {}
+            for source in rng.sample(["SourceA", "SourceB", "SourceC"], rng.randint(0, 3)):
+                win = parse_odds(rng.choice(LADDER)) if rng.random() > 0.1 else None
+                odds[source] = OddsRecord(source=source, last_updated=FETCHED, win=win)
+            runners.append(
+                RunnerRecord(name=f"Runner {number}", number=number, scratched=rng.random() < 0.15, odds=odds)
+            )
+        races.append(
+            RaceRecord(
+                id=f"race_{index}",
+                venue="Test Park",
+                race_number=index,
+                start_time=FETCHED,
+                runners=runners,
+                source="SourceA",
+            )
+        )
+    return races
+
+
+def test_score_store_matches_evaluate_race():
+    """SPEC: The vectorized scores are identical to scoring race by race, for any analyzer settings."""
+    races = random_races(500)
+    store = RaceStore.from_records(races)
+    for settings in ({}, {"max_field_size": 8, "min_favorite_odds": 1.5, "min_second_favorite_odds": 2.0}):
+        analyzer = TrifectaAnalyzer(**settings)
+        expected = [analyzer._evaluate_race(race) for race in races]
+        assert analyzer.score_store(store) == expected
+        assert any(score > 0 for score in expected) and expected.count(0.0) < len(expected)
+
+
+def test_qualify_store_ranks_like_qualify_races():
+    """SPEC: Qualifying a store returns the same criteria and ranked races as qualifying its records."""
+    analyzer = TrifectaAnalyzer()
+    races = random_races(60, seed=3)
+    store = RaceStore.from_records(races)
+
+    by_store = analyzer.qualify_store(store)
+    by_records = analyzer.qualify_races(random_races(60, seed=3))
+
+    assert by_store["criteria"] == by_records["criteria"]
+    assert by_store["races"] == by_records["races"]
+    assert sorted(store.qualification_scores.tolist(), reverse=True) == [
+        race.qualification_score for race in by_records["races"]
+    ]
+
+
+def test_analyzer_engine_rescores_only_races_whose_content_moved():
+    """SPEC: Between cycles only races with moved runners, scratchings or best odds are scored again."""
+    engine = AnalyzerEngine()
+    analyzer = TrifectaAnalyzer()
+    uncached = [race.qualification_score for race in analyzer.qualify_races(random_races(40))["races"]]
+    # Races with the same content, such as empty fields, share one score.
+    distinct = len({analyzer.fingerprint(race) for race in random_races(40)})
+
+    first = engine.get_analyzer("trifecta").qualify_races(random_races(40))
+    assert first["rescored"] == distinct
+    assert [race.qualification_score for race in first["races"]] == uncached
+    assert engine.get_analyzer("trifecta").qualify_races(random_races(40))["rescored"] == 0
+
+    # Move every price in one race: only it is rescored.
+    races = random_races(40)
+    moved = next(race for race in races if sum(not runner.scratched for runner in race.runners) >= 5)
+    for runner in moved.runners:
+        for odds in runner.odds.values():
+            odds.win = parse_odds("7/2")
+    result = engine.get_analyzer("trifecta").qualify_races(races)
+    assert result["rescored"] == 1
+    rescored_race = next(race for race in result["races"] if race.id == moved.id)
+    assert rescored_race.qualification_score == analyzer._evaluate_race(moved)
+
+    # Different criteria are cached separately.
+    assert engine.get_analyzer("trifecta", max_field_size=8).qualify_races(random_races(40))["rescored"] > 0
+
+
+def test_changes_are_reported_against_the_revision_each_client_last_saw():
+    """SPEC: changed lists the races scored differently since the caller's `since` revision, whoever else polled."""
+    engine = AnalyzerEngine()
+
+    def qualify(races, since=None, scope="2025-10-09"):
+        return engine.get_analyzer("trifecta").qualify_races(races, since=since, scope=scope)
+
+    first = qualify(random_races(40))
+    assert len(first["changed"]) == 40
+    unchanged = qualify(random_races(40), since=first["revision"])
+    assert unchanged["changed"] == [] and unchanged["revision"] == first["revision"]
+
+    races = random_races(40)
+    moved = next(race for race in races if sum(not runner.scratched for runner in race.runners) >= 5)
+    for runner in moved.runners:
+        for odds in runner.odds.values():
+            odds.win = parse_odds("7/2")
+    # Another client polls the moved card in between: the first client still sees the change.
+    other = qualify(races)
+    assert qualify(races, since=first["revision"])["changed"] == [moved.id]
+    assert qualify(races, since=other["revision"])["changed"] == []
+
+    # A revision from another date, or an unknown one, is no baseline.
+    assert len(qualify(random_races(40), since=first["revision"], scope="2025-10-10")["changed"]) == 40
+    assert len(qualify(random_races(40), since="unknown")["changed"]) == 40
@@ -0,0 +1,49 @@
+# tests/test_snapshot.py
+import gzip
+import json
+import os
+import time
+
+import pytest
+
+from python_service.config import get_settings
+from python_service.engine import FortunaEngine
+from python_service.snapshot import SNAPSHOT_VERSION
+from python_service.snapshot import Snapshot
+from python_service.snapshot import SnapshotStore
+
+
+def test_snapshot_round_trips_and_replaces_the_previous_file(tmp_path):
+    """SPEC: A saved snapshot loads back unchanged, replacing the last one without leaving temporary files."""
+    store = SnapshotStore(str(tmp_path / "snapshot.json.gz"))
+    store.save(Snapshot(date="2025-10-08", saved_at=time.time(), response={"races": []}, sources={}))
+    response = {"races": [{"id": "r1", "startTime": "2025-10-09T14:30:00"}], "metadata": {"sources_successful": 1}}
+    sources = {"GBGB": {"value": {"races": []}, "fresh_until": 123.0}}
+    store.save(Snapshot(date="2025-10-09", saved_at=time.time(), response=response, sources=sources))
+
+    loaded = store.load()
+
+    assert (loaded.date, loaded.response, loaded.sources) == ("2025-10-09", response, sources)
+    assert os.listdir(tmp_path) == ["snapshot.json.gz"]
+
+
+def test_unreadable_or_foreign_snapshots_are_ignored(tmp_path):
+    """SPEC: Missing, corrupt or other-version snapshots load as None rather than failing start-up."""
+    path = tmp_path / "snapshot.json.gz"
+    store = SnapshotStore(str(path))
+    assert store.load() is None
+
+    path.write_bytes(b"not gzip")
+    assert store.load() is None
+
+    path.write_bytes(gzip.compress(json.dumps({"version": SNAPSHOT_VERSION + 1, "date": "2025-10-09"}).encode()))
+    assert store.load() is None
+
+
+@pytest.mark.asyncio
+async def test_snapshots_are_opt_in():
+    """SPEC: Without SNAPSHOT_PATH the engine writes no snapshot, wherever the process happens to run."""
+    engine = FortunaEngine(config=get_settings())
+    assert get_settings().SNAPSHOT_PATH is None
+    assert engine.snapshot_store is None
+    await engine.close()
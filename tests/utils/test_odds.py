@@ -1,7 +1,7 @@
 # tests/utils/test_odds.py
 import pytest
 from decimal import Decimal
-from python_service.utils.odds import parse_odds_to_decimal
+from python_service.utils.odds import MAX_VALID_ODDS, Odds, parse_odds, parse_odds_to_decimal
 
 @pytest.mark.parametrize("input_odds, expected_decimal", [
     ("5/2", Decimal("3.5")),      # 2.5 + 1 stake
@@ -21,3 +21,33 @@ from python_service.utils.odds import parse_odds_to_decimal
 def test_parse_odds_to_decimal(input_odds, expected_decimal):
     """Tests the new centralized odds parsing utility with various formats."""
     assert parse_odds_to_decimal(input_odds) == expected_decimal
+
+
+@pytest.mark.parametrize("input_odds, decimal, fractional, american", [
+    ("5/2", Decimal("3.5"), "5/2", Decimal("250.0")),
+    ("EVS", Decimal("2.0"), "1/1", Decimal("100.0")),
+    ("4/6", Decimal("1.666666666666666666666666667"), "2/3", Decimal("-150.0")),
+    ("8/13", Decimal("1.615384615384615384615384615"), "8/13", Decimal("-162.5")),
+    ("100/30", Decimal("4.333333333333333333333333333"), "10/3", Decimal("333.3333333333333333333333333")),
+    ("1.91", Decimal("1.91"), "91/100", Decimal("-109.8901098901098901098901099")),
+    (Decimal("11.0"), Decimal("11.0"), "10/1", Decimal("1000.0")),
+])
+def test_parse_odds_converts_between_formats(input_odds, decimal, fractional, american):
+    """Odds hold ladder prices exactly, so every format converts back without drift."""
+    odds = parse_odds(input_odds)
+    assert odds.to_decimal() == decimal
+    assert odds.to_fractional() == fractional
+    assert odds.to_american() == american
+    assert Odds.from_american(american) == odds
+    assert parse_odds(odds.to_fractional()) == odds
+
+
+def test_odds_compare_exactly_across_formats():
+    """Equal prices are equal however they were quoted, and sort by price."""
+    assert parse_odds("4/6") == Odds.from_american(-150) == Odds.from_fraction(2, 3)
+    assert parse_odds("3/1") == parse_odds("4.0") == parse_odds(4) == parse_odds(4.0)
+    assert sorted([parse_odds("3/1"), parse_odds("EVS"), parse_odds("8/13")]) == [
+        parse_odds("8/13"), parse_odds("EVS"), parse_odds("3/1"),
+    ]
+    assert float(parse_odds("5/2")) == 3.5
+    assert parse_odds("1000") >= MAX_VALID_ODDS > parse_odds("500/1")